@@ -1,13 +1,15 @@
 """
 Minimal FastAPI backend - Single CRUD resource
 """
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, Integer, String, Boolean
+from sqlalchemy import create_engine, func, literal, Column, Integer, String, Boolean, DateTime
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from pydantic import BaseModel
 from typing import List
+import hashlib
 import os
 
 # Database setup
@@ -24,6 +26,7 @@ class Item(Base):
     name = Column(String, nullable=False)
     description = Column(String)
     completed = Column(Boolean, default=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 # Create tables
 Base.metadata.create_all(bind=engine)
@@ -63,14 +66,34 @@ def get_db():
     finally:
         db.close()
 
+# Conditional GET: weak ETags from row versions, 304 if the client's copy is current
+CACHE_CONTROL = "private, no-cache"
+
+def not_modified(request: Request, response: Response, *version) -> None:
+    etag = f'W/"{hashlib.blake2b(repr(version).encode(), digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    response.headers.update(headers)
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag.removeprefix("W/") in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    ):
+        raise HTTPException(status_code=304, headers=headers)
+
 # Routes
 @app.get("/")
 def root():
     return {"message": "Minimal API", "version": "0.1.0"}
 
 @app.get("/items", response_model=List[ItemResponse])
-def list_items(db: Session = Depends(get_db)):
-    """List all items."""
+def list_items(request: Request, response: Response, db: Session = Depends(get_db)):
+    """List all items (304 without loading them if nothing changed)."""
+    # Digest of every (id, updated_at): max(updated_at) alone can miss an update
+    # committed late by a transaction that started earlier (now() is its start)
+    row_versions = func.string_agg(
+        func.concat(Item.id, ":", Item.updated_at), aggregate_order_by(literal(","), Item.id)
+    )
+    count, digest = db.query(func.count(Item.id), func.md5(row_versions)).one()
+    not_modified(request, response, count, digest)
     return db.query(Item).all()
 
 @app.post("/items", response_model=ItemResponse, status_code=201)
@@ -83,11 +106,12 @@ def create_item(item: ItemCreate, db: Session = Depends(get_db)):
     return db_item
 
 @app.get("/items/{item_id}", response_model=ItemResponse)
-def get_item(item_id: int, db: Session = Depends(get_db)):
+def get_item(item_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get a single item."""
     item = db.query(Item).filter(Item.id == item_id).first()
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
+    not_modified(request, response, item.id, item.updated_at)
     return item
 
 @app.patch("/items/{item_id}", response_model=ItemResponse)
@@ -0,0 +1,37 @@
+"""Add composite index for filtered task listing
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_tasks_user_completed_priority_due"
+
+
+def upgrade() -> None:
+    """Index (user_id, completed, priority, due_date) without blocking writes."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX,
+            "tasks",
+            ["user_id", "completed", "priority", "due_date"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(INDEX, table_name="tasks", postgresql_concurrently=True, if_exists=True)
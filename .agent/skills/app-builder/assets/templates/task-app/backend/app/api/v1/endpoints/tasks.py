@@ -5,38 +5,66 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.api.deps import get_db
+from app.api.caching import ConditionalGet, conditional_get
+from app.api.deps import get_db, get_include
 from app.schemas.task import (
-    TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
+    TaskCreate, TaskUpdate, TaskResponse, TaskExpandedResponse, TaskExpandedListResponse
 )
-from app.models.task import Task
+from app.repositories.base import InvalidCursor, InvalidInclude
 from app.repositories.task import task_repo
 
 router = APIRouter()
 
 
-@router.get("/tasks", response_model=TaskListResponse)
+@router.get("/tasks", response_model=TaskExpandedListResponse)
 def list_tasks(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    user_id: Optional[int] = None,
     completed: Optional[bool] = None,
     priority: Optional[str] = None,
+    include: list[str] = Depends(get_include),
     db: Session = Depends(get_db),
+    not_modified: ConditionalGet = Depends(conditional_get()),
 ):
-    """List tasks with filtering."""
-    query = db.query(Task)
+    """
+    List tasks with filtering.
     
-    if completed is not None:
-        query = query.filter(Task.completed == completed)
-    if priority:
-        query = query.filter(Task.priority == priority)
-    
-    tasks = query.offset(skip).limit(limit).all()
-    total = query.count()
+    Rows and total come back in one query. Pass ``next_cursor`` back as
+    ``cursor`` to page by keyset (fast at any depth); ``skip`` still works
+    for the first pages. ``total_capped`` means there are at least
+    ``total`` matching tasks. ``include=user`` embeds each task's user
+    (joined into the same query). Answers ``If-None-Match`` with 304 when
+    no task on the page (or embedded user) has changed.
+    """
+    try:
+        tasks, total, next_cursor = task_repo.list_filtered(
+            db,
+            user_id=user_id,
+            completed=completed,
+            priority=priority or None,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include=include,
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    except InvalidInclude as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     
+    users = [task.user for task in tasks] if "user" in include else []
+    not_modified(tasks, users, total, next_cursor, include)
     return {
         "data": tasks,
-        "meta": {"skip": skip, "limit": limit, "total": total}
+        "meta": {
+            "skip": skip,
+            "limit": limit,
+            "total": total,
+            "total_capped": task_repo.is_capped(total),
+            "next_cursor": next_cursor,
+        },
     }
 
 
@@ -50,15 +78,21 @@ def create_task(
     return {"data": task}
 
 
-@router.get("/tasks/{task_id}", response_model=TaskResponse)
+@router.get("/tasks/{task_id}", response_model=TaskExpandedResponse)
 def get_task(
     task_id: int,
+    include: list[str] = Depends(get_include),
     db: Session = Depends(get_db),
+    not_modified: ConditionalGet = Depends(conditional_get()),
 ):
-    """Get a specific task."""
-    task = task_repo.get(db, id=task_id)
+    """Get a specific task (``include=user`` embeds its user); supports If-None-Match."""
+    try:
+        task = task_repo.get(db, id=task_id, include=include)
+    except InvalidInclude as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    not_modified(task, task.user if "user" in include else None, include)
     return {"data": task}
 
 
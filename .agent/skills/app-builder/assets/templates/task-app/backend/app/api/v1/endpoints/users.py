@@ -0,0 +1,61 @@
+"""
+User API endpoints.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.api.caching import ConditionalGet, conditional_get
+from app.api.deps import get_db, get_include
+from app.schemas.task import UserExpandedResponse, UserExpandedListResponse
+from app.repositories.base import InvalidCursor, InvalidInclude
+from app.repositories.user import user_repo
+
+router = APIRouter()
+
+
+@router.get("/users", response_model=UserExpandedListResponse)
+def list_users(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include: list[str] = Depends(get_include),
+    db: Session = Depends(get_db),
+    not_modified: ConditionalGet = Depends(conditional_get()),
+):
+    """
+    List users.
+
+    ``include=tasks`` embeds each user's tasks, loaded for the whole page
+    with one extra ``IN`` query.
+    """
+    try:
+        users, next_cursor = user_repo.get_page(db, cursor=cursor, limit=limit, include=include)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    except InvalidInclude as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    tasks = [task for user in users for task in user.tasks] if "tasks" in include else []
+    not_modified(users, tasks, next_cursor, include)
+    return {
+        "data": users,
+        "meta": {"limit": limit, "next_cursor": next_cursor},
+    }
+
+
+@router.get("/users/{user_id}", response_model=UserExpandedResponse)
+def get_user(
+    user_id: int,
+    include: list[str] = Depends(get_include),
+    db: Session = Depends(get_db),
+    not_modified: ConditionalGet = Depends(conditional_get()),
+):
+    """Get a specific user (``include=tasks`` embeds their tasks); supports If-None-Match."""
+    try:
+        user = user_repo.get(db, id=user_id, include=include)
+    except InvalidInclude as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    not_modified(user, list(user.tasks) if "tasks" in include else [], include)
+    return {"data": user}
@@ -2,7 +2,7 @@
 Task model.
 """
 from datetime import datetime
-from sqlalchemy import String, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import String, Boolean, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -12,6 +12,11 @@ class Task(Base, TimestampMixin):
     """Task database model."""
     
     __tablename__ = "tasks"
+    __table_args__ = (
+        # list_tasks filters: equality on user_id, completed and priority,
+        # then due_date ranges
+        Index("ix_tasks_user_completed_priority_due", "user_id", "completed", "priority", "due_date"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -0,0 +1,90 @@
+"""
+Task repository.
+"""
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.task import Task
+from app.repositories.base import BaseRepository, COUNT_CAPPED, COUNT_EXACT
+from app.schemas.task import TaskCreate, TaskUpdate
+
+
+class TaskRepository(BaseRepository[Task, TaskCreate, TaskUpdate]):
+    """Task data access."""
+
+    order_by = ("id",)
+    includes = {"user": joinedload(Task.user)}
+    # Totals for filtered lists stop at count_cap; show them as "10,000+"
+    count_strategy = COUNT_CAPPED
+
+    def list_filtered(
+        self,
+        db: Session,
+        *,
+        user_id: Optional[int] = None,
+        completed: Optional[bool] = None,
+        priority: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_strategy: Optional[str] = None,
+        include: Iterable[str] = (),
+    ) -> tuple[List[Task], int, Optional[str]]:
+        """Get one page of matching tasks, the total and the next cursor.
+
+        The total rides along as an uncorrelated scalar subquery, so page
+        and count arrive in one round trip and the count is computed once.
+        Unlike ``count(*) OVER ()`` it ignores ``cursor`` and is still the
+        total of matching rows on keyset pages. Only a page past the end
+        (no rows to carry the total) costs a second query.
+
+        ``count_strategy`` is COUNT_EXACT or COUNT_CAPPED (default
+        ``count_strategy``; capped totals stop at ``count_cap``). With
+        ``cursor`` rows are fetched by keyset and ``skip`` is ignored.
+        ``include`` names relationships to eager load (see ``includes``).
+        """
+        strategy = count_strategy or self.count_strategy
+        if strategy not in (COUNT_EXACT, COUNT_CAPPED):
+            raise ValueError(f"list_filtered() supports {COUNT_EXACT!r} and {COUNT_CAPPED!r} totals, not {strategy!r}")
+
+        filters = self._filters(user_id=user_id, completed=completed, priority=priority)
+        total = self._total(filters, strategy)
+
+        stmt = (
+            select(Task, total.label("total"))
+            .options(*self.load_options(include))
+            .where(*filters)
+            .order_by(*self._order_clauses())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            stmt = stmt.where(self._after(cursor))
+        elif skip:
+            stmt = stmt.offset(skip)
+        rows = db.execute(stmt).all()
+
+        if not rows:
+            return [], db.execute(select(total)).scalar() or 0, None
+        items = [row.Task for row in rows[:limit]]
+        next_cursor = self.cursor_for(items[-1]) if len(rows) > limit else None
+        return items, rows[0].total, next_cursor
+
+    def is_capped(self, total: int, count_strategy: Optional[str] = None) -> bool:
+        """Whether ``total`` from list_filtered() may be larger in reality."""
+        return (count_strategy or self.count_strategy) == COUNT_CAPPED and total >= self.count_cap
+
+    @staticmethod
+    def _filters(**values: Any) -> list:
+        return [getattr(Task, name) == value for name, value in values.items() if value is not None]
+
+    def _total(self, filters: list, strategy: str):
+        # correlate(None): these read tasks independently of the outer query
+        if strategy == COUNT_CAPPED:
+            matching = select(Task.id).where(*filters).limit(self.count_cap).correlate(None).subquery()
+            return select(func.count()).select_from(matching).correlate(None).scalar_subquery()
+        return select(func.count()).select_from(Task).where(*filters).correlate(None).scalar_subquery()
+
+
+task_repo = TaskRepository(Task)
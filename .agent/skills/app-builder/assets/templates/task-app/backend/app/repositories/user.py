@@ -0,0 +1,17 @@
+"""
+User repository.
+"""
+from sqlalchemy.orm import selectinload
+
+from app.models.task import User
+from app.repositories.base import BaseRepository
+from app.schemas.task import UserCreate
+
+
+class UserRepository(BaseRepository[User, UserCreate, UserCreate]):
+    """User data access."""
+
+    includes = {"tasks": selectinload(User.tasks)}
+
+
+user_repo = UserRepository(User)
@@ -2,8 +2,9 @@
 Task schemas.
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict, model_validator
+from sqlalchemy import inspect
 
 
 class TaskBase(BaseModel):
@@ -73,3 +74,53 @@ class UserInDB(UserBase):
 class UserResponse(BaseModel):
     """API response wrapper."""
     data: UserInDB
+
+
+class Expandable(BaseModel):
+    """Reads only attributes already loaded on an ORM object.
+    
+    Relationships fetched with ``include=`` are embedded; the rest are left
+    as None instead of being lazy loaded one query per row.
+    """
+    model_config = ConfigDict(from_attributes=True)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def loaded_attributes_only(cls, data: Any) -> Any:
+        state = inspect(data, raiseerr=False)
+        if state is None:
+            return data
+        unloaded = state.unloaded
+        return {name: getattr(data, name) for name in cls.model_fields if name not in unloaded}
+
+
+class TaskExpanded(TaskInDB, Expandable):
+    """Task with relationships embedded on request (``include=user``)."""
+    user: Optional[UserInDB] = None
+
+
+class UserExpanded(UserInDB, Expandable):
+    """User with relationships embedded on request (``include=tasks``)."""
+    tasks: Optional[list[TaskInDB]] = None
+
+
+class TaskExpandedResponse(BaseModel):
+    """API response wrapper."""
+    data: TaskExpanded
+
+
+class TaskExpandedListResponse(BaseModel):
+    """API response wrapper for list."""
+    data: list[TaskExpanded]
+    meta: dict
+
+
+class UserExpandedResponse(BaseModel):
+    """API response wrapper."""
+    data: UserExpanded
+
+
+class UserExpandedListResponse(BaseModel):
+    """API response wrapper for list."""
+    data: list[UserExpanded]
+    meta: dict
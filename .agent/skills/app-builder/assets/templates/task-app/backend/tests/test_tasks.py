@@ -0,0 +1,219 @@
+"""
+Tests for task endpoints.
+"""
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.endpoints import tasks as tasks_endpoints, users as users_endpoints
+from app.db.base import Base, get_db
+from app.models.task import Task, User
+from app.repositories.task import task_repo
+
+
+@pytest.fixture
+def engine():
+    """Fresh in-memory database per test."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def queries(engine):
+    """SQL statements executed while the test runs."""
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+@pytest.fixture
+def client(session_factory):
+    """Test client; like get_db, each request gets its own session."""
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+    
+    app = FastAPI()
+    app.include_router(tasks_endpoints.router, prefix="/api/v1")
+    app.include_router(users_endpoints.router, prefix="/api/v1")
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def tasks(db):
+    """30 tasks across two users; every third one is completed and high priority."""
+    db.add_all([User(id=1, email="ada@example.com", name="Ada"), User(id=2, email="bob@example.com", name="Bob")])
+    db.add_all([
+        Task(
+            title=f"Task {n}",
+            user_id=1 + n % 2,
+            completed=n % 3 == 0,
+            priority="high" if n % 3 == 0 else "low",
+        )
+        for n in range(30)
+    ])
+    db.commit()
+    return 30
+
+
+def test_list_tasks_single_query(client, tasks, queries):
+    """Page and total come from one statement."""
+    queries.clear()
+    response = client.get("/api/v1/tasks", params={"limit": 5})
+    assert response.status_code == 200
+    content = response.json()
+    assert len(content["data"]) == 5
+    assert content["meta"]["total"] == tasks
+    assert content["meta"]["total_capped"] is False
+    assert len(queries) == 1
+
+
+def test_list_tasks_filters(client, tasks):
+    """Filters apply to both the rows and the total."""
+    response = client.get("/api/v1/tasks", params={"user_id": 1, "completed": True, "priority": "high"})
+    content = response.json()
+    assert content["meta"]["total"] == 5
+    assert all(task["user_id"] == 1 and task["completed"] for task in content["data"])
+
+
+def test_list_tasks_cursor_walk(client, tasks):
+    """Following next_cursor visits every matching task once, with the full total on every page."""
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 4, "completed": False}
+        if cursor:
+            params["cursor"] = cursor
+        content = client.get("/api/v1/tasks", params=params).json()
+        assert content["meta"]["total"] == 20
+        seen += [task["id"] for task in content["data"]]
+        cursor = content["meta"]["next_cursor"]
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen)) == 20
+
+
+def test_list_tasks_past_the_end(client, tasks):
+    """An empty page still reports the total."""
+    content = client.get("/api/v1/tasks", params={"skip": 100}).json()
+    assert content["data"] == []
+    assert content["meta"]["total"] == tasks
+    assert content["meta"]["next_cursor"] is None
+
+
+def test_list_tasks_invalid_cursor(client, tasks):
+    response = client.get("/api/v1/tasks", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_capped_total(client, tasks, monkeypatch):
+    """Totals stop at count_cap and say so."""
+    monkeypatch.setattr(task_repo, "count_cap", 10)
+    content = client.get("/api/v1/tasks").json()
+    assert content["meta"]["total"] == 10
+    assert content["meta"]["total_capped"] is True
+
+
+@pytest.mark.parametrize("limit", [5, 25])
+def test_list_tasks_include_user(client, tasks, queries, limit):
+    """include=user joins users into the page query, whatever the page size."""
+    queries.clear()
+    content = client.get("/api/v1/tasks", params={"limit": limit, "include": "user"}).json()
+    assert len(content["data"]) == limit
+    assert all(task["user"]["id"] == task["user_id"] for task in content["data"])
+    assert len(queries) == 1
+
+
+@pytest.mark.parametrize("limit", [5, 25])
+def test_list_tasks_without_include(client, tasks, queries, limit):
+    """Relationships not asked for are left out rather than lazy loaded per row."""
+    queries.clear()
+    content = client.get("/api/v1/tasks", params={"limit": limit}).json()
+    assert all(task["user"] is None for task in content["data"])
+    assert len(queries) == 1
+
+
+def test_get_task_include_user(client, tasks, queries):
+    queries.clear()
+    content = client.get("/api/v1/tasks/1", params={"include": "user"}).json()
+    assert content["data"]["user"]["email"] == "ada@example.com"
+    assert len(queries) == 1
+
+
+def test_unknown_include(client, tasks):
+    response = client.get("/api/v1/tasks", params={"include": "owner"})
+    assert response.status_code == 400
+    assert "owner" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("limit", [1, 2])
+def test_list_users_include_tasks(client, tasks, queries, limit):
+    """include=tasks loads every user's tasks with one extra IN query."""
+    queries.clear()
+    content = client.get("/api/v1/users", params={"limit": limit, "include": "tasks"}).json()
+    assert len(content["data"]) == limit
+    assert all(len(user["tasks"]) == 15 for user in content["data"])
+    assert len(queries) == 2
+
+
+def test_get_user_without_include(client, tasks):
+    content = client.get("/api/v1/users/1").json()
+    assert content["data"]["name"] == "Ada"
+    assert content["data"]["tasks"] is None
+
+
+def test_get_task_not_modified(client, tasks):
+    """A matching If-None-Match gets an empty 304."""
+    response = client.get("/api/v1/tasks/1")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+    
+    response = client.get("/api/v1/tasks/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_task_etag_follows_updated_at(client, db, tasks):
+    """The ETag changes when the row's updated_at does."""
+    etag = client.get("/api/v1/tasks/1").headers["etag"]
+    # Set explicitly: SQLite's CURRENT_TIMESTAMP only has one-second resolution
+    db.get(Task, 1).updated_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    db.commit()
+    assert client.get("/api/v1/tasks/1", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_list_tasks_not_modified(client, tasks):
+    """Lists revalidate too, with separate ETags per include."""
+    etag = client.get("/api/v1/tasks", params={"limit": 5}).headers["etag"]
+    response = client.get("/api/v1/tasks", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    
+    response = client.get("/api/v1/tasks", params={"limit": 5, "include": "user"}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
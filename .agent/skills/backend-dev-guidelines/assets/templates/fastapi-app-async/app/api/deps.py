@@ -0,0 +1,56 @@
+"""
+API dependencies.
+"""
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import get_db
+from app.core.security import decode_token
+
+security = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> dict:
+    """Get current authenticated user from JWT token."""
+    if not credentials:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    payload = decode_token(credentials.credentials)
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+        )
+    
+    # TODO: Fetch user from database
+    return {"id": int(user_id), "email": "user@example.com"}
+
+
+def get_include(
+    include: Optional[str] = Query(None, description="Comma-separated relationships to embed"),
+) -> list[str]:
+    """Parse ``?include=a,b`` into relationship names for repository ``include=``."""
+    if not include:
+        return []
+    return [name.strip() for name in include.split(",") if name.strip()]
+
+
+__all__ = ["get_db", "get_current_user", "get_include"]
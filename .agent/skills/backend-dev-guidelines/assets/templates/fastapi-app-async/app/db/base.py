@@ -0,0 +1,46 @@
+"""
+Database base configuration.
+"""
+from datetime import datetime
+from typing import AsyncGenerator
+
+from sqlalchemy import DateTime, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    mapped_column,
+)
+
+from app.core.config import settings
+
+
+class Base(DeclarativeBase):
+    """Base for all models."""
+    pass
+
+
+class TimestampMixin:
+    """Adds created_at and updated_at columns."""
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+# Engine and session. Disposed by the app lifespan (see main.py).
+engine = create_async_engine(settings.DATABASE_URL, pool_pre_ping=True)
+# expire_on_commit=False: attributes cannot lazy-load in async code, so
+# objects must stay readable after commit (e.g. while serializing)
+AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for database sessions."""
+    async with AsyncSessionLocal() as db:
+        yield db
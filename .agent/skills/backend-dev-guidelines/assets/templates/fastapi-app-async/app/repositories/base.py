@@ -0,0 +1,394 @@
+"""
+Base repository pattern (async).
+"""
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Generic, TypeVar, Type, Optional, List, Any, Iterable, Sequence
+from uuid import UUID
+
+from sqlalchemy import ARRAY, and_, any_, bindparam, delete, insert, or_, select, func, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+from pydantic import BaseModel
+
+from app.db.base import Base
+
+ModelType = TypeVar("ModelType", bound=Base)
+CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
+UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+
+
+# count() strategies
+COUNT_EXACT = "exact"        # SELECT count(*): exact, scans the whole table
+COUNT_CAPPED = "capped"      # Exact up to count_cap, then stops counting
+COUNT_ESTIMATE = "estimate"  # PostgreSQL planner estimate (pg_class.reltuples)
+COUNT_STRATEGIES = (COUNT_EXACT, COUNT_CAPPED, COUNT_ESTIMATE)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor is malformed or from another ordering."""
+
+
+class InvalidInclude(ValueError):
+    """Raised when an include names a relationship the repository does not expose."""
+
+
+def _cursor_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    payload = json.dumps([_cursor_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor from encode_cursor() back to JSON values."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as exc:
+        raise InvalidCursor("Malformed cursor") from exc
+    if not isinstance(values, list):
+        raise InvalidCursor("Malformed cursor")
+    return values
+
+
+def _dump(obj_in: BaseModel | dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+    return obj_in if isinstance(obj_in, dict) else obj_in.model_dump(**kwargs)
+
+
+def _batches(items: Sequence[Any], size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Generic repository with CRUD operations."""
+    
+    # Rows per statement for the *_many methods
+    batch_size: int = 500
+    # Sort order for get_multi()/get_page(); prefix a column with "-" for
+    # descending. The primary key is appended as a tie-breaker if missing.
+    order_by: Sequence[str] = ("id",)
+    # Default count() strategy, the cap for COUNT_CAPPED, and the estimate
+    # below which COUNT_ESTIMATE counts exactly instead (small tables are
+    # cheap to count and their statistics are least reliable)
+    count_strategy: str = COUNT_EXACT
+    count_cap: int = 10_000
+    exact_count_threshold: int = 10_000
+    # Relationships callers may ask for with include=..., each mapped to the
+    # loader option that fetches it for the whole result in a fixed number
+    # of queries: joinedload() for many-to-one, selectinload() for
+    # collections. Anything not included stays unloaded.
+    includes: dict[str, Any] = {}
+    
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+    
+    async def get(self, db: AsyncSession, id: Any, *, include: Iterable[str] = ()) -> Optional[ModelType]:
+        """Get by ID, eager loading the ``include`` relationships."""
+        return await db.get(self.model, id, options=self.load_options(include))
+    
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include: Iterable[str] = (),
+    ) -> List[ModelType]:
+        """Get multiple records in ``order_by`` order.
+        
+        With ``cursor`` (from ``cursor_for()`` on the last item of the
+        previous page) rows are fetched by keyset, which costs the same at
+        any depth; ``skip`` is ignored. Without it ``skip`` is an OFFSET.
+        """
+        stmt = select(self.model).options(*self.load_options(include))
+        stmt = stmt.order_by(*self._order_clauses()).limit(limit)
+        if cursor is not None:
+            stmt = stmt.where(self._after(cursor))
+        elif skip:
+            stmt = stmt.offset(skip)
+        return list((await db.execute(stmt)).scalars().all())
+    
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        include: Iterable[str] = (),
+    ) -> tuple[List[ModelType], Optional[str]]:
+        """Get one keyset page and the cursor for the next (None on the last page)."""
+        stmt = select(self.model).options(*self.load_options(include))
+        stmt = stmt.order_by(*self._order_clauses()).limit(limit + 1)
+        if cursor is not None:
+            stmt = stmt.where(self._after(cursor))
+        items = list((await db.execute(stmt)).scalars().all())
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, self.cursor_for(items[-1])
+    
+    def load_options(self, include: Iterable[str] = ()) -> list:
+        """Loader options for the ``include`` relationship names."""
+        include = list(dict.fromkeys(include))
+        unknown = [name for name in include if name not in self.includes]
+        if unknown:
+            raise InvalidInclude(
+                f"Unknown include {', '.join(unknown)}; expected one of {', '.join(self.includes) or 'none'}"
+            )
+        return [self.includes[name] for name in include]
+    
+    def cursor_for(self, db_obj: ModelType) -> str:
+        """Cursor that continues after ``db_obj``."""
+        return encode_cursor([getattr(db_obj, name) for name, _ in self._order_columns()])
+    
+    def _order_columns(self) -> list[tuple[str, bool]]:
+        columns = [(name.lstrip("-"), name.startswith("-")) for name in self.order_by]
+        if not any(name == "id" for name, _ in columns):
+            columns.append(("id", columns[-1][1] if columns else False))
+        return columns
+    
+    def _order_clauses(self) -> list:
+        return [
+            getattr(self.model, name).desc() if descending else getattr(self.model, name).asc()
+            for name, descending in self._order_columns()
+        ]
+    
+    def _after(self, cursor: str):
+        # (a, b, id) > (x, y, z) expanded per column so each one can have
+        # its own direction: a > x OR (a = x AND b > y) OR ...
+        columns = self._order_columns()
+        values = decode_cursor(cursor)
+        if len(values) != len(columns):
+            raise InvalidCursor("Cursor does not match this ordering")
+        
+        clauses, equal = [], []
+        for (name, descending), value in zip(columns, values):
+            column = getattr(self.model, name)
+            value = self._coerce(column, value)
+            clauses.append(and_(*equal, column < value if descending else column > value))
+            equal.append(column == value)
+        return or_(*clauses)
+    
+    @staticmethod
+    def _coerce(column: Any, value: Any) -> Any:
+        if value is None or not isinstance(value, str):
+            return value
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        try:
+            if python_type in (datetime, date):
+                return python_type.fromisoformat(value)
+            if python_type in (UUID, Decimal):
+                return python_type(value)
+        except ValueError as exc:
+            raise InvalidCursor("Malformed cursor") from exc
+        return value
+    
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        """Create new record."""
+        obj_data = obj_in.model_dump()
+        db_obj = self.model(**obj_data)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+    
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: UpdateSchemaType | dict[str, Any],
+    ) -> ModelType:
+        """Update record."""
+        obj_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        for field, value in obj_data.items():
+            setattr(db_obj, field, value)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+    
+    async def remove(self, db: AsyncSession, *, id: int) -> ModelType:
+        """Delete record."""
+        obj = await db.get(self.model, id)
+        await db.delete(obj)
+        await db.commit()
+        return obj
+    
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[CreateSchemaType | dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> List[ModelType]:
+        """Create records with multi-row INSERT ... RETURNING, in one transaction."""
+        rows = [_dump(obj) for obj in objs_in]
+        created: List[ModelType] = []
+        try:
+            for batch in _batches(rows, batch_size or self.batch_size):
+                created.extend((await db.scalars(insert(self.model).returning(self.model), batch)).all())
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return created
+    
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """Update records by primary key (each dict includes "id"), in one transaction.
+        
+        Each batch is sent as one executemany UPDATE; rows with the same
+        set of keys share a statement. asyncpg reports no row counts for
+        executemany, so each batch first locks its rows with SELECT ... FOR
+        UPDATE: if any id does not exist, ``StaleDataError`` is raised and
+        nothing is updated. Returns the number of rows updated. Objects
+        already loaded in ``db`` keep their old values; reload them with
+        ``db.refresh()`` if needed.
+        """
+        updated = 0
+        try:
+            for batch in _batches(list(objs_in), batch_size or self.batch_size):
+                ids = {row["id"] for row in batch}
+                stmt = select(self.model.id).where(self._id_in(db, list(ids))).with_for_update()
+                found = set((await db.scalars(stmt)).all())
+                if found != ids:
+                    raise StaleDataError(
+                        f"UPDATE on table '{self.model.__tablename__}' expected to match "
+                        f"{len(ids)} row(s); {len(found)} were matched."
+                    )
+                await db.execute(update(self.model), batch)
+                updated += len(batch)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return updated
+    
+    async def upsert_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[CreateSchemaType | dict[str, Any]],
+        index_elements: Sequence[str] = ("id",),
+        update_fields: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[ModelType]:
+        """Insert records, updating those that conflict on ``index_elements``.
+        
+        Uses INSERT ... ON CONFLICT DO UPDATE (PostgreSQL and SQLite).
+        ``update_fields`` defaults to every supplied column except the
+        conflict columns.
+        """
+        rows = [_dump(obj) for obj in objs_in]
+        if not rows:
+            return []
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        fields = update_fields or [key for key in rows[0] if key not in index_elements]
+        # ON CONFLICT DO UPDATE skips Python-side onupdate defaults (updated_at)
+        onupdate = {
+            column.key: column.onupdate.arg
+            for column in self.model.__table__.columns
+            if column.onupdate is not None and column.key not in fields
+        }
+        
+        upserted: List[ModelType] = []
+        try:
+            for batch in _batches(rows, batch_size or self.batch_size):
+                stmt = dialect.insert(self.model).values(batch)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(index_elements),
+                    set_={**onupdate, **{field: getattr(stmt.excluded, field) for field in fields}},
+                ).returning(self.model)
+                upserted.extend(
+                    (await db.scalars(stmt, execution_options={"populate_existing": True})).all()
+                )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return upserted
+    
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        ids: Sequence[Any],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """Delete records by id, in one transaction. Returns the number deleted."""
+        deleted = 0
+        try:
+            for batch in _batches(list(ids), batch_size or self.batch_size):
+                stmt = delete(self.model).where(self._id_in(db, batch))
+                deleted += (await db.execute(stmt, execution_options={"synchronize_session": False})).rowcount
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return deleted
+    
+    def _id_in(self, db: AsyncSession, ids: Sequence[Any]):
+        # On PostgreSQL "id = ANY(:ids)" binds one array, so every batch
+        # size shares one statement; elsewhere fall back to IN (...)
+        if db.get_bind().dialect.name == "postgresql":
+            ids_param = bindparam("ids", list(ids), type_=ARRAY(self.model.id.type))
+            return self.model.id == any_(ids_param)
+        return self.model.id.in_(ids)
+    
+    async def count(
+        self,
+        db: AsyncSession,
+        *,
+        strategy: Optional[str] = None,
+        cap: Optional[int] = None,
+    ) -> int:
+        """Count all records.
+        
+        ``strategy`` (default ``count_strategy``) is one of:
+        - COUNT_EXACT: ``SELECT count(*)``, a full scan on large tables.
+        - COUNT_CAPPED: exact up to ``cap`` (default ``count_cap``), then
+          returns ``cap``; show it as "10,000+".
+        - COUNT_ESTIMATE: PostgreSQL's planner estimate, as fresh as the
+          last ANALYZE/autovacuum. Counts exactly below
+          ``exact_count_threshold``, on other databases, and for tables
+          never analyzed.
+        """
+        strategy = strategy or self.count_strategy
+        if strategy not in COUNT_STRATEGIES:
+            raise ValueError(f"Unknown count strategy {strategy!r}; expected one of {COUNT_STRATEGIES}")
+        
+        if strategy == COUNT_CAPPED:
+            limited = select(self.model.id).limit(cap or self.count_cap).subquery()
+            return (await db.execute(select(func.count()).select_from(limited))).scalar() or 0
+        
+        if strategy == COUNT_ESTIMATE and db.get_bind().dialect.name == "postgresql":
+            estimate = (await db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                {"table": self.model.__table__.fullname},
+            )).scalar()
+            # reltuples is -1 (PostgreSQL 14+) or 0 before the first ANALYZE
+            if estimate is not None and estimate >= self.exact_count_threshold:
+                return estimate
+        
+        stmt = select(func.count()).select_from(self.model)
+        return (await db.execute(stmt)).scalar() or 0
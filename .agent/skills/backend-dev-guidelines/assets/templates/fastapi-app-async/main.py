@@ -0,0 +1,54 @@
+"""
+FastAPI application entry point.
+"""
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.api.caching import ETagMiddleware
+from app.api.v1.router import router as api_v1_router
+from app.core.config import settings
+from app.db.base import engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close pooled database connections on shutdown."""
+    yield
+    await engine.dispose()
+
+
+def create_app() -> FastAPI:
+    """Application factory."""
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        version=settings.VERSION,
+        description=settings.DESCRIPTION,
+        openapi_url=f"{settings.API_V1_STR}/openapi.json",
+        lifespan=lifespan,
+    )
+    
+    # CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.ALLOWED_HOSTS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    # ETag/304 for GET responses whose endpoints don't set one themselves
+    app.add_middleware(ETagMiddleware)
+    
+    # API routes
+    app.include_router(api_v1_router, prefix=settings.API_V1_STR)
+    
+    @app.get("/health")
+    async def health_check():
+        return {"status": "ok"}
+    
+    return app
+
+
+app = create_app()
@@ -0,0 +1,50 @@
+"""
+Pytest fixtures.
+"""
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base, get_db
+from main import create_app
+
+# In-memory SQLite for testing
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=StaticPool,
+)
+TestingSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+async def db():
+    """Create test database."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = TestingSessionLocal()
+    yield session
+    await session.close()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest.fixture
+async def client(db: AsyncSession):
+    """Test client with overridden DB."""
+    async def override_get_db():
+        yield db
+    
+    app = create_app()
+    app.dependency_overrides[get_db] = override_get_db
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def auth_headers():
+    """Mock auth headers for protected endpoints."""
+    return {"Authorization": "Bearer test-token"}
@@ -0,0 +1,51 @@
+"""
+Tests for ETags and conditional GET.
+"""
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.caching import ConditionalGet, conditional_get, etag_matches
+
+
+async def test_middleware_sets_etag(client: AsyncClient):
+    """GET responses get a weak ETag and Cache-Control."""
+    response = await client.get("/health")
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+async def test_middleware_not_modified(client: AsyncClient):
+    """A matching If-None-Match gets an empty 304."""
+    etag = (await client.get("/health")).headers["etag"]
+    response = await client.get("/health", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_conditional_get_dependency():
+    """The dependency answers 304 before the body is built."""
+    built = []
+    app = FastAPI()
+
+    @app.get("/items/{version}")
+    async def get_item(version: int, not_modified: ConditionalGet = Depends(conditional_get("private, max-age=60"))):
+        not_modified(version)
+        built.append(version)
+        return {"version": version}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        etag = (await client.get("/items/1")).headers["etag"]
+        response = await client.get("/items/1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "private, max-age=60"
+        assert built == [1]
+        assert (await client.get("/items/2", headers={"If-None-Match": etag})).status_code == 200
+
+
+def test_etag_matches():
+    """If-None-Match is compared weakly and may list several tags."""
+    assert etag_matches('"a", W/"b"', 'W/"b"')
+    assert etag_matches("*", 'W/"b"')
+    assert not etag_matches(None, 'W/"b"')
+    assert not etag_matches('W/"a"', 'W/"b"')
@@ -0,0 +1,20 @@
+"""
+Tests for main application.
+"""
+from httpx import AsyncClient
+
+
+async def test_health_check(client: AsyncClient):
+    """Test health endpoint."""
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+async def test_api_info(client: AsyncClient):
+    """Test API info endpoint."""
+    response = await client.get("/api/v1/")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["version"] == "1.0"
+    assert data["status"] == "active"
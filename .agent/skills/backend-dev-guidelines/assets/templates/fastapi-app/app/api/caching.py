@@ -0,0 +1,169 @@
+"""
+HTTP caching: weak ETags and conditional GET.
+
+Endpoints that can name the version of their data use the
+``conditional_get()`` dependency. It builds a weak ETag from row ids and
+versions (the mapper's version_id_col, else ``updated_at``), answers a
+matching ``If-None-Match`` with 304 before the response is serialized,
+and sets ``ETag`` and ``Cache-Control``.
+
+``ETagMiddleware`` covers the remaining GET endpoints by hashing the
+serialized body: that saves bandwidth but not serialization.
+"""
+import hashlib
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import inspect
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Clients may keep responses but must revalidate (cheaply, via 304) each time
+DEFAULT_CACHE_CONTROL = "private, no-cache"
+
+
+def _tag(data: bytes) -> str:
+    return f'W/"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def weak_etag(*parts: Any) -> str:
+    """Weak ETag for plain values."""
+    return _tag(repr(parts).encode())
+
+
+def _version(value: Any) -> Any:
+    state = inspect(value, raiseerr=False)
+    if state is None or not hasattr(state, "identity"):
+        return value
+    mapper = state.mapper
+    if mapper.version_id_col is not None:
+        version = getattr(value, mapper.get_property_by_column(mapper.version_id_col).key)
+    elif "updated_at" in mapper.attrs:
+        version = value.updated_at
+    else:
+        # No version to go by: use every loaded column
+        version = tuple(state.dict.get(attr.key) for attr in mapper.column_attrs)
+    return (mapper.class_.__name__, state.identity, version)
+
+
+def etag_for(*items: Any) -> str:
+    """Weak ETag for ORM objects, lists of them, and plain values.
+
+    Objects contribute only their identity and version, so nothing is
+    serialized. Pass everything else that shapes the response too
+    (totals, cursors, includes, related objects that are embedded).
+    """
+    parts = [
+        tuple(_version(value) for value in item) if isinstance(item, (list, tuple)) else _version(item)
+        for item in items
+    ]
+    return weak_etag(*parts)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``etag`` against an If-None-Match header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+class ConditionalGet:
+    """Per-request ETag check, from ``Depends(conditional_get())``."""
+
+    def __init__(self, request: Request, response: Response, cache_control: str):
+        self.request = request
+        self.response = response
+        self.cache_control = cache_control
+
+    def __call__(self, *items: Any) -> str:
+        """Set ETag/Cache-Control for ``items``; raise 304 if the client's copy is current."""
+        etag = etag_for(*items)
+        headers = {"ETag": etag, "Cache-Control": self.cache_control}
+        self.response.headers.update(headers)
+        if etag_matches(self.request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return etag
+
+
+def conditional_get(cache_control: str = DEFAULT_CACHE_CONTROL) -> Callable[..., ConditionalGet]:
+    """Dependency factory for conditional GET endpoints.
+
+    Usage:
+        @router.get("/items/{id}")
+        def get_item(
+            id: int,
+            db: Session = Depends(get_db),
+            not_modified: ConditionalGet = Depends(conditional_get()),
+        ):
+            item = item_repo.get(db, id=id)
+            not_modified(item)
+            return {"data": item}
+    """
+    def dependency(request: Request, response: Response) -> ConditionalGet:
+        return ConditionalGet(request, response, cache_control)
+
+    return dependency
+
+
+class ETagMiddleware:
+    """Weak ETags from a hash of the body for GET responses that lack one.
+
+    Only complete 200 responses with a Content-Length are buffered;
+    streaming responses, responses that already carry an ETag (from
+    ``conditional_get()``) and ``no-store`` responses pass through.
+    """
+
+    def __init__(self, app: ASGIApp, cache_control: str = DEFAULT_CACHE_CONTROL):
+        self.app = app
+        self.cache_control = cache_control
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Optional[Message] = None
+        body: list[bytes] = []
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] != 200
+                    or "etag" in headers
+                    or "content-length" not in headers
+                    or "no-store" in headers.get("cache-control", "")
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            content = b"".join(body)
+            etag = _tag(content)
+            headers = MutableHeaders(scope=start)
+            headers["ETag"] = etag
+            headers.setdefault("Cache-Control", self.cache_control)
+            if etag_matches(if_none_match, etag):
+                start["status"] = status.HTTP_304_NOT_MODIFIED
+                del headers["content-length"]
+                if "content-type" in headers:
+                    del headers["content-type"]
+                content = b""
+            await send(start)
+            await send({"type": "http.response.body", "body": content})
+
+        await self.app(scope, receive, send_with_etag)
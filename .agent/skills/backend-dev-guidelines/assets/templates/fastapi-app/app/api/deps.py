@@ -1,9 +1,9 @@
 """
 API dependencies.
 """
-from typing import Generator
+from typing import Generator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
@@ -44,4 +44,13 @@ def get_current_user(
     return {"id": int(user_id), "email": "user@example.com"}
 
 
-__all__ = ["get_db", "get_current_user"]
+def get_include(
+    include: Optional[str] = Query(None, description="Comma-separated relationships to embed"),
+) -> list[str]:
+    """Parse ``?include=a,b`` into relationship names for repository ``include=``."""
+    if not include:
+        return []
+    return [name.strip() for name in include.split(",") if name.strip()]
+
+
+__all__ = ["get_db", "get_current_user", "get_include"]
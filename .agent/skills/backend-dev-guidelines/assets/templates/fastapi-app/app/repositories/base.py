@@ -1,9 +1,15 @@
 """
 Base repository pattern.
 """
-from typing import Generic, TypeVar, Type, Optional, List, Any
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Generic, TypeVar, Type, Optional, List, Any, Iterable, Sequence
+from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import ARRAY, and_, any_, bindparam, delete, insert, or_, select, func, text, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
@@ -14,15 +20,81 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+# count() strategies
+COUNT_EXACT = "exact"        # SELECT count(*): exact, scans the whole table
+COUNT_CAPPED = "capped"      # Exact up to count_cap, then stops counting
+COUNT_ESTIMATE = "estimate"  # PostgreSQL planner estimate (pg_class.reltuples)
+COUNT_STRATEGIES = (COUNT_EXACT, COUNT_CAPPED, COUNT_ESTIMATE)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor is malformed or from another ordering."""
+
+
+class InvalidInclude(ValueError):
+    """Raised when an include names a relationship the repository does not expose."""
+
+
+def _cursor_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    payload = json.dumps([_cursor_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor from encode_cursor() back to JSON values."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as exc:
+        raise InvalidCursor("Malformed cursor") from exc
+    if not isinstance(values, list):
+        raise InvalidCursor("Malformed cursor")
+    return values
+
+
+def _dump(obj_in: BaseModel | dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+    return obj_in if isinstance(obj_in, dict) else obj_in.model_dump(**kwargs)
+
+
+def _batches(items: Sequence[Any], size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Generic repository with CRUD operations."""
     
+    # Rows per statement for the *_many methods
+    batch_size: int = 500
+    # Sort order for get_multi()/get_page(); prefix a column with "-" for
+    # descending. The primary key is appended as a tie-breaker if missing.
+    order_by: Sequence[str] = ("id",)
+    # Default count() strategy, the cap for COUNT_CAPPED, and the estimate
+    # below which COUNT_ESTIMATE counts exactly instead (small tables are
+    # cheap to count and their statistics are least reliable)
+    count_strategy: str = COUNT_EXACT
+    count_cap: int = 10_000
+    exact_count_threshold: int = 10_000
+    # Relationships callers may ask for with include=..., each mapped to the
+    # loader option that fetches it for the whole result in a fixed number
+    # of queries: joinedload() for many-to-one, selectinload() for
+    # collections. Anything not included stays unloaded.
+    includes: dict[str, Any] = {}
+    
     def __init__(self, model: Type[ModelType]):
         self.model = model
     
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
-        """Get by ID."""
-        return db.get(self.model, id)
+    def get(self, db: Session, id: Any, *, include: Iterable[str] = ()) -> Optional[ModelType]:
+        """Get by ID, eager loading the ``include`` relationships."""
+        return db.get(self.model, id, options=self.load_options(include))
     
     def get_multi(
         self,
@@ -30,11 +102,101 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         *,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
+        include: Iterable[str] = (),
     ) -> List[ModelType]:
-        """Get multiple records with pagination."""
-        stmt = select(self.model).offset(skip).limit(limit)
+        """Get multiple records in ``order_by`` order.
+        
+        With ``cursor`` (from ``cursor_for()`` on the last item of the
+        previous page) rows are fetched by keyset, which costs the same at
+        any depth; ``skip`` is ignored. Without it ``skip`` is an OFFSET.
+        """
+        stmt = select(self.model).options(*self.load_options(include))
+        stmt = stmt.order_by(*self._order_clauses()).limit(limit)
+        if cursor is not None:
+            stmt = stmt.where(self._after(cursor))
+        elif skip:
+            stmt = stmt.offset(skip)
         return list(db.execute(stmt).scalars().all())
     
+    def get_page(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        include: Iterable[str] = (),
+    ) -> tuple[List[ModelType], Optional[str]]:
+        """Get one keyset page and the cursor for the next (None on the last page)."""
+        stmt = select(self.model).options(*self.load_options(include))
+        stmt = stmt.order_by(*self._order_clauses()).limit(limit + 1)
+        if cursor is not None:
+            stmt = stmt.where(self._after(cursor))
+        items = list(db.execute(stmt).scalars().all())
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, self.cursor_for(items[-1])
+    
+    def load_options(self, include: Iterable[str] = ()) -> list:
+        """Loader options for the ``include`` relationship names."""
+        include = list(dict.fromkeys(include))
+        unknown = [name for name in include if name not in self.includes]
+        if unknown:
+            raise InvalidInclude(
+                f"Unknown include {', '.join(unknown)}; expected one of {', '.join(self.includes) or 'none'}"
+            )
+        return [self.includes[name] for name in include]
+    
+    def cursor_for(self, db_obj: ModelType) -> str:
+        """Cursor that continues after ``db_obj``."""
+        return encode_cursor([getattr(db_obj, name) for name, _ in self._order_columns()])
+    
+    def _order_columns(self) -> list[tuple[str, bool]]:
+        columns = [(name.lstrip("-"), name.startswith("-")) for name in self.order_by]
+        if not any(name == "id" for name, _ in columns):
+            columns.append(("id", columns[-1][1] if columns else False))
+        return columns
+    
+    def _order_clauses(self) -> list:
+        return [
+            getattr(self.model, name).desc() if descending else getattr(self.model, name).asc()
+            for name, descending in self._order_columns()
+        ]
+    
+    def _after(self, cursor: str):
+        # (a, b, id) > (x, y, z) expanded per column so each one can have
+        # its own direction: a > x OR (a = x AND b > y) OR ...
+        columns = self._order_columns()
+        values = decode_cursor(cursor)
+        if len(values) != len(columns):
+            raise InvalidCursor("Cursor does not match this ordering")
+        
+        clauses, equal = [], []
+        for (name, descending), value in zip(columns, values):
+            column = getattr(self.model, name)
+            value = self._coerce(column, value)
+            clauses.append(and_(*equal, column < value if descending else column > value))
+            equal.append(column == value)
+        return or_(*clauses)
+    
+    @staticmethod
+    def _coerce(column: Any, value: Any) -> Any:
+        if value is None or not isinstance(value, str):
+            return value
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        try:
+            if python_type in (datetime, date):
+                return python_type.fromisoformat(value)
+            if python_type in (UUID, Decimal):
+                return python_type(value)
+        except ValueError as exc:
+            raise InvalidCursor("Malformed cursor") from exc
+        return value
+    
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """Create new record."""
         obj_data = obj_in.model_dump()
@@ -66,7 +228,165 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.commit()
         return obj
     
-    def count(self, db: Session) -> int:
-        """Count all records."""
+    def create_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[CreateSchemaType | dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> List[ModelType]:
+        """Create records with multi-row INSERT ... RETURNING, in one transaction."""
+        rows = [_dump(obj) for obj in objs_in]
+        created: List[ModelType] = []
+        try:
+            for batch in _batches(rows, batch_size or self.batch_size):
+                created.extend(db.scalars(insert(self.model).returning(self.model), batch).all())
+            self._commit(db)
+        except Exception:
+            db.rollback()
+            raise
+        return created
+    
+    def update_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """Update records by primary key (each dict includes "id"), in one transaction.
+        
+        Each batch is sent as one executemany UPDATE; rows with the same
+        set of keys share a statement. If any id does not exist,
+        ``StaleDataError`` is raised and nothing is updated. Returns the
+        number of rows updated.
+        """
+        updated = 0
+        try:
+            for batch in _batches(list(objs_in), batch_size or self.batch_size):
+                db.execute(update(self.model), batch)
+                updated += len(batch)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return updated
+    
+    def upsert_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[CreateSchemaType | dict[str, Any]],
+        index_elements: Sequence[str] = ("id",),
+        update_fields: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[ModelType]:
+        """Insert records, updating those that conflict on ``index_elements``.
+        
+        Uses INSERT ... ON CONFLICT DO UPDATE (PostgreSQL and SQLite).
+        ``update_fields`` defaults to every supplied column except the
+        conflict columns.
+        """
+        rows = [_dump(obj) for obj in objs_in]
+        if not rows:
+            return []
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        fields = update_fields or [key for key in rows[0] if key not in index_elements]
+        # ON CONFLICT DO UPDATE skips Python-side onupdate defaults (updated_at)
+        onupdate = {
+            column.key: column.onupdate.arg
+            for column in self.model.__table__.columns
+            if column.onupdate is not None and column.key not in fields
+        }
+        
+        upserted: List[ModelType] = []
+        try:
+            for batch in _batches(rows, batch_size or self.batch_size):
+                stmt = dialect.insert(self.model).values(batch)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(index_elements),
+                    set_={**onupdate, **{field: getattr(stmt.excluded, field) for field in fields}},
+                ).returning(self.model)
+                upserted.extend(
+                    db.scalars(stmt, execution_options={"populate_existing": True}).all()
+                )
+            self._commit(db)
+        except Exception:
+            db.rollback()
+            raise
+        return upserted
+    
+    def remove_many(
+        self,
+        db: Session,
+        *,
+        ids: Sequence[Any],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """Delete records by id, in one transaction. Returns the number deleted."""
+        deleted = 0
+        try:
+            for batch in _batches(list(ids), batch_size or self.batch_size):
+                stmt = delete(self.model).where(self._id_in(db, batch))
+                deleted += db.execute(stmt, execution_options={"synchronize_session": False}).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return deleted
+    
+    def _id_in(self, db: Session, ids: Sequence[Any]):
+        # On PostgreSQL "id = ANY(:ids)" binds one array, so every batch
+        # size shares one statement; elsewhere fall back to IN (...)
+        if db.get_bind().dialect.name == "postgresql":
+            ids_param = bindparam("ids", list(ids), type_=ARRAY(self.model.id.type))
+            return self.model.id == any_(ids_param)
+        return self.model.id.in_(ids)
+    
+    def _commit(self, db: Session) -> None:
+        # Bulk results already hold the RETURNING values; keep them loaded
+        # instead of expiring them and reloading each row on first access
+        expire_on_commit = db.expire_on_commit
+        db.expire_on_commit = False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = expire_on_commit
+    
+    def count(
+        self,
+        db: Session,
+        *,
+        strategy: Optional[str] = None,
+        cap: Optional[int] = None,
+    ) -> int:
+        """Count all records.
+        
+        ``strategy`` (default ``count_strategy``) is one of:
+        - COUNT_EXACT: ``SELECT count(*)``, a full scan on large tables.
+        - COUNT_CAPPED: exact up to ``cap`` (default ``count_cap``), then
+          returns ``cap``; show it as "10,000+".
+        - COUNT_ESTIMATE: PostgreSQL's planner estimate, as fresh as the
+          last ANALYZE/autovacuum. Counts exactly below
+          ``exact_count_threshold``, on other databases, and for tables
+          never analyzed.
+        """
+        strategy = strategy or self.count_strategy
+        if strategy not in COUNT_STRATEGIES:
+            raise ValueError(f"Unknown count strategy {strategy!r}; expected one of {COUNT_STRATEGIES}")
+        
+        if strategy == COUNT_CAPPED:
+            limited = select(self.model.id).limit(cap or self.count_cap).subquery()
+            return db.execute(select(func.count()).select_from(limited)).scalar() or 0
+        
+        if strategy == COUNT_ESTIMATE and db.get_bind().dialect.name == "postgresql":
+            estimate = db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                {"table": self.model.__table__.fullname},
+            ).scalar()
+            # reltuples is -1 (PostgreSQL 14+) or 0 before the first ANALYZE
+            if estimate is not None and estimate >= self.exact_count_threshold:
+                return estimate
+        
         stmt = select(func.count()).select_from(self.model)
         return db.execute(stmt).scalar() or 0
@@ -4,6 +4,7 @@ FastAPI application entry point.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.caching import ETagMiddleware
 from app.api.v1.router import router as api_v1_router
 from app.core.config import settings
 
@@ -26,6 +27,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # ETag/304 for GET responses whose endpoints don't set one themselves
+    app.add_middleware(ETagMiddleware)
+    
     # API routes
     app.include_router(api_v1_router, prefix=settings.API_V1_STR)
     
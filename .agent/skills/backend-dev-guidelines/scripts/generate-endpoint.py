@@ -5,6 +5,7 @@ Generate FastAPI CRUD endpoint scaffolding.
 Usage:
     python generate-endpoint.py User
     python generate-endpoint.py Product --fields name:str,price:float,active:bool
+    python generate-endpoint.py Product --async   # for the fastapi-app-async template
 """
 
 import argparse
@@ -13,7 +14,7 @@ import sys
 from pathlib import Path
 
 
-def generate_schema(resource_name: str, resource: str, fields: list[tuple[str, str]]) -> str:
+def generate_schema(resource_name: str, resource: str, resource_plural: str, fields: list[tuple[str, str]]) -> str:
     """Generate Pydantic schema file."""
     base_fields = "\n".join(f"    {name}: {type_}" for name, type_ in fields)
     update_fields = "\n".join(f"    {name}: Optional[{type_}] = None" for name, type_ in fields)
@@ -23,7 +24,10 @@ def generate_schema(resource_name: str, resource: str, fields: list[tuple[str, s
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+# Upper bound on items per bulk request
+MAX_BULK_ITEMS = 1000
 
 
 class {resource_name}Base(BaseModel):
@@ -59,6 +63,41 @@ class {resource_name}ListResponse(BaseModel):
     """API response wrapper for {resource} list."""
     data: list[{resource_name}InDB]
     meta: dict
+
+
+class {resource_name}BulkCreate(BaseModel):
+    """Schema for creating many {resource_plural} at once."""
+    items: list[{resource_name}Create] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class {resource_name}BulkUpdateItem({resource_name}Update):
+    """One {resource} update within a bulk request."""
+    id: int
+
+
+class {resource_name}BulkUpdate(BaseModel):
+    """Schema for updating many {resource_plural} at once."""
+    items: list[{resource_name}BulkUpdateItem] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class {resource_name}Upsert({resource_name}Base):
+    """One {resource} to insert or overwrite by id."""
+    id: int
+
+
+class {resource_name}BulkUpsert(BaseModel):
+    """Schema for inserting or overwriting many {resource_plural} at once."""
+    items: list[{resource_name}Upsert] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class {resource_name}BulkDelete(BaseModel):
+    """Schema for deleting many {resource_plural} at once."""
+    ids: list[int] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class {resource_name}BulkResult(BaseModel):
+    """API response for bulk operations that return counts."""
+    data: dict[str, int]
 '''
 
 
@@ -117,12 +156,18 @@ from sqlalchemy.orm import Session
 
 from app.models.{resource} import {resource_name}
 from app.schemas.{resource} import {resource_name}Create, {resource_name}Update
-from .base import BaseRepository
+from .base import BaseRepository, COUNT_EXACT
 
 
 class {resource_name}Repository(BaseRepository[{resource_name}, {resource_name}Create, {resource_name}Update]):
     """Repository for {resource_name} operations."""
     
+    # List order and cursor key; e.g. ("-created_at",) for newest first
+    # (back it with an index on (created_at, id))
+    order_by = ("id",)
+    # Use COUNT_ESTIMATE once the table reaches millions of rows
+    count_strategy = COUNT_EXACT
+    
     def get_by_name(self, db: Session, name: str) -> Optional[{resource_name}]:
         """Get {resource} by name."""
         stmt = select({resource_name}).where({resource_name}.name == name)
@@ -142,7 +187,9 @@ def generate_router(resource_name: str, resource: str, resource_plural: str) ->
 {resource_name} API endpoints.
 """
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 from typing import Optional
 
 from app.api.deps import get_db, get_current_user
@@ -152,7 +199,13 @@ from app.schemas.{resource} import (
     {resource_name}Update,
     {resource_name}Response,
     {resource_name}ListResponse,
+    {resource_name}BulkCreate,
+    {resource_name}BulkUpdate,
+    {resource_name}BulkUpsert,
+    {resource_name}BulkDelete,
+    {resource_name}BulkResult,
 )
+from app.repositories.base import InvalidCursor
 from app.repositories.{resource} import {resource}_repo
 
 router = APIRouter()
@@ -162,12 +215,23 @@ router = APIRouter()
 def list_{resource_plural}(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: Session = Depends(get_db),
 ):
     """
     Retrieve {resource_plural} with pagination.
+    
+    Pass ``next_cursor`` back as ``cursor`` to page by keyset (fast at any
+    depth); ``skip`` still works for the first pages.
     """
-    items = {resource}_repo.get_multi(db, skip=skip, limit=limit)
+    try:
+        if cursor is not None or skip == 0:
+            items, next_cursor = {resource}_repo.get_page(db, cursor=cursor, limit=limit)
+        else:
+            items = {resource}_repo.get_multi(db, skip=skip, limit=limit)
+            next_cursor = {resource}_repo.cursor_for(items[-1]) if len(items) == limit else None
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     total = {resource}_repo.count(db)
     return {{
         "data": items,
@@ -175,6 +239,7 @@ def list_{resource_plural}(
             "skip": skip,
             "limit": limit,
             "total": total,
+            "next_cursor": next_cursor,
         }},
     }}
 
@@ -193,6 +258,73 @@ def create_{resource}(
     return {{"data": item}}
 
 
+# Bulk routes are declared before /{resource_plural}/{{{resource}_id}} so "bulk"
+# is not parsed as an id
+
+
+@router.post("/{resource_plural}/bulk", response_model={resource_name}ListResponse, status_code=status.HTTP_201_CREATED)
+def create_{resource_plural}_bulk(
+    *,
+    bulk_in: {resource_name}BulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Create many {resource_plural} in one transaction.
+    """
+    items = {resource}_repo.create_many(db, objs_in=bulk_in.items)
+    return {{"data": items, "meta": {{"created": len(items)}}}}
+
+
+@router.patch("/{resource_plural}/bulk", response_model={resource_name}BulkResult)
+def update_{resource_plural}_bulk(
+    *,
+    bulk_in: {resource_name}BulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Update many {resource_plural} in one transaction; all or nothing.
+    """
+    rows = [item.model_dump(exclude_unset=True) for item in bulk_in.items]
+    try:
+        updated = {resource}_repo.update_many(db, objs_in=rows)
+    except StaleDataError:
+        raise HTTPException(status_code=404, detail="One or more {resource_plural} not found")
+    return {{"data": {{"updated": updated}}}}
+
+
+@router.put("/{resource_plural}/bulk", response_model={resource_name}ListResponse)
+def upsert_{resource_plural}_bulk(
+    *,
+    bulk_in: {resource_name}BulkUpsert,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Insert or overwrite many {resource_plural} by id in one transaction.
+    """
+    try:
+        items = {resource}_repo.upsert_many(db, objs_in=bulk_in.items)
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Conflicting {resource} data")
+    return {{"data": items, "meta": {{"upserted": len(items)}}}}
+
+
+@router.post("/{resource_plural}/bulk-delete", response_model={resource_name}BulkResult)
+def delete_{resource_plural}_bulk(
+    *,
+    bulk_in: {resource_name}BulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Delete many {resource_plural} by id in one transaction.
+    """
+    deleted = {resource}_repo.remove_many(db, ids=bulk_in.ids)
+    return {{"data": {{"deleted": deleted}}}}
+
+
 @router.get("/{resource_plural}/{{{resource}_id}}", response_model={resource_name}Response)
 def get_{resource}(
     *,
@@ -327,6 +459,31 @@ class Test{resource_name}Endpoints:
         assert len(content["data"]) == 3
         assert "meta" in content
     
+    def test_list_{resource_plural}_by_cursor(
+        self,
+        client: TestClient,
+        db: Session,
+    ):
+        """Test that following next_cursor visits every {resource} once."""
+        {resource}_repo.create_many(db, objs_in=[{{{test_data}}} for _ in range(5)])
+        total = {resource}_repo.count(db)
+        
+        seen, cursor = [], None
+        while True:
+            params = {{"limit": 2}} if cursor is None else {{"limit": 2, "cursor": cursor}}
+            response = client.get("/api/v1/{resource_plural}", params=params)
+            content = response.json()
+            seen += [item["id"] for item in content["data"]]
+            cursor = content["meta"]["next_cursor"]
+            if cursor is None:
+                break
+        assert len(seen) == len(set(seen)) == total
+    
+    def test_list_{resource_plural}_invalid_cursor(self, client: TestClient):
+        """Test that a tampered cursor is rejected."""
+        response = client.get("/api/v1/{resource_plural}", params={{"cursor": "not-a-cursor"}})
+        assert response.status_code == 400
+    
     def test_update_{resource}(
         self,
         client: TestClient,
@@ -366,9 +523,108 @@ class Test{resource_name}Endpoints:
         # Verify deletion
         response = client.get(f"/api/v1/{resource_plural}/{{item.id}}")
         assert response.status_code == 404
+    
+    def test_bulk_create_{resource_plural}(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+    ):
+        """Test creating many {resource_plural} in one request."""
+        items = [{{{test_data}}} for _ in range(3)]
+        response = client.post(
+            "/api/v1/{resource_plural}/bulk",
+            json={{"items": items}},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        content = response.json()
+        assert len(content["data"]) == 3
+        assert len({{item["id"] for item in content["data"]}}) == 3
+    
+    def test_bulk_update_{resource_plural}(
+        self,
+        client: TestClient,
+        db: Session,
+        auth_headers: dict,
+    ):
+        """Test updating many {resource_plural}, and that a missing id updates none."""
+        items = {resource}_repo.create_many(db, objs_in=[{{{test_data}}} for _ in range(2)])
+        # The failed request rolls back the shared session and expires items
+        ids = [item.id for item in items]
+        updates = [{{"id": id, "name": f"Bulk {{id}}"}} for id in ids]
+        response = client.patch(
+            "/api/v1/{resource_plural}/bulk",
+            json={{"items": updates}},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == {{"updated": 2}}
+        
+        response = client.patch(
+            "/api/v1/{resource_plural}/bulk",
+            json={{"items": [{{"id": ids[0], "name": "Lost"}}, {{"id": 99999, "name": "Missing"}}]}},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+        response = client.get(f"/api/v1/{resource_plural}/{{ids[0]}}")
+        assert response.json()["data"]["name"] == f"Bulk {{ids[0]}}"
+    
+    def test_bulk_upsert_{resource_plural}(
+        self,
+        client: TestClient,
+        db: Session,
+        auth_headers: dict,
+    ):
+        """Test that bulk upsert overwrites existing ids and inserts new ones."""
+        item, = {resource}_repo.create_many(db, objs_in=[{{{test_data}}}])
+        rows = [
+            {{**{{{test_data}}}, "id": item.id, "name": "Overwritten"}},
+            {{**{{{test_data}}}, "id": 99990, "name": "Inserted"}},
+        ]
+        response = client.put(
+            "/api/v1/{resource_plural}/bulk",
+            json={{"items": rows}},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        names = {{row["id"]: row["name"] for row in response.json()["data"]}}
+        assert names == {{item.id: "Overwritten", 99990: "Inserted"}}
+    
+    def test_bulk_delete_{resource_plural}(
+        self,
+        client: TestClient,
+        db: Session,
+        auth_headers: dict,
+    ):
+        """Test deleting many {resource_plural} by id."""
+        items = {resource}_repo.create_many(db, objs_in=[{{{test_data}}} for _ in range(3)])
+        response = client.post(
+            "/api/v1/{resource_plural}/bulk-delete",
+            json={{"ids": [item.id for item in items] + [99999]}},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == {{"deleted": 3}}
 '''
 
 
+def to_async(source: str, resource: str) -> str:
+    """Convert generated sync repository/router/test code for the async template."""
+    source = source.replace("from sqlalchemy.orm import Session", "from sqlalchemy.ext.asyncio import AsyncSession")
+    source = source.replace("db: Session", "db: AsyncSession")
+    source = source.replace("from fastapi.testclient import TestClient", "from httpx import AsyncClient")
+    source = source.replace("client: TestClient", "client: AsyncClient")
+    source = re.sub(r"^(\s*)def ", r"\1async def ", source, flags=re.MULTILINE)
+    source = re.sub(r"\b(client\.(?:get|post|put|patch|delete))\(", r"await \1(", source)
+    # cursor_for() only reads attributes; everything else on the repo does I/O
+    source = re.sub(rf"\b({resource}_repo\.(?!cursor_for)\w+)\(", r"await \1(", source)
+    source = source.replace(
+        "return db.execute(stmt).scalar_one_or_none()",
+        "return (await db.execute(stmt)).scalar_one_or_none()",
+    )
+    return source
+
+
 def parse_fields(fields_str: str | None) -> list[tuple[str, str]]:
     """Parse field definitions like 'name:str,price:float,active:bool'."""
     if not fields_str:
@@ -398,7 +654,7 @@ def to_plural(name: str) -> str:
     return name + 's'
 
 
-def generate_resource(resource_name: str, fields_str: str | None, output_dir: str):
+def generate_resource(resource_name: str, fields_str: str | None, output_dir: str, use_async: bool = False):
     """Generate all files for a resource."""
     resource = to_snake_case(resource_name)
     resource_plural = to_plural(resource)
@@ -412,7 +668,7 @@ def generate_resource(resource_name: str, fields_str: str | None, output_dir: st
     # Generate schema
     schemas_dir = output / "schemas"
     schemas_dir.mkdir(exist_ok=True)
-    schema_content = generate_schema(resource_name, resource, fields)
+    schema_content = generate_schema(resource_name, resource, resource_plural, fields)
     (schemas_dir / f"{resource}.py").write_text(schema_content)
     print(f"✅ Created: schemas/{resource}.py")
     
@@ -427,6 +683,8 @@ def generate_resource(resource_name: str, fields_str: str | None, output_dir: st
     repos_dir = output / "repositories"
     repos_dir.mkdir(exist_ok=True)
     repo_content = generate_repository(resource_name, resource)
+    if use_async:
+        repo_content = to_async(repo_content, resource)
     (repos_dir / f"{resource}.py").write_text(repo_content)
     print(f"✅ Created: repositories/{resource}.py")
     
@@ -434,6 +692,8 @@ def generate_resource(resource_name: str, fields_str: str | None, output_dir: st
     endpoints_dir = output / "api" / "v1" / "endpoints"
     endpoints_dir.mkdir(parents=True, exist_ok=True)
     router_content = generate_router(resource_name, resource, resource_plural)
+    if use_async:
+        router_content = to_async(router_content, resource)
     (endpoints_dir / f"{resource}.py").write_text(router_content)
     print(f"✅ Created: api/v1/endpoints/{resource}.py")
     
@@ -441,6 +701,8 @@ def generate_resource(resource_name: str, fields_str: str | None, output_dir: st
     tests_dir = output / "tests" / "api"
     tests_dir.mkdir(parents=True, exist_ok=True)
     test_content = generate_tests(resource_name, resource, resource_plural, fields)
+    if use_async:
+        test_content = to_async(test_content, resource)
     (tests_dir / f"test_{resource}.py").write_text(test_content)
     print(f"✅ Created: tests/api/test_{resource}.py")
     
@@ -465,6 +727,12 @@ def main():
         "--fields",
         help="Field definitions (e.g., 'name:str,price:float,active:bool')"
     )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Generate async code for the fastapi-app-async template"
+    )
     parser.add_argument(
         "--output",
         default=".",
@@ -478,7 +746,7 @@ def main():
         print("Error: Resource name must be PascalCase (e.g., 'User', 'Product')")
         sys.exit(1)
     
-    generate_resource(args.resource, args.fields, args.output)
+    generate_resource(args.resource, args.fields, args.output, args.use_async)
 
 
 if __name__ == "__main__":
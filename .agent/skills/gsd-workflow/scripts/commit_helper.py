@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 COMMIT_TYPES = {
     "feat": "New feature",
@@ -260,6 +262,38 @@ def commit(message: str, dry_run: bool = False) -> bool:
         return False
 
 
+def run(args: argparse.Namespace) -> int:
+    """Create a GSD commit from the parsed arguments."""
+    # Check if we're in a git repo
+    try:
+        subprocess.run(["git", "rev-parse", "--git-dir"], capture_output=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        print("❌ Not a git repository or git not found")
+        return 1
+    
+    # Determine mode
+    if args.message:
+        # Non-interactive mode
+        with span("load"):
+            changed = get_changed_files() if not args.type else []
+        with span("analyze"):
+            commit_type = args.type or suggest_commit_type(changed)
+        with span("render"):
+            message = create_gsd_commit_message(
+                commit_type, args.scope, args.message,
+                args.phase, args.task, args.breaking
+            )
+    else:
+        # Interactive mode
+        message = interactive_commit()
+    
+    if message:
+        success = commit(message, args.dry_run)
+        return 0 if success else 1
+    
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="GSD-style commit helper",
@@ -281,34 +315,12 @@ Examples:
     parser.add_argument("--breaking", action="store_true", help="Breaking change")
     parser.add_argument("--dry-run", action="store_true", help="Preview only, don't commit")
     parser.add_argument("-i", "--interactive", action="store_true", help="Interactive mode (default)")
+    add_instrumentation_args(parser)
     
     args = parser.parse_args()
     
-    # Check if we're in a git repo
-    try:
-        subprocess.run(["git", "rev-parse", "--git-dir"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ Not a git repository or git not found")
-        return 1
-    
-    # Determine mode
-    if args.message:
-        # Non-interactive mode
-        commit_type = args.type or suggest_commit_type(get_changed_files())
-        scope = args.scope
-        message = create_gsd_commit_message(
-            commit_type, scope, args.message,
-            args.phase, args.task, args.breaking
-        )
-    else:
-        # Interactive mode
-        message = interactive_commit()
-    
-    if message:
-        success = commit(message, args.dry_run)
-        return 0 if success else 1
-    
-    return 0
+    with instrument("commit_helper", args):
+        return run(args)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Set, Tuple
 from collections import defaultdict
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 class DependencyVisualizer:
     """Visualize plan dependencies."""
@@ -25,15 +27,17 @@ class DependencyVisualizer:
         """Load all plans for a phase."""
         for plan_file in sorted(self.planning_dir.glob(f"{phase}-*-PLAN.md")):
             plan_id = self._extract_plan_id(plan_file.name)
-            content = plan_file.read_text()
+            with span("load"):
+                content = plan_file.read_text()
             
             # Extract info
-            info = {
-                "file": plan_file.name,
-                "name": self._extract_name(content),
-                "tasks": len(re.findall(r'<task\s+', content)),
-                "dependencies": self._extract_dependencies(content),
-            }
+            with span("parse"):
+                info = {
+                    "file": plan_file.name,
+                    "name": self._extract_name(content),
+                    "tasks": len(re.findall(r'<task\s+', content)),
+                    "dependencies": self._extract_dependencies(content),
+                }
             
             self.plan_info[plan_id] = info
             
@@ -324,29 +328,8 @@ class DependencyVisualizer:
         return depth
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Dependency Visualizer: Visualize plan dependencies",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s 1                         # ASCII tree for phase 1
-  %(prog)s 2 --format mermaid        # Mermaid diagram
-  %(prog)s 1 --format dot            # Graphviz DOT format
-  %(prog)s 3 --format table          # Markdown table
-  %(prog)s 1 --analyze               # Dependency analysis
-        """
-    )
-    
-    parser.add_argument("phase", type=int, help="Phase number to visualize")
-    parser.add_argument("--dir", default=".", help="Project directory")
-    parser.add_argument("--format", choices=["ascii", "mermaid", "dot", "table"],
-                        default="ascii", help="Output format")
-    parser.add_argument("--analyze", action="store_true", help="Show analysis report")
-    parser.add_argument("--output", type=Path, help="Output file")
-    
-    args = parser.parse_args()
-    
+def run(args: argparse.Namespace) -> int:
+    """Render the dependency view selected on the command line."""
     project_path = Path(args.dir).resolve()
     planning_dir = project_path / ".planning"
     
@@ -363,7 +346,8 @@ Examples:
     
     # Generate output
     if args.analyze:
-        output = visualizer.analyze()
+        with span("analyze"):
+            output = visualizer.analyze()
     else:
         formatters = {
             "ascii": visualizer.to_ascii_tree,
@@ -371,7 +355,8 @@ Examples:
             "dot": visualizer.to_dot,
             "table": visualizer.to_table,
         }
-        output = formatters[args.format]()
+        with span("render"):
+            output = formatters[args.format]()
     
     # Output
     if args.output:
@@ -383,5 +368,33 @@ Examples:
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Dependency Visualizer: Visualize plan dependencies",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s 1                         # ASCII tree for phase 1
+  %(prog)s 2 --format mermaid        # Mermaid diagram
+  %(prog)s 1 --format dot            # Graphviz DOT format
+  %(prog)s 3 --format table          # Markdown table
+  %(prog)s 1 --analyze               # Dependency analysis
+        """
+    )
+    
+    parser.add_argument("phase", type=int, help="Phase number to visualize")
+    parser.add_argument("--dir", default=".", help="Project directory")
+    parser.add_argument("--format", choices=["ascii", "mermaid", "dot", "table"],
+                        default="ascii", help="Output format")
+    parser.add_argument("--analyze", action="store_true", help="Show analysis report")
+    parser.add_argument("--output", type=Path, help="Output file")
+    add_instrumentation_args(parser)
+    
+    args = parser.parse_args()
+    
+    with instrument("dependency_visualizer", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
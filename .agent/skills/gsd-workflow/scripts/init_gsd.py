@@ -11,12 +11,15 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 def get_template(skill_dir: Path, name: str) -> str:
     """Read a template file from the skill's assets."""
     template_path = skill_dir / "assets" / "templates" / f"{name}.md"
     if template_path.exists():
-        return template_path.read_text()
+        with span("load"):
+            return template_path.read_text()
     return f"# {name}\n\n<!-- Template not found -->\n"
 
 
@@ -101,9 +104,11 @@ def main():
     parser = argparse.ArgumentParser(description="Initialize GSD structure")
     parser.add_argument("--dir", default=".", help="Project directory (default: current)")
     parser.add_argument("--auto", action="store_true", help="Auto mode (minimal questions)")
+    add_instrumentation_args(parser)
     
     args = parser.parse_args()
-    init_gsd(args.dir, args.auto)
+    with instrument("init_gsd", args):
+        init_gsd(args.dir, args.auto)
 
 
 if __name__ == "__main__":
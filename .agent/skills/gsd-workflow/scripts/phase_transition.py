@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 class PhaseManager:
     """Manage phase lifecycle and transitions."""
@@ -37,15 +39,17 @@ class PhaseManager:
         if not self.roadmap_file.exists():
             return None
         
-        content = self.roadmap_file.read_text()
+        with span("load"):
+            content = self.roadmap_file.read_text()
         
         # Find first non-complete phase
-        for match in re.finditer(r'## Phase (\d+):[^\n]*\n[^#]*?\*\*Status\*\*:\s*(\w+)', content, re.DOTALL):
-            phase_num = int(match.group(1))
-            status = match.group(2).lower()
-            
-            if status != "complete":
-                return phase_num
+        with span("parse"):
+            for match in re.finditer(r'## Phase (\d+):[^\n]*\n[^#]*?\*\*Status\*\*:\s*(\w+)', content, re.DOTALL):
+                phase_num = int(match.group(1))
+                status = match.group(2).lower()
+                
+                if status != "complete":
+                    return phase_num
         
         return None
     
@@ -54,10 +58,12 @@ class PhaseManager:
         if not self.roadmap_file.exists():
             return "unknown"
         
-        content = self.roadmap_file.read_text()
+        with span("load"):
+            content = self.roadmap_file.read_text()
         # Status can contain hyphens (e.g., "in-progress", "not-started")
-        pattern = rf'## Phase {phase}:[^\n]*\n[^#]*?\*\*Status\*\*:\s*([\w-]+)'
-        match = re.search(pattern, content, re.DOTALL)
+        with span("parse"):
+            pattern = rf'## Phase {phase}:[^\n]*\n[^#]*?\*\*Status\*\*:\s*([\w-]+)'
+            match = re.search(pattern, content, re.DOTALL)
         
         return match.group(1).lower() if match else "unknown"
     
@@ -165,8 +171,9 @@ class PhaseManager:
     
     def check_phase_completion(self, phase: int) -> dict:
         """Check if phase is ready for completion."""
-        plans = self.get_plan_files(phase)
-        summaries = self.get_summary_files(phase)
+        with span("load"):
+            plans = self.get_plan_files(phase)
+            summaries = self.get_summary_files(phase)
         
         results = {
             "plans_total": len(plans),
@@ -275,28 +282,8 @@ def print_status(manager: PhaseManager) -> None:
     print(f"\n{'='*60}\n")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Phase Transition Helper: Manage GSD phase lifecycle",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s status                    # Show current phase status
-  %(prog)s start 2                   # Start phase 2
-  %(prog)s complete 1                # Mark phase 1 as complete
-  %(prog)s set-status 2 executing    # Set phase 2 status to executing
-        """
-    )
-    
-    parser.add_argument("action", choices=["status", "start", "complete", "set-status", "check"],
-                        help="Action to perform")
-    parser.add_argument("phase", type=int, nargs="?", help="Phase number")
-    parser.add_argument("status_value", nargs="?", help="New status (for set-status)")
-    parser.add_argument("--dir", default=".", help="Project directory (default: current)")
-    parser.add_argument("--no-commit", action="store_true", help="Don't commit changes")
-    
-    args = parser.parse_args()
-    
+def run(args: argparse.Namespace) -> int:
+    """Perform the requested phase lifecycle action."""
     project_path = Path(args.dir).resolve()
     planning_dir = project_path / ".planning"
     
@@ -307,7 +294,8 @@ Examples:
     manager = PhaseManager(planning_dir)
     
     if args.action == "status":
-        print_status(manager)
+        with span("render"):
+            print_status(manager)
         return 0
     
     if args.action == "check":
@@ -366,5 +354,32 @@ Examples:
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Phase Transition Helper: Manage GSD phase lifecycle",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s status                    # Show current phase status
+  %(prog)s start 2                   # Start phase 2
+  %(prog)s complete 1                # Mark phase 1 as complete
+  %(prog)s set-status 2 executing    # Set phase 2 status to executing
+        """
+    )
+    
+    parser.add_argument("action", choices=["status", "start", "complete", "set-status", "check"],
+                        help="Action to perform")
+    parser.add_argument("phase", type=int, nargs="?", help="Phase number")
+    parser.add_argument("status_value", nargs="?", help="New status (for set-status)")
+    parser.add_argument("--dir", default=".", help="Project directory (default: current)")
+    parser.add_argument("--no-commit", action="store_true", help="Don't commit changes")
+    add_instrumentation_args(parser)
+    
+    args = parser.parse_args()
+    
+    with instrument("phase_transition", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -10,6 +10,8 @@ import sys
 from pathlib import Path
 from typing import List, Dict
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 
 class PlanMerger:
@@ -28,18 +30,20 @@ class PlanMerger:
         if not filepath.exists():
             raise FileNotFoundError(f"Plan not found: {filename}")
         
-        content = filepath.read_text()
-        
-        return {
-            "file": filename,
-            "path": filepath,
-            "content": content,
-            "phase": self._extract_phase(content),
-            "plan_num": self._extract_plan_num(content),
-            "name": self._extract_name(content),
-            "tasks": self._extract_tasks(content),
-            "dependencies": self._extract_dependencies(content),
-        }
+        with span("load"):
+            content = filepath.read_text()
+        
+        with span("parse"):
+            return {
+                "file": filename,
+                "path": filepath,
+                "content": content,
+                "phase": self._extract_phase(content),
+                "plan_num": self._extract_plan_num(content),
+                "name": self._extract_name(content),
+                "tasks": self._extract_tasks(content),
+                "dependencies": self._extract_dependencies(content),
+            }
     
     def _extract_phase(self, content: str) -> str:
         """Extract phase from plan tag."""
@@ -260,29 +264,8 @@ class PlanMerger:
         return '\n'.join(lines)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Plan Merger: Merge or split GSD plans",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s merge 1-1-PLAN.md 1-2-PLAN.md --name "Auth System"
-  %(prog)s split 1-1-PLAN.md --after 3,6           # Split into 3 plans
-  %(prog)s consolidate-quick                       # Consolidate quick tasks
-        """
-    )
-    
-    parser.add_argument("action", choices=["merge", "split", "consolidate-quick"],
-                        help="Action to perform")
-    parser.add_argument("plans", nargs="*", help="Plan files to process")
-    parser.add_argument("--dir", default=".", help="Project directory")
-    parser.add_argument("--name", help="Name for merged plan")
-    parser.add_argument("--after", help="Split points (comma-separated task numbers)")
-    parser.add_argument("--output", type=Path, help="Output file")
-    parser.add_argument("--preview", action="store_true", help="Preview only, don't save")
-    
-    args = parser.parse_args()
-    
+def run(args: argparse.Namespace) -> int:
+    """Merge, split or consolidate plans as requested."""
     project_path = Path(args.dir).resolve()
     planning_dir = project_path / ".planning"
     
@@ -359,5 +342,33 @@ Examples:
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Plan Merger: Merge or split GSD plans",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s merge 1-1-PLAN.md 1-2-PLAN.md --name "Auth System"
+  %(prog)s split 1-1-PLAN.md --after 3,6           # Split into 3 plans
+  %(prog)s consolidate-quick                       # Consolidate quick tasks
+        """
+    )
+    
+    parser.add_argument("action", choices=["merge", "split", "consolidate-quick"],
+                        help="Action to perform")
+    parser.add_argument("plans", nargs="*", help="Plan files to process")
+    parser.add_argument("--dir", default=".", help="Project directory")
+    parser.add_argument("--name", help="Name for merged plan")
+    parser.add_argument("--after", help="Split points (comma-separated task numbers)")
+    parser.add_argument("--output", type=Path, help="Output file")
+    parser.add_argument("--preview", action="store_true", help="Preview only, don't save")
+    add_instrumentation_args(parser)
+    
+    args = parser.parse_args()
+    
+    with instrument("plan_merger", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
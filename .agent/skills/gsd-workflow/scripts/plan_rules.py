@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+Plan Rules: Event-driven rule engine behind validate_plan.py.
+
+A plan is tokenized once into element open/close, attribute and text
+events. Each rule subscribes to the events (and optionally the tags) it
+cares about; the engine compiles those subscriptions into per-event
+dispatch tables so a rule costs nothing for events it ignores.
+
+Rules are configured from the "validation" key of .planning/config.json:
+
+    "validation": {
+      "rules": {
+        "dependencies-section": false,
+        "plan-size": {"max_lines": 300},
+        "task-attributes": {"severity": "warning"}
+      },
+      "plugins": ["rules/team_rules.py"],
+      "max_file_mb": 64,
+      "max_diagnostics": 200
+    }
+
+Plugin files (paths relative to .planning/) register extra rules with
+@register_rule.
+"""
+
+import importlib.util
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+ERROR = "error"
+WARNING = "warning"
+
+# One pattern for every tag; "/" prefix marks a close, "/" suffix self-closing
+TAG_RE = re.compile(r'<(/?)(\w+)([^<>]*)>')
+ATTR_RE = re.compile(r'(\w+)="([^"]*)"')
+
+# Longest tag carried across chunk boundaries before it is treated as text
+MAX_TAG_LENGTH = 4096
+
+# Per rule and severity; further diagnostics are only counted
+DEFAULT_MAX_DIAGNOSTICS = 200
+
+EVENTS = ("on_start", "on_end", "on_attribute", "on_text", "on_finish")
+
+# Rule id -> class, in registration order (which is also report order)
+RULES: Dict[str, Type["Rule"]] = {}
+
+
+def register_rule(cls: Type["Rule"]) -> Type["Rule"]:
+    """Class decorator adding a rule to the registry."""
+    if not cls.id:
+        raise ValueError(f"{cls.__name__} needs an id")
+    RULES[cls.id] = cls
+    return cls
+
+
+class Element:
+    """An element open (or close) event."""
+
+    __slots__ = ("tag", "raw", "line", "end_line", "self_closing", "_attrs")
+
+    def __init__(self, tag: str, raw: str, line: int, end_line: int, self_closing: bool):
+        self.tag = tag
+        self.raw = raw  # Text between the tag name and ">"
+        self.line = line  # Line of "<"
+        self.end_line = end_line  # Line of ">"
+        self.self_closing = self_closing
+        self._attrs: Optional[Dict[str, str]] = None
+
+    @property
+    def attrs(self) -> Dict[str, str]:
+        """Attributes, parsed on first access."""
+        if self._attrs is None:
+            self._attrs = dict(ATTR_RE.findall(self.raw))
+        return self._attrs
+
+    @property
+    def bare(self) -> bool:
+        """True for a plain <tag> with no attributes."""
+        return not self.raw
+
+
+class RuleContext:
+    """Per-document state shared by all rules."""
+
+    def __init__(self, max_diagnostics: int = DEFAULT_MAX_DIAGNOSTICS):
+        self.line_count = 1
+        self.max_diagnostics = max_diagnostics
+        self.diagnostics: List[Tuple[int, int, str, str]] = []
+        # (rule order, severity) -> reported count, so huge plans stay bounded
+        self.counts: Dict[Tuple[int, str], int] = {}
+
+    def report(self, order: int, severity: str, message: str) -> None:
+        key = (order, severity)
+        seen = self.counts.get(key, 0)
+        self.counts[key] = seen + 1
+        if seen < self.max_diagnostics:
+            self.diagnostics.append((order, len(self.diagnostics), severity, message))
+
+    def messages(self, severity: str) -> List[str]:
+        """Messages of one severity, grouped by rule in registry order."""
+        messages = [msg for _, _, sev, msg in sorted(self.diagnostics) if sev == severity]
+        for (_, sev), total in sorted(self.counts.items()):
+            if sev == severity and total > self.max_diagnostics:
+                messages.append(f"... {total - self.max_diagnostics} more similar {severity}s suppressed")
+        return messages
+
+
+class Rule:
+    """Base class for validation rules.
+
+    Override any of on_start, on_end, on_attribute, on_text and on_finish.
+    Set `tags` to only receive element events for those tags.
+    """
+
+    id = ""
+    description = ""
+    tags: Optional[Set[str]] = None
+    defaults: Dict = {}
+
+    def __init__(self, options: Optional[Dict] = None, order: int = 0):
+        options = dict(options or {})
+        self.severity: Optional[str] = options.pop("severity", None)
+        self.options = {**self.defaults, **options}
+        self.order = order
+
+    def reset(self) -> None:
+        """Clear per-document state before a new plan is scanned."""
+
+    def error(self, ctx: RuleContext, message: str) -> None:
+        ctx.report(self.order, self.severity or ERROR, message)
+
+    def warning(self, ctx: RuleContext, message: str) -> None:
+        ctx.report(self.order, self.severity or WARNING, message)
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None: ...
+
+    def on_end(self, el: Element, ctx: RuleContext) -> None: ...
+
+    def on_attribute(self, el: Element, name: str, value: str, ctx: RuleContext) -> None: ...
+
+    def on_text(self, text: str, line: int, ctx: RuleContext) -> None: ...
+
+    def on_finish(self, ctx: RuleContext) -> None: ...
+
+
+class RuleEngine:
+    """Run a set of rules over a plan in a single tokenizing pass."""
+
+    def __init__(self, rules: List[Rule], timed: bool = False,
+                 max_diagnostics: int = DEFAULT_MAX_DIAGNOSTICS,
+                 max_file_mb: Optional[float] = None):
+        self.rules = rules
+        self.timed = timed
+        self.max_diagnostics = max_diagnostics
+        self.max_file_mb = max_file_mb  # Size ceiling for plan files (None = caller default)
+        self.timings: Dict[str, float] = {rule.id: 0.0 for rule in rules}
+        self.calls: Dict[str, int] = {rule.id: 0 for rule in rules}
+        self._compile()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict] = None, base_dir: Optional[Path] = None,
+                    timed: bool = False) -> "RuleEngine":
+        """Build an engine from the "validation" section of config.json."""
+        validation = (config or {}).get("validation", {})
+
+        for plugin in validation.get("plugins", []):
+            load_plugin(Path(base_dir or ".") / plugin)
+
+        settings = validation.get("rules", {})
+        rules = []
+        for order, (rule_id, rule_cls) in enumerate(RULES.items()):
+            options = settings.get(rule_id, True)
+            if options is False:
+                continue
+            rules.append(rule_cls(options if isinstance(options, dict) else None, order))
+
+        unknown = set(settings) - set(RULES)
+        if unknown:
+            raise ValueError(f"Unknown validation rule(s): {', '.join(sorted(unknown))}")
+
+        return cls(rules, timed=timed,
+                   max_diagnostics=validation.get("max_diagnostics", DEFAULT_MAX_DIAGNOSTICS),
+                   max_file_mb=validation.get("max_file_mb"))
+
+    def _compile(self) -> None:
+        """Build per-event handler lists from the methods each rule overrides."""
+        self._generic: Dict[str, List[Callable]] = {event: [] for event in EVENTS}
+        self._tagged: Dict[str, Dict[str, List[Callable]]] = {event: {} for event in EVENTS}
+
+        for rule in self.rules:
+            for event in EVENTS:
+                if getattr(type(rule), event) is getattr(Rule, event):
+                    continue
+                handler = getattr(rule, event)
+                if self.timed:
+                    handler = self._timed(rule.id, handler)
+                if rule.tags is None or event in ("on_text", "on_finish"):
+                    self._generic[event].append(handler)
+                else:
+                    for tag in rule.tags:
+                        self._tagged[event].setdefault(tag, []).append(handler)
+
+        # Subscribed tags get their own handler list; all others use the generic one
+        self._tables = {
+            event: {tag: self._generic[event] + handlers for tag, handlers in tagged.items()}
+            for event, tagged in self._tagged.items()
+        }
+
+    def _timed(self, rule_id: str, handler: Callable) -> Callable:
+        """Wrap a handler to accumulate its run time."""
+        timings, calls, clock = self.timings, self.calls, time.perf_counter
+
+        def wrapper(*args):
+            start = clock()
+            try:
+                handler(*args)
+            finally:
+                timings[rule_id] += clock() - start
+                calls[rule_id] += 1
+
+        return wrapper
+
+    def run(self, content: str) -> RuleContext:
+        """Tokenize content once and dispatch events to the rules."""
+        return self.run_stream([content])
+
+    def run_stream(self, chunks: Iterable[str]) -> RuleContext:
+        """Tokenize a plan delivered in chunks, holding only one chunk at a time.
+
+        A tag split across chunks is carried over to the next one; text runs
+        may be delivered to on_text in several pieces.
+        """
+        ctx = RuleContext(self.max_diagnostics)
+        for rule in self.rules:
+            rule.reset()
+
+        text_handlers = self._generic["on_text"]
+        start_table = self._tables["on_start"]
+        end_table = self._tables["on_end"]
+        attr_table = self._tables["on_attribute"]
+        generic_start = self._generic["on_start"]
+        generic_end = self._generic["on_end"]
+        generic_attr = self._generic["on_attribute"]
+        wants_attrs = bool(generic_attr or attr_table)
+        line = 1
+        carry = ""
+
+        for chunk in chunks:
+            buffer = carry + chunk if carry else chunk
+            count = buffer.count
+            pos = 0
+
+            for match in TAG_RE.finditer(buffer):
+                start, end = match.span()
+                if start > pos:
+                    if text_handlers:
+                        text = buffer[pos:start]
+                        for handler in text_handlers:
+                            handler(text, line, ctx)
+                    line += count("\n", pos, start)
+                pos = end
+
+                closing, tag, raw = match.groups()
+                if closing:
+                    if raw:
+                        # "</tag attr>" is not a close tag; skip it
+                        line += count("\n", start, end)
+                        continue
+                    el = Element(tag, "", line, line, False)
+                    for handler in end_table.get(tag, generic_end):
+                        handler(el, ctx)
+                    continue
+
+                end_line = line + raw.count("\n") if "\n" in raw else line
+                self_closing = raw.endswith("/")
+                if self_closing:
+                    raw = raw[:-1]
+                el = Element(tag, raw.strip(), line, end_line, self_closing)
+                line = end_line
+                for handler in start_table.get(tag, generic_start):
+                    handler(el, ctx)
+                if wants_attrs and el.raw:
+                    attr_handlers = attr_table.get(tag, generic_attr)
+                    if attr_handlers:
+                        for name, value in el.attrs.items():
+                            for handler in attr_handlers:
+                                handler(el, name, value, ctx)
+
+            # Hold back a possibly incomplete tag at the end of the buffer
+            cut = len(buffer)
+            tail = buffer.rfind("<", pos)
+            if tail != -1 and len(buffer) - tail <= MAX_TAG_LENGTH and ">" not in buffer[tail:]:
+                cut = tail
+            if cut > pos:
+                if text_handlers:
+                    text = buffer[pos:cut]
+                    for handler in text_handlers:
+                        handler(text, line, ctx)
+                line += count("\n", pos, cut)
+            carry = buffer[cut:]
+
+        if carry:
+            if text_handlers:
+                for handler in text_handlers:
+                    handler(carry, line, ctx)
+            line += carry.count("\n")
+        ctx.line_count = line
+
+        for handler in self._generic["on_finish"]:
+            handler(ctx)
+
+        return ctx
+
+    def timing_report(self) -> List[Dict]:
+        """Per-rule time and call counts, slowest first."""
+        rows = [
+            {"rule": rule_id, "calls": self.calls[rule_id], "ms": round(seconds * 1000, 3)}
+            for rule_id, seconds in self.timings.items()
+        ]
+        return sorted(rows, key=lambda row: row["ms"], reverse=True)
+
+
+def load_plugin(path: Path) -> None:
+    """Import a rule plugin file so its @register_rule classes are registered."""
+    if not path.exists():
+        raise FileNotFoundError(f"Validation plugin not found: {path}")
+    spec = importlib.util.spec_from_file_location(f"gsd_rules_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+
+# ----------------------------------------------------------------------
+# Built-in rules
+# ----------------------------------------------------------------------
+
+
+@register_rule
+class PlanRootRule(Rule):
+    id = "plan-root"
+    description = 'Plan has a <plan phase="N" plan="M"> root and closes it'
+    tags = {"plan"}
+
+    ROOT_ATTRS = re.compile(r'phase="\d+"\s+plan="\d+"')
+
+    def reset(self) -> None:
+        self.has_root = False
+        self.closed = False
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None:
+        if self.ROOT_ATTRS.fullmatch(el.raw) and not el.self_closing:
+            self.has_root = True
+
+    def on_end(self, el: Element, ctx: RuleContext) -> None:
+        self.closed = True
+
+    def on_finish(self, ctx: RuleContext) -> None:
+        if not self.has_root:
+            self.error(ctx, "Missing or malformed <plan phase=\"N\" plan=\"M\"> root element")
+        if not self.closed:
+            self.error(ctx, "Missing closing </plan> tag")
+
+
+@register_rule
+class BalancedTagsRule(Rule):
+    id = "balanced-tags"
+    description = "Every opened element is closed the same number of times"
+    defaults = {"ignore": ["task", "br", "hr"]}
+
+    def reset(self) -> None:
+        self.opened: Dict[str, int] = {}
+        self.closed: Dict[str, int] = {}
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None:
+        if not el.self_closing:
+            self.opened[el.tag] = self.opened.get(el.tag, 0) + 1
+
+    def on_end(self, el: Element, ctx: RuleContext) -> None:
+        self.closed[el.tag] = self.closed.get(el.tag, 0) + 1
+
+    def on_finish(self, ctx: RuleContext) -> None:
+        ignore = set(self.options["ignore"])
+        for tag, open_count in self.opened.items():
+            if tag in ignore:
+                continue
+            close_count = self.closed.get(tag, 0)
+            if open_count != close_count:
+                self.error(ctx, f"Unbalanced tags: <{tag}> opened {open_count} times, closed {close_count} times")
+
+
+@register_rule
+class RequiredSectionsRule(Rule):
+    id = "required-sections"
+    description = "Plan has <overview> and <tasks>, and the overview has a name and goal"
+    defaults = {"required": ["overview", "tasks"], "recommended": ["phase_name", "goal"]}
+
+    def __init__(self, options: Optional[Dict] = None, order: int = 0):
+        super().__init__(options, order)
+        self.tags = set(self.options["required"]) | set(self.options["recommended"])
+
+    def reset(self) -> None:
+        self.seen: Set[str] = set()
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None:
+        if el.bare:
+            self.seen.add(el.tag)
+
+    def on_finish(self, ctx: RuleContext) -> None:
+        for tag in self.options["required"]:
+            if tag not in self.seen:
+                self.error(ctx, f"Missing <{tag}> section")
+        for tag in self.options["recommended"]:
+            if tag not in self.seen:
+                self.warning(ctx, f"Missing <{tag}> in overview")
+
+
+@register_rule
+class TaskAttributesRule(Rule):
+    id = "task-attributes"
+    description = "Tasks declare a valid type and priority"
+    tags = {"task"}
+    defaults = {"types": ["auto", "manual"], "priorities": ["1", "2", "3"]}
+
+    def reset(self) -> None:
+        self.count = 0
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None:
+        attrs = el.attrs
+        if "type" not in attrs or "priority" not in attrs:
+            return
+        self.count += 1
+        task_type, priority = attrs["type"], attrs["priority"]
+        if task_type not in self.options["types"]:
+            self.error(ctx, f"Task {self.count}: Invalid type '{task_type}'. Use 'auto' or 'manual'")
+        if priority not in self.options["priorities"]:
+            self.warning(ctx, f"Task {self.count}: Unusual priority '{priority}'. Use 1 (blocking), 2 (important), or 3 (nice-to-have)")
+
+    def on_finish(self, ctx: RuleContext) -> None:
+        if not self.count:
+            self.error(ctx, "No tasks found in plan")
+
+
+@register_rule
+class TaskFieldsRule(Rule):
+    id = "task-fields"
+    description = "Tasks have the required fields and a real action"
+    defaults = {"required": ["name", "action"], "placeholders": ["", "TODO", "TODO:"]}
+
+    def __init__(self, options: Optional[Dict] = None, order: int = 0):
+        super().__init__(options, order)
+        self.tags = {"task", "action"} | set(self.options["required"])
+        # Action text longer than this cannot be a placeholder, so stop collecting
+        self.placeholder_len = max((len(p) for p in self.options["placeholders"]), default=0)
+
+    def reset(self) -> None:
+        self.index = 0
+        self.in_task = False
+        self.fields: Set[str] = set()
+        self.in_action = False
+        self.action_checked = False
+        self.action_text: List[str] = []
+        self.action_size = 0
+        self.action_has_children = False
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None:
+        if el.tag == "task":
+            self.index += 1
+            self.in_task = True
+            self.fields = set()
+            self.action_checked = False
+            return
+        if self.in_action:
+            self.action_has_children = True
+        if not self.in_task or not el.bare:
+            return
+        self.fields.add(el.tag)
+        if el.tag == "action" and not self.action_checked:
+            self.in_action = True
+            self.action_text = []
+            self.action_size = 0
+            self.action_has_children = False
+
+    def on_text(self, text: str, line: int, ctx: RuleContext) -> None:
+        if self.in_action and self.action_size <= self.placeholder_len:
+            stripped = text.strip()
+            self.action_text.append(stripped)
+            self.action_size += len(stripped)
+
+    def on_end(self, el: Element, ctx: RuleContext) -> None:
+        if el.tag == "action" and self.in_action:
+            if not self.action_has_children and "".join(self.action_text) in self.options["placeholders"]:
+                self.warning(ctx, f"Task {self.index}: Action is empty or placeholder")
+            self.in_action = False
+            self.action_checked = True
+        elif el.tag == "task" and self.in_task:
+            for field in self.options["required"]:
+                if field not in self.fields:
+                    self.error(ctx, f"Task {self.index}: Missing <{field}>")
+            self.in_task = False
+            self.in_action = False
+
+
+@register_rule
+class PlanSizeRule(Rule):
+    id = "plan-size"
+    description = "Plans and tasks stay small enough to execute in one sitting"
+    tags = {"task"}
+    defaults = {"max_lines": 150, "max_task_lines": 50}
+
+    def reset(self) -> None:
+        self.index = 0
+        self.task_line: Optional[int] = None
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None:
+        self.index += 1
+        self.task_line = el.end_line
+
+    def on_end(self, el: Element, ctx: RuleContext) -> None:
+        if self.task_line is None:
+            return
+        task_lines = el.line - self.task_line
+        if task_lines > self.options["max_task_lines"]:
+            self.warning(ctx, f"Task {self.index} is {task_lines} lines (recommended: < {self.options['max_task_lines']}). Consider breaking into smaller tasks.")
+        self.task_line = None
+
+    def on_finish(self, ctx: RuleContext) -> None:
+        if ctx.line_count > self.options["max_lines"]:
+            self.warning(ctx, f"Plan is {ctx.line_count} lines (recommended: < {self.options['max_lines']}). Consider splitting into multiple plans.")
+
+
+@register_rule
+class VerifyStepsRule(Rule):
+    id = "verify-steps"
+    description = "At least one task has a <verify> step"
+    tags = {"verify"}
+
+    def reset(self) -> None:
+        self.found = False
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None:
+        if el.bare:
+            self.found = True
+
+    def on_finish(self, ctx: RuleContext) -> None:
+        if not self.found:
+            self.warning(ctx, "No verification steps found. Add <verify> to tasks.")
+
+
+@register_rule
+class DependenciesSectionRule(Rule):
+    id = "dependencies-section"
+    description = "Plan declares a <dependencies> section"
+    tags = {"dependencies"}
+
+    def reset(self) -> None:
+        self.found = False
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None:
+        if el.bare:
+            self.found = True
+
+    def on_finish(self, ctx: RuleContext) -> None:
+        if not self.found:
+            self.warning(ctx, "No <dependencies> section. Add if this plan depends on others.")
+
+
+@register_rule
+class AutoTaskDoneRule(Rule):
+    id = "auto-task-done"
+    description = "Auto tasks define <done> completion criteria"
+    tags = {"task", "done"}
+
+    def reset(self) -> None:
+        self.index = 0
+        self.in_auto = False
+        self.has_done = False
+
+    def on_start(self, el: Element, ctx: RuleContext) -> None:
+        if el.tag == "task":
+            self.in_auto = el.attrs.get("type") == "auto"
+            if self.in_auto:
+                self.index += 1
+                self.has_done = False
+        elif self.in_auto and el.bare:
+            self.has_done = True
+
+    def on_end(self, el: Element, ctx: RuleContext) -> None:
+        if el.tag == "task" and self.in_auto:
+            if not self.has_done:
+                self.warning(ctx, f"Auto task {self.index}: Missing <done> criteria (completion definition)")
+            self.in_auto = False
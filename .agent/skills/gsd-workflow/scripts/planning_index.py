@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+"""
+Planning Index: Optional SQLite mirror of .planning/ for fast queries.
+Phases, plans, tasks, dependencies, summaries, blockers, todos and session
+history are parsed once and kept in sync incrementally from file changes.
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from telemetry import add_instrumentation_args, instrument, span
+from wave_planner import PlanAnalyzer
+
+# Index location, relative to the .planning directory
+INDEX_PATH = Path(".cache") / "planning.db"
+
+# Milestone label for artifacts outside .planning/milestones/
+CURRENT_MILESTONE = "current"
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    milestone TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS phases (
+    source TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    milestone TEXT NOT NULL,
+    num INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    goal TEXT,
+    requirements TEXT,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_phases_milestone ON phases(milestone, num);
+CREATE TABLE IF NOT EXISTS plans (
+    source TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    milestone TEXT NOT NULL,
+    plan_id TEXT NOT NULL,
+    phase INTEGER NOT NULL,
+    plan INTEGER NOT NULL,
+    name TEXT,
+    task_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_plans_phase ON plans(milestone, phase);
+CREATE TABLE IF NOT EXISTS tasks (
+    source TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    milestone TEXT NOT NULL,
+    plan_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    type TEXT,
+    priority TEXT,
+    name TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_plan ON tasks(milestone, plan_id);
+CREATE TABLE IF NOT EXISTS dependencies (
+    source TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    milestone TEXT NOT NULL,
+    plan_id TEXT NOT NULL,
+    depends_on TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_deps_plan ON dependencies(milestone, plan_id);
+CREATE TABLE IF NOT EXISTS summaries (
+    source TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    milestone TEXT NOT NULL,
+    plan_id TEXT NOT NULL,
+    phase INTEGER NOT NULL,
+    title TEXT,
+    completed_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_phase ON summaries(milestone, phase);
+CREATE TABLE IF NOT EXISTS state (
+    source TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS blockers (
+    source TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    source TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    milestone TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    heading TEXT NOT NULL,
+    body TEXT
+);
+CREATE TABLE IF NOT EXISTS todos (
+    source TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    title TEXT NOT NULL
+);
+"""
+
+
+def _milestone_for(rel_path: Path) -> str:
+    """Derive the milestone label from a path relative to .planning/."""
+    parts = rel_path.parts
+    if len(parts) > 1 and parts[0] == "milestones":
+        match = re.match(r'(v[\d.]+)', parts[1])
+        if match:
+            return match.group(1).rstrip(".")
+    return CURRENT_MILESTONE
+
+
+def _classify(rel_path: Path) -> Optional[str]:
+    """Return the artifact kind for a planning file, or None to skip it."""
+    name = rel_path.name
+    if name == "ROADMAP.md" or name.endswith("-ROADMAP.md"):
+        return "roadmap"
+    if rel_path == Path("STATE.md"):
+        return "state"
+    if re.match(r'\d+-\d+-PLAN\.md$', name):
+        return "plan"
+    if re.match(r'\d+-\d+-SUMMARY\.md$', name):
+        return "summary"
+    if rel_path.parts[0] == "todos" and name.endswith(".md"):
+        return "todo"
+    return None
+
+
+class PlanningIndex:
+    """SQLite mirror of a project's planning artifacts."""
+
+    def __init__(self, planning_dir: Path, db_path: Optional[Path] = None):
+        self.planning_dir = planning_dir
+        self.db_path = db_path or planning_dir / INDEX_PATH
+        self._conn: Optional[sqlite3.Connection] = None
+        self._deps_parser = PlanAnalyzer(planning_dir)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open (and if needed create) the index database."""
+        if self._conn is None:
+            new_cache_dir = not self.db_path.parent.exists()
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            if new_cache_dir and self.db_path.parent.name == ".cache":
+                # Keep the cache out of version control
+                (self.db_path.parent / ".gitignore").write_text("*\n")
+
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._ensure_schema()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "PlanningIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _ensure_schema(self) -> None:
+        """Create tables, rebuilding them if the schema version changed."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            tables = [row[0] for row in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )]
+            for table in tables:
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> Dict[str, Tuple[Path, str, str, int, int]]:
+        """Stat all indexable planning files."""
+        found = {}
+        cache_dir = self.db_path.parent.resolve()
+        for path in self.planning_dir.rglob("*.md"):
+            rel_path = path.relative_to(self.planning_dir)
+            kind = _classify(rel_path)
+            if kind is None or cache_dir in path.resolve().parents:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            found[rel_path.as_posix()] = (
+                path, kind, _milestone_for(rel_path), stat.st_mtime_ns, stat.st_size
+            )
+        return found
+
+    def sync(self) -> Dict[str, int]:
+        """Bring the mirror up to date with the files on disk.
+
+        Only files whose mtime or size changed are re-parsed; rows from
+        deleted or changed files are removed via ON DELETE CASCADE.
+        """
+        conn = self.conn
+        with span("load"):
+            found = self._scan()
+            known = {
+                row["path"]: (row["mtime_ns"], row["size"])
+                for row in conn.execute("SELECT path, mtime_ns, size FROM files")
+            }
+
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        with conn:
+            for rel in set(known) - set(found):
+                conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                stats["removed"] += 1
+
+            for rel, (path, kind, milestone, mtime_ns, size) in found.items():
+                if known.get(rel) == (mtime_ns, size):
+                    stats["unchanged"] += 1
+                    continue
+
+                try:
+                    with span("load"):
+                        content = path.read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    continue
+
+                stats["updated" if rel in known else "added"] += 1
+                conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                conn.execute(
+                    "INSERT INTO files (path, kind, milestone, mtime_ns, size) VALUES (?, ?, ?, ?, ?)",
+                    (rel, kind, milestone, mtime_ns, size),
+                )
+                with span("parse"):
+                    getattr(self, f"_ingest_{kind}")(rel, milestone, path, content, mtime_ns)
+
+        return stats
+
+    def _ingest_roadmap(self, source: str, milestone: str, path: Path, content: str, mtime_ns: int) -> None:
+        """Store phases from a ROADMAP.md."""
+        phase_pattern = r'## Phase (\d+):([^\n]+)\n([^#]+)'
+        for match in re.finditer(phase_pattern, content, re.DOTALL):
+            section = match.group(3)
+            status_match = re.search(r'\*\*Status\*\*:\s*([^\n]+)', section)
+            goal_match = re.search(r'\*\*Goal\*\*:\s*([^\n]+)', section)
+            reqs_match = re.search(r'\*\*Requirements\*\*:\s*([^\n]+)', section)
+            self._conn.execute(
+                "INSERT INTO phases (source, milestone, num, name, goal, requirements, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    source, milestone, int(match.group(1)), match.group(2).strip(),
+                    goal_match.group(1).strip() if goal_match else "",
+                    reqs_match.group(1).strip() if reqs_match else "",
+                    status_match.group(1).strip().lower() if status_match else "unknown",
+                ),
+            )
+
+    def _ingest_plan(self, source: str, milestone: str, path: Path, content: str, mtime_ns: int) -> None:
+        """Store a plan with its tasks and dependencies."""
+        plan_id, phase, plan = self._plan_ref(path.name)
+        name_match = re.search(r'<phase_name>([^<]+)</phase_name>', content)
+        tasks = re.findall(r'<task\s+([^>]*)>(.*?)</task>', content, re.DOTALL)
+        task_count = len(re.findall(r'<task\s+', content))
+
+        self._conn.execute(
+            "INSERT INTO plans (source, milestone, plan_id, phase, plan, name, task_count) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (source, milestone, plan_id, phase, plan,
+             name_match.group(1).strip() if name_match else path.name, task_count),
+        )
+
+        rows = []
+        for idx, (attrs, body) in enumerate(tasks, 1):
+            type_match = re.search(r'type="(\w+)"', attrs)
+            priority_match = re.search(r'priority="(\w+)"', attrs)
+            task_name = re.search(r'<name>(.*?)</name>', body, re.DOTALL)
+            rows.append((
+                source, milestone, plan_id, idx,
+                type_match.group(1) if type_match else None,
+                priority_match.group(1) if priority_match else None,
+                task_name.group(1).strip() if task_name else None,
+            ))
+        self._conn.executemany(
+            "INSERT INTO tasks (source, milestone, plan_id, idx, type, priority, name) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+        self._conn.executemany(
+            "INSERT INTO dependencies (source, milestone, plan_id, depends_on) VALUES (?, ?, ?, ?)",
+            [(source, milestone, plan_id, dep)
+             for dep in self._deps_parser._extract_dependencies(content)],
+        )
+
+    def _ingest_summary(self, source: str, milestone: str, path: Path, content: str, mtime_ns: int) -> None:
+        """Store a plan summary (a completed plan)."""
+        plan_id, phase, _ = self._plan_ref(path.name)
+        title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+        self._conn.execute(
+            "INSERT INTO summaries (source, milestone, plan_id, phase, title, completed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (source, milestone, plan_id, phase,
+             title_match.group(1) if title_match else path.name, mtime_ns),
+        )
+
+    def _ingest_state(self, source: str, milestone: str, path: Path, content: str, mtime_ns: int) -> None:
+        """Store status fields, blockers and session history from STATE.md."""
+        for key, value in re.findall(r'^\*\*(\w+)\*\*:\s*([^\n]+)', content, re.MULTILINE):
+            self._conn.execute(
+                "INSERT INTO state (source, key, value) VALUES (?, ?, ?)",
+                (source, key.lower(), value.strip()),
+            )
+
+        blockers_section = re.search(r'## Blockers\s*\n([^#]+)', content)
+        if blockers_section:
+            position = 0
+            for line in blockers_section.group(1).strip().split('\n'):
+                line = line.strip()
+                if line.startswith('- [ ]'):
+                    position += 1
+                    self._conn.execute(
+                        "INSERT INTO blockers (source, position, text) VALUES (?, ?, ?)",
+                        (source, position, line[5:].strip()),
+                    )
+
+        milestone_match = re.search(r'\*\*Milestone\*\*:\s*([^\n]+)', content)
+        session_milestone = milestone_match.group(1).strip() if milestone_match else milestone
+        memory = re.search(r'## Session Memory\s*\n(.*?)(?=\n## |\Z)', content, re.DOTALL)
+        if memory:
+            entries = re.findall(r'^### ([^\n]+)\n(.*?)(?=^### |\Z)', memory.group(1), re.DOTALL | re.MULTILINE)
+            for position, (heading, body) in enumerate(entries, 1):
+                self._conn.execute(
+                    "INSERT INTO sessions (source, milestone, position, heading, body) VALUES (?, ?, ?, ?, ?)",
+                    (source, session_milestone, position, heading.strip(), body.strip()),
+                )
+
+    def _ingest_todo(self, source: str, milestone: str, path: Path, content: str, mtime_ns: int) -> None:
+        """Store a captured todo."""
+        title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+        self._conn.execute(
+            "INSERT INTO todos (source, title) VALUES (?, ?)",
+            (source, title_match.group(1) if title_match else path.stem),
+        )
+
+    def _plan_ref(self, filename: str) -> Tuple[str, int, int]:
+        """Extract (plan_id, phase, plan) from e.g. '1-2-PLAN.md'."""
+        match = re.match(r'(\d+)-(\d+)', filename)
+        return f"{match.group(1)}-{match.group(2)}", int(match.group(1)), int(match.group(2))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def phases(self, milestone: str = CURRENT_MILESTONE) -> List[Dict]:
+        """Phases with plan/summary counts, shaped like ProgressReporter.get_phase_data()."""
+        rows = self.conn.execute(
+            """
+            SELECT ph.num, ph.name, ph.status, ph.requirements,
+                   (SELECT COUNT(*) FROM plans p
+                     WHERE p.milestone = ph.milestone AND p.phase = ph.num) AS plans_total,
+                   (SELECT COUNT(*) FROM summaries s
+                     WHERE s.milestone = ph.milestone AND s.phase = ph.num) AS plans_completed
+            FROM phases ph
+            WHERE ph.milestone = ?
+            ORDER BY ph.num
+            """,
+            (milestone,),
+        ).fetchall()
+        return [
+            {
+                "num": row["num"],
+                "name": row["name"],
+                "status": row["status"],
+                "requirements": row["requirements"],
+                "plans_total": row["plans_total"],
+                "plans_completed": row["plans_completed"],
+                "progress_pct": (row["plans_completed"] / row["plans_total"] * 100)
+                if row["plans_total"] else 0,
+            }
+            for row in rows
+        ]
+
+    def current_phase(self, milestone: str = CURRENT_MILESTONE) -> Optional[int]:
+        """First phase that is not complete."""
+        row = self.conn.execute(
+            "SELECT num FROM phases WHERE milestone = ? AND status != 'complete' ORDER BY num LIMIT 1",
+            (milestone,),
+        ).fetchone()
+        return row["num"] if row else None
+
+    def plans(self, phase: int, milestone: str = CURRENT_MILESTONE) -> List[Dict]:
+        """Plans for a phase with completion flag and dependencies."""
+        rows = self.conn.execute(
+            """
+            SELECT p.plan_id, p.source, p.name, p.task_count,
+                   EXISTS (SELECT 1 FROM summaries s
+                            WHERE s.milestone = p.milestone AND s.plan_id = p.plan_id) AS done,
+                   (SELECT group_concat(d.depends_on, ',') FROM dependencies d
+                     WHERE d.milestone = p.milestone AND d.plan_id = p.plan_id) AS deps
+            FROM plans p
+            WHERE p.milestone = ? AND p.phase = ?
+            ORDER BY p.plan_id
+            """,
+            (milestone, phase),
+        ).fetchall()
+        return [
+            {
+                "plan_id": row["plan_id"],
+                "file": Path(row["source"]).name,
+                "path": self.planning_dir / row["source"],
+                "name": row["name"],
+                "tasks": row["task_count"],
+                "done": bool(row["done"]),
+                "dependencies": row["deps"].split(",") if row["deps"] else [],
+            }
+            for row in rows
+        ]
+
+    def upcoming_work(self, limit: int = 5, milestone: str = CURRENT_MILESTONE) -> List[Dict]:
+        """Plans without a summary, shaped like ProgressReporter.get_upcoming_work()."""
+        rows = self.conn.execute(
+            """
+            SELECT p.phase, p.name, p.source, p.task_count
+            FROM plans p
+            WHERE p.milestone = ?
+              AND NOT EXISTS (SELECT 1 FROM summaries s
+                               WHERE s.milestone = p.milestone AND s.plan_id = p.plan_id)
+            ORDER BY p.phase, p.source
+            LIMIT ?
+            """,
+            (milestone, limit),
+        ).fetchall()
+        return [
+            {"phase": row["phase"], "name": row["name"],
+             "file": Path(row["source"]).name, "tasks": row["task_count"]}
+            for row in rows
+        ]
+
+    def state(self) -> Dict:
+        """STATE.md status and blockers, shaped like status.parse_state()."""
+        status_row = self.conn.execute(
+            "SELECT value FROM state WHERE key = 'status' LIMIT 1"
+        ).fetchone()
+        return {
+            "status": status_row["value"] if status_row else "unknown",
+            "blockers": self.blockers(),
+        }
+
+    def blockers(self) -> List[str]:
+        """Open blockers from STATE.md."""
+        return [row["text"] for row in self.conn.execute(
+            "SELECT text FROM blockers ORDER BY position"
+        )]
+
+    def todo_count(self) -> int:
+        """Number of captured todos."""
+        return self.conn.execute("SELECT COUNT(*) FROM todos").fetchone()[0]
+
+    def milestones(self) -> List[Dict]:
+        """Per-milestone phase and plan totals."""
+        rows = self.conn.execute(
+            """
+            SELECT f.milestone,
+                   (SELECT COUNT(*) FROM phases ph WHERE ph.milestone = f.milestone) AS phases,
+                   (SELECT COUNT(*) FROM phases ph
+                     WHERE ph.milestone = f.milestone AND ph.status = 'complete') AS phases_complete,
+                   (SELECT COUNT(*) FROM plans p WHERE p.milestone = f.milestone) AS plans,
+                   (SELECT COUNT(*) FROM summaries s WHERE s.milestone = f.milestone) AS summaries
+            FROM files f
+            GROUP BY f.milestone
+            ORDER BY f.milestone
+            """
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def history(self, milestone: Optional[str] = None) -> List[Dict]:
+        """Session memory entries and plan completions, newest first."""
+        params: Tuple = ()
+        where = ""
+        if milestone:
+            where = "WHERE milestone = ?"
+            params = (milestone,)
+
+        sessions = [
+            {"type": "session", "milestone": row["milestone"], "title": row["heading"], "detail": row["body"]}
+            for row in self.conn.execute(
+                f"SELECT milestone, heading, body FROM sessions {where} ORDER BY position", params
+            )
+        ]
+        completions = [
+            {"type": "completion", "milestone": row["milestone"], "title": row["title"], "detail": row["plan_id"]}
+            for row in self.conn.execute(
+                f"SELECT milestone, plan_id, title FROM summaries {where} ORDER BY completed_at DESC", params
+            )
+        ]
+        return sessions + completions
+
+    def query(self, sql: str, params: Tuple = ()) -> List[Dict]:
+        """Run an ad-hoc read-only query against the mirror."""
+        if not sql.lstrip().lower().startswith(("select", "with")):
+            raise ValueError("Only SELECT queries are allowed")
+        conn = self.conn
+        # The prefix check alone lets "WITH ... DELETE" through; SQLite itself
+        # refuses writes while query_only is on
+        conn.execute("PRAGMA query_only = ON")
+        try:
+            return [dict(row) for row in conn.execute(sql, params)]
+        except sqlite3.OperationalError as e:
+            if "readonly" not in str(e):
+                raise
+            conn.rollback()
+            raise ValueError("Only SELECT queries are allowed") from e
+        finally:
+            conn.execute("PRAGMA query_only = OFF")
+
+
+def open_index(planning_dir: Path) -> PlanningIndex:
+    """Open the project's planning index and bring it up to date."""
+    index = PlanningIndex(planning_dir)
+    index.sync()
+    return index
+
+
+def run(args: argparse.Namespace) -> int:
+    """Sync the index and run the requested query."""
+    project_path = Path(args.dir).resolve()
+    planning_dir = project_path / ".planning"
+
+    if not planning_dir.exists():
+        print(f"❌ GSD not initialized in {project_path}")
+        return 1
+
+    with PlanningIndex(planning_dir) as index:
+        if args.action == "rebuild" and index.db_path.exists():
+            index.close()
+            index.db_path.unlink()
+
+        stats = index.sync()
+
+        if args.action in ("sync", "rebuild"):
+            print(f"✅ Index synced: {index.db_path}")
+            print(f"   {stats['added']} added, {stats['updated']} updated, "
+                  f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+            return 0
+
+        with span("analyze"):
+            if args.action == "milestones":
+                result = index.milestones()
+            elif args.action == "history":
+                result = index.history(args.milestone)
+            else:
+                if not args.sql:
+                    print("❌ SQL query required")
+                    return 1
+                try:
+                    result = index.query(args.sql)
+                except (ValueError, sqlite3.Error) as e:
+                    print(f"❌ Query failed: {e}")
+                    return 1
+
+        with span("render"):
+            print(json.dumps(result, indent=2, default=str))
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Planning Index: SQLite mirror of .planning/ for fast queries",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s sync                                  # Incrementally update the index
+  %(prog)s rebuild                               # Drop and rebuild from scratch
+  %(prog)s milestones                            # Phase/plan totals per milestone
+  %(prog)s history --milestone v1.5              # Sessions and completions
+  %(prog)s query "SELECT * FROM plans WHERE phase = 2"
+        """
+    )
+
+    parser.add_argument("action", choices=["sync", "rebuild", "milestones", "history", "query"],
+                        help="Action to perform")
+    parser.add_argument("sql", nargs="?", help="SELECT statement (for query)")
+    parser.add_argument("--dir", default=".", help="Project directory")
+    parser.add_argument("--milestone", help="Restrict history to one milestone")
+    add_instrumentation_args(parser)
+
+    args = parser.parse_args()
+
+    with instrument("planning_index", args):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
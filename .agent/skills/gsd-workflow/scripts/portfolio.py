@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Portfolio: Aggregate progress and blockers across many GSD projects.
+Discovers .planning/ directories under a root and summarizes each in parallel.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from planning_index import INDEX_PATH, PlanningIndex
+from progress_reporter import ProgressReporter
+from telemetry import add_instrumentation_args, instrument, span
+
+# Directories never worth descending into when looking for projects
+SKIP_DIRS = {
+    ".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv",
+    "env", ".tox", ".nox", ".mypy_cache", ".pytest_cache", "dist", "build",
+    "target", ".next", ".cache", "vendor",
+}
+
+
+def _scan_dir(path: Path, depth: int, max_depth: int, skip: Set[str]) -> Iterable[Path]:
+    """Yield project roots below path; stop descending once a project is found."""
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return
+
+    if any(e.name == ".planning" and e.is_dir(follow_symlinks=False) for e in entries):
+        # Nested projects inside a GSD project are not treated separately
+        yield path
+        return
+
+    if depth >= max_depth:
+        return
+
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        if entry.name in skip or entry.name.startswith("."):
+            continue
+        yield from _scan_dir(Path(entry.path), depth + 1, max_depth, skip)
+
+
+def discover_projects(root: Path, max_depth: int = 4, workers: int = 8,
+                      skip: Optional[Set[str]] = None) -> List[Path]:
+    """Find GSD projects under root with a pruned walk.
+
+    Top-level subtrees are walked concurrently since discovery on large
+    trees is dominated by directory I/O.
+    """
+    skip = SKIP_DIRS if skip is None else skip
+    root = root.resolve()
+
+    if (root / ".planning").is_dir():
+        return [root]
+
+    try:
+        children = [
+            Path(e.path) for e in os.scandir(root)
+            if e.is_dir(follow_symlinks=False) and e.name not in skip and not e.name.startswith(".")
+        ]
+    except OSError:
+        return []
+
+    if max_depth < 1 or not children:
+        return []
+
+    projects: List[Path] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for found in pool.map(lambda child: list(_scan_dir(child, 1, max_depth, skip)), children):
+            projects.extend(found)
+
+    return sorted(projects)
+
+
+def summarize_project(project_dir: Path) -> Dict:
+    """Summarize one project's progress and blockers.
+
+    Runs in a worker process. Uses the project's planning index when one
+    already exists, otherwise parses the markdown files directly.
+    """
+    planning_dir = project_dir / ".planning"
+    summary = {
+        "name": project_dir.name,
+        "path": str(project_dir),
+        "source": "files",
+        "phases": [],
+        "blockers": [],
+        "upcoming": 0,
+    }
+
+    try:
+        if (planning_dir / INDEX_PATH).exists():
+            summary["source"] = "index"
+            with PlanningIndex(planning_dir) as index:
+                index.sync()
+                reporter = ProgressReporter(planning_dir, index=index)
+                summary["phases"] = reporter.get_phase_data()
+                summary["blockers"] = reporter.get_blockers()
+                summary["upcoming"] = len(reporter.get_upcoming_work())
+        else:
+            reporter = ProgressReporter(planning_dir)
+            summary["phases"] = reporter.get_phase_data()
+            summary["blockers"] = reporter.get_blockers()
+            summary["upcoming"] = len(reporter.get_upcoming_work())
+        summary["name"] = ProgressReporter(planning_dir).get_project_info()["name"]
+    except Exception as e:  # one broken project must not sink the portfolio
+        summary["error"] = f"{type(e).__name__}: {e}"
+
+    phases = summary["phases"]
+    summary["phases_complete"] = sum(1 for p in phases if p["status"] == "complete")
+    summary["progress_pct"] = (
+        sum(p["progress_pct"] for p in phases) / len(phases) if phases else 0
+    )
+    current = next((p for p in phases if p["status"] != "complete"), None)
+    summary["current_phase"] = current["num"] if current else None
+    summary["current_status"] = current["status"] if current else "complete"
+    return summary
+
+
+class PortfolioReporter:
+    """Aggregate GSD progress across all projects under a root directory."""
+
+    def __init__(self, root: Path, max_depth: int = 4, workers: Optional[int] = None):
+        self.root = root.resolve()
+        self.max_depth = max_depth
+        self.workers = workers or os.cpu_count() or 1
+
+    def collect(self) -> List[Dict]:
+        """Discover projects and summarize them in a process pool."""
+        with span("load"):
+            projects = discover_projects(self.root, self.max_depth, self.workers)
+
+        with span("parse"):
+            if len(projects) <= 1 or self.workers == 1:
+                return [summarize_project(p) for p in projects]
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(projects))) as pool:
+                return list(pool.map(summarize_project, projects, chunksize=4))
+
+    def aggregate(self, projects: List[Dict]) -> Dict:
+        """Build the portfolio data structure."""
+        blocked = [p for p in projects if p["blockers"]]
+        return {
+            "root": str(self.root),
+            "generated_at": datetime.now().isoformat(),
+            "totals": {
+                "projects": len(projects),
+                "blocked": len(blocked),
+                "blockers": sum(len(p["blockers"]) for p in projects),
+                "complete": sum(1 for p in projects if p["phases"] and p["current_phase"] is None),
+                "errors": sum(1 for p in projects if "error" in p),
+                "mean_progress_pct": round(
+                    sum(p["progress_pct"] for p in projects) / len(projects), 1
+                ) if projects else 0,
+            },
+            "projects": sorted(projects, key=lambda p: (-len(p["blockers"]), p["progress_pct"], p["name"])),
+        }
+
+    def generate_report(self, format: str = "markdown") -> str:
+        """Generate portfolio report."""
+        projects = self.collect()
+
+        with span("analyze"):
+            data = self.aggregate(projects)
+
+        with span("render"):
+            if format == "json":
+                return json.dumps(data, indent=2)
+            return self._generate_markdown_report(data)
+
+    def _generate_markdown_report(self, data: Dict) -> str:
+        """Generate markdown portfolio report."""
+        totals = data["totals"]
+        lines = []
+
+        lines.append("# Portfolio Report")
+        lines.append("")
+        lines.append(f"**Root**: {data['root']}")
+        lines.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        lines.append("")
+
+        lines.append("## Executive Summary")
+        lines.append("")
+        lines.append(f"- **Projects**: {totals['projects']}")
+        lines.append(f"- **Mean Progress**: {totals['mean_progress_pct']:.0f}%")
+        lines.append(f"- **Complete**: {totals['complete']}")
+        lines.append(f"- **Blocked**: {totals['blocked']} ({totals['blockers']} blockers)")
+        if totals["errors"]:
+            lines.append(f"- **Unreadable**: {totals['errors']}")
+        lines.append("")
+
+        if data["projects"]:
+            lines.append("## Projects")
+            lines.append("")
+            lines.append("| Project | Current Phase | Status | Progress | Phases | Blockers |")
+            lines.append("|---------|---------------|--------|----------|--------|----------|")
+            for project in data["projects"]:
+                phase = project["current_phase"] if project["current_phase"] is not None else "-"
+                phases = f"{project['phases_complete']}/{len(project['phases'])}"
+                lines.append(
+                    f"| {project['name']} | {phase} | {project['current_status']} | "
+                    f"{project['progress_pct']:.0f}% | {phases} | {len(project['blockers'])} |"
+                )
+            lines.append("")
+
+        blocked = [p for p in data["projects"] if p["blockers"]]
+        if blocked:
+            lines.append("## ⚠️ Active Blockers")
+            lines.append("")
+            for project in blocked:
+                lines.append(f"### {project['name']}")
+                for blocker in project["blockers"]:
+                    lines.append(f"- [ ] {blocker}")
+                lines.append("")
+
+        errors = [p for p in data["projects"] if "error" in p]
+        if errors:
+            lines.append("## ❌ Unreadable Projects")
+            lines.append("")
+            for project in errors:
+                lines.append(f"- `{project['path']}`: {project['error']}")
+            lines.append("")
+
+        return "\n".join(lines)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Generate and emit the portfolio report."""
+    root = Path(args.root).resolve()
+    if not root.is_dir():
+        print(f"❌ Not a directory: {root}")
+        return 1
+
+    workers = 1 if args.serial else args.workers
+    reporter = PortfolioReporter(root, max_depth=args.max_depth, workers=workers)
+    report = reporter.generate_report(args.format)
+
+    if args.output:
+        args.output.write_text(report)
+        print(f"✅ Report saved to: {args.output}")
+    else:
+        print(report)
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Portfolio: Aggregate progress and blockers across GSD projects",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s ~/repos                       # Markdown report for every project
+  %(prog)s ~/repos --format json         # Machine-readable output
+  %(prog)s ~/repos --max-depth 2         # Only look two levels deep
+  %(prog)s ~/repos --output portfolio.md # Save to file
+        """
+    )
+
+    parser.add_argument("root", nargs="?", default=".", help="Directory to search for projects")
+    parser.add_argument("--format", choices=["markdown", "json"], default="markdown",
+                        help="Output format")
+    parser.add_argument("--output", type=Path, help="Output file")
+    parser.add_argument("--max-depth", type=int, default=4,
+                        help="Maximum directory depth to search (default: 4)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--serial", action="store_true",
+                        help="Summarize projects in-process (for debugging)")
+    add_instrumentation_args(parser)
+
+    args = parser.parse_args()
+
+    with instrument("portfolio", args, project_dir=args.root):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
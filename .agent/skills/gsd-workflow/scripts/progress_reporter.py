@@ -11,12 +11,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 class ProgressReporter:
     """Generate progress reports from GSD artifacts."""
     
-    def __init__(self, planning_dir: Path):
+    def __init__(self, planning_dir: Path, index=None):
         self.planning_dir = planning_dir
+        self.index = index  # Optional PlanningIndex; reads come from SQLite when set
         self.project_file = planning_dir / "PROJECT.md"
         self.roadmap_file = planning_dir / "ROADMAP.md"
         self.state_file = planning_dir / "STATE.md"
@@ -26,29 +29,38 @@ class ProgressReporter:
         if not self.project_file.exists():
             return {"name": "Unknown Project", "vision": ""}
         
-        content = self.project_file.read_text()
-        
-        # Extract title
-        title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-        name = title_match.group(1) if title_match else "Unknown Project"
+        with span("load"):
+            content = self.project_file.read_text()
         
-        # Extract vision
-        vision_match = re.search(r'## Vision\s*\n\s*([^\n]+)', content)
-        vision = vision_match.group(1) if vision_match else ""
+        with span("parse"):
+            # Extract title
+            title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+            name = title_match.group(1) if title_match else "Unknown Project"
+            
+            # Extract vision
+            vision_match = re.search(r'## Vision\s*\n\s*([^\n]+)', content)
+            vision = vision_match.group(1) if vision_match else ""
         
         return {"name": name, "vision": vision}
     
     def get_phase_data(self) -> List[Dict]:
         """Extract phase data from ROADMAP.md and plan files."""
+        if self.index is not None:
+            with span("load"):
+                return self.index.phases()
+        
         if not self.roadmap_file.exists():
             return []
         
-        content = self.roadmap_file.read_text()
+        with span("load"):
+            content = self.roadmap_file.read_text()
         phases = []
         
         # Parse each phase section
         phase_pattern = r'## Phase (\d+):([^\n]+)\n([^#]+)'
-        for match in re.finditer(phase_pattern, content, re.DOTALL):
+        with span("parse"):
+            matches = list(re.finditer(phase_pattern, content, re.DOTALL))
+        for match in matches:
             phase_num = int(match.group(1))
             phase_name = match.group(2).strip()
             section = match.group(3)
@@ -62,8 +74,9 @@ class ProgressReporter:
             requirements = reqs_match.group(1).strip() if reqs_match else ""
             
             # Count plans and completion
-            plans = list(self.planning_dir.glob(f"{phase_num}-*-PLAN.md"))
-            summaries = list(self.planning_dir.glob(f"{phase_num}-*-SUMMARY.md"))
+            with span("load"):
+                plans = list(self.planning_dir.glob(f"{phase_num}-*-PLAN.md"))
+                summaries = list(self.planning_dir.glob(f"{phase_num}-*-SUMMARY.md"))
             
             phases.append({
                 "num": phase_num,
@@ -87,7 +100,8 @@ class ProgressReporter:
             file_time = datetime.fromtimestamp(stat.st_mtime)
             
             # Read first few lines for title
-            content = summary_file.read_text()
+            with span("load"):
+                content = summary_file.read_text()
             title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
             title = title_match.group(1) if title_match else summary_file.name
             
@@ -109,13 +123,19 @@ class ProgressReporter:
     
     def get_blockers(self) -> List[str]:
         """Extract blockers from STATE.md."""
+        if self.index is not None:
+            with span("load"):
+                return self.index.blockers()
+        
         if not self.state_file.exists():
             return []
         
-        content = self.state_file.read_text()
+        with span("load"):
+            content = self.state_file.read_text()
         
         blockers = []
-        blockers_section = re.search(r'## Blockers\s*\n([^#]+)', content)
+        with span("parse"):
+            blockers_section = re.search(r'## Blockers\s*\n([^#]+)', content)
         if blockers_section:
             lines = blockers_section.group(1).strip().split('\n')
             for line in lines:
@@ -127,6 +147,10 @@ class ProgressReporter:
     
     def get_upcoming_work(self) -> List[Dict]:
         """Get upcoming work from plans."""
+        if self.index is not None:
+            with span("load"):
+                return self.index.upcoming_work()
+        
         upcoming = []
         
         for plan_file in sorted(self.planning_dir.glob("*-*-PLAN.md")):
@@ -135,15 +159,17 @@ class ProgressReporter:
             if summary_file.exists():
                 continue  # Already completed
             
-            content = plan_file.read_text()
+            with span("load"):
+                content = plan_file.read_text()
             phase = self._extract_phase_from_file(plan_file.name)
             
-            # Extract overview
-            overview_match = re.search(r'<phase_name>([^<]+)</phase_name>', content)
-            name = overview_match.group(1).strip() if overview_match else plan_file.name
-            
-            # Count tasks
-            task_count = len(re.findall(r'<task\s+', content))
+            with span("parse"):
+                # Extract overview
+                overview_match = re.search(r'<phase_name>([^<]+)</phase_name>', content)
+                name = overview_match.group(1).strip() if overview_match else plan_file.name
+                
+                # Count tasks
+                task_count = len(re.findall(r'<task\s+', content))
             
             upcoming.append({
                 "phase": phase,
@@ -329,6 +355,35 @@ class ProgressReporter:
         return "=" * filled + "-" * empty
 
 
+def run(args: argparse.Namespace) -> int:
+    """Generate and emit the progress report."""
+    project_path = Path(args.dir).resolve()
+    planning_dir = project_path / ".planning"
+    
+    if not planning_dir.exists():
+        print(f"❌ GSD not initialized in {project_path}")
+        return 1
+    
+    if args.index:
+        from planning_index import open_index
+        with open_index(planning_dir) as index:
+            reporter = ProgressReporter(planning_dir, index=index)
+            with span("render"):
+                report = reporter.generate_report(args.format)
+    else:
+        reporter = ProgressReporter(planning_dir)
+        with span("render"):
+            report = reporter.generate_report(args.format)
+    
+    if args.output:
+        args.output.write_text(report)
+        print(f"✅ Report saved to: {args.output}")
+    else:
+        print(report)
+    
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Progress Reporter: Generate detailed progress reports",
@@ -347,26 +402,14 @@ Examples:
                         default="markdown", help="Output format")
     parser.add_argument("--output", type=Path, help="Output file")
     parser.add_argument("--days", type=int, default=7, help="Days of activity to include")
+    parser.add_argument("--index", action="store_true",
+                        help="Read phases, blockers and plans from the SQLite planning index")
+    add_instrumentation_args(parser)
     
     args = parser.parse_args()
     
-    project_path = Path(args.dir).resolve()
-    planning_dir = project_path / ".planning"
-    
-    if not planning_dir.exists():
-        print(f"❌ GSD not initialized in {project_path}")
-        return 1
-    
-    reporter = ProgressReporter(planning_dir)
-    report = reporter.generate_report(args.format)
-    
-    if args.output:
-        args.output.write_text(report)
-        print(f"✅ Report saved to: {args.output}")
-    else:
-        print(report)
-    
-    return 0
+    with instrument("progress_reporter", args):
+        return run(args)
 
 
 if __name__ == "__main__":
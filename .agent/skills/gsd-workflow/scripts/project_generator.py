@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 class ProjectGenerator:
     """Generate PROJECT.md from interactive input."""
@@ -257,7 +259,8 @@ class ProjectGenerator:
             "definition_of_done": ["Core features implemented", "Tests passing"],
         }
         
-        return self.generate_markdown()
+        with span("render"):
+            return self.generate_markdown()
     
     def save(self, content: str) -> Path:
         """Save generated PROJECT.md."""
@@ -273,25 +276,8 @@ class ProjectGenerator:
         return project_file
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Project Generator: Create PROJECT.md interactively",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s                           # Interactive mode
-  %(prog)s --quick "My App" "A todo app" --stack nextjs,fastapi,postgres
-        """
-    )
-    
-    parser.add_argument("--dir", default=".", help="Project directory")
-    parser.add_argument("--quick", metavar="NAME", help="Quick mode: project name")
-    parser.add_argument("--description", help="Quick mode: description")
-    parser.add_argument("--stack", help="Quick mode: stack (frontend,backend,database)")
-    parser.add_argument("--output", type=Path, help="Output file (default: .planning/PROJECT.md)")
-    
-    args = parser.parse_args()
-    
+def run(args: argparse.Namespace) -> int:
+    """Generate PROJECT.md in quick or interactive mode."""
     project_path = Path(args.dir).resolve()
     planning_dir = project_path / ".planning"
     
@@ -343,5 +329,29 @@ Examples:
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Project Generator: Create PROJECT.md interactively",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                           # Interactive mode
+  %(prog)s --quick "My App" "A todo app" --stack nextjs,fastapi,postgres
+        """
+    )
+    
+    parser.add_argument("--dir", default=".", help="Project directory")
+    parser.add_argument("--quick", metavar="NAME", help="Quick mode: project name")
+    parser.add_argument("--description", help="Quick mode: description")
+    parser.add_argument("--stack", help="Quick mode: stack (frontend,backend,database)")
+    parser.add_argument("--output", type=Path, help="Output file (default: .planning/PROJECT.md)")
+    add_instrumentation_args(parser)
+    
+    args = parser.parse_args()
+    
+    with instrument("project_generator", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -10,6 +10,8 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 def sanitize_filename(name: str) -> str:
     """Convert task description to safe filename."""
@@ -143,7 +145,8 @@ def run_quick_task(project_dir: str, task_desc: str, full: bool = False) -> None
     
     # Create quick plan
     print("📝 Creating plan...")
-    plan_file = create_quick_plan(planning_dir, task_desc, full)
+    with span("render"):
+        plan_file = create_quick_plan(planning_dir, task_desc, full)
     print(f"   Created: {plan_file.relative_to(project_path)}")
     print()
     
@@ -184,9 +187,11 @@ def main():
         action="store_true", 
         help="Full mode with verification (slower, more thorough)"
     )
+    add_instrumentation_args(parser)
     
     args = parser.parse_args()
-    run_quick_task(args.dir, args.task, args.full)
+    with instrument("quick_task", args):
+        run_quick_task(args.dir, args.task, args.full)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 class ResearchAggregator:
     """Aggregate and synthesize research notes."""
@@ -50,17 +52,19 @@ class ResearchAggregator:
     
     def parse_research_file(self, filepath: Path) -> Dict:
         """Parse a research file and extract structured data."""
-        content = filepath.read_text()
-        
-        research = {
-            "file": filepath.name,
-            "title": self._extract_title(content),
-            "category": self._detect_category(filepath.name, content),
-            "sources": self._extract_sources(content),
-            "key_findings": self._extract_findings(content),
-            "recommendations": self._extract_recommendations(content),
-            "raw_content": content
-        }
+        with span("load"):
+            content = filepath.read_text()
+        
+        with span("parse"):
+            research = {
+                "file": filepath.name,
+                "title": self._extract_title(content),
+                "category": self._detect_category(filepath.name, content),
+                "sources": self._extract_sources(content),
+                "key_findings": self._extract_findings(content),
+                "recommendations": self._extract_recommendations(content),
+                "raw_content": content
+            }
         
         return research
     
@@ -168,7 +172,8 @@ class ResearchAggregator:
     
     def generate_report(self, phase: Optional[int] = None, output: Optional[Path] = None) -> str:
         """Generate aggregated research report."""
-        data = self.aggregate(phase)
+        with span("analyze"):
+            data = self.aggregate(phase)
         
         if "error" in data:
             return f"❌ {data['error']}"
@@ -310,29 +315,8 @@ class ResearchAggregator:
         return content
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Research Aggregator: Collect and synthesize research notes",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s                           # Aggregate all research
-  %(prog)s --phase 1                 # Aggregate phase 1 research
-  %(prog)s --phase 2 --output research-summary.md
-  %(prog)s --phase 3 --planning-input  # Generate planning input
-        """
-    )
-    
-    parser.add_argument("--dir", default=".", help="Project directory")
-    parser.add_argument("--phase", type=int, help="Phase number to aggregate")
-    parser.add_argument("--output", type=Path, help="Output file for full report")
-    parser.add_argument("--planning-input", action="store_true", 
-                        help="Generate concise input for planning")
-    parser.add_argument("--list", action="store_true", 
-                        help="List available research files")
-    
-    args = parser.parse_args()
-    
+def run(args: argparse.Namespace) -> int:
+    """Aggregate research notes as requested."""
     project_path = Path(args.dir).resolve()
     planning_dir = project_path / ".planning"
     
@@ -366,5 +350,33 @@ Examples:
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Research Aggregator: Collect and synthesize research notes",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                           # Aggregate all research
+  %(prog)s --phase 1                 # Aggregate phase 1 research
+  %(prog)s --phase 2 --output research-summary.md
+  %(prog)s --phase 3 --planning-input  # Generate planning input
+        """
+    )
+    
+    parser.add_argument("--dir", default=".", help="Project directory")
+    parser.add_argument("--phase", type=int, help="Phase number to aggregate")
+    parser.add_argument("--output", type=Path, help="Output file for full report")
+    parser.add_argument("--planning-input", action="store_true", 
+                        help="Generate concise input for planning")
+    parser.add_argument("--list", action="store_true", 
+                        help="List available research files")
+    add_instrumentation_args(parser)
+    
+    args = parser.parse_args()
+    
+    with instrument("research_aggregator", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
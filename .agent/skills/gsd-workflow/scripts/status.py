@@ -9,6 +9,8 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 def parse_roadmap(planning_dir: Path) -> dict:
     """Parse ROADMAP.md to extract phase statuses."""
@@ -16,14 +18,17 @@ def parse_roadmap(planning_dir: Path) -> dict:
     if not roadmap_path.exists():
         return {"phases": [], "current": None}
     
-    content = roadmap_path.read_text()
+    with span("load"):
+        content = roadmap_path.read_text()
     phases = []
     current_phase = None
     
     # Parse phase headers
     phase_pattern = r'## Phase (\d+):([^\n]+)\n\s*\*\*Goal\*\*:[^\n]*\n\s*\*\*Requirements\*\*:([^\n]*)\n\s*\*\*Status\*\*:([^\n]*)'
     
-    for match in re.finditer(phase_pattern, content, re.MULTILINE):
+    with span("parse"):
+        matches = list(re.finditer(phase_pattern, content, re.MULTILINE))
+    for match in matches:
         num = int(match.group(1))
         name = match.group(2).strip()
         reqs = match.group(3).strip()
@@ -49,7 +54,8 @@ def parse_state(planning_dir: Path) -> dict:
     if not state_path.exists():
         return {"status": "unknown", "blockers": []}
     
-    content = state_path.read_text()
+    with span("load"):
+        content = state_path.read_text()
     
     # Extract current status
     status_match = re.search(r'\*\*Status\*\*:\s*([^\n]+)', content)
@@ -88,8 +94,12 @@ def count_todos(planning_dir: Path) -> int:
     return len(list(todos_dir.glob("*.md")))
 
 
-def show_status(project_dir: str) -> None:
-    """Display project status."""
+def show_status(project_dir: str, use_index: bool = False) -> None:
+    """Display project status.
+    
+    With use_index, phases, state, plans and todos are read from the SQLite
+    planning index (synced incrementally) instead of re-parsing every file.
+    """
     project_path = Path(project_dir).resolve()
     planning_dir = project_path / ".planning"
     
@@ -105,9 +115,18 @@ def show_status(project_dir: str) -> None:
     print(f"Planning: {planning_dir}")
     print()
     
+    index = None
+    if use_index:
+        from planning_index import open_index
+        index = open_index(planning_dir)
+    
     # Parse roadmap
-    roadmap = parse_roadmap(planning_dir)
-    state = parse_state(planning_dir)
+    if index is not None:
+        roadmap = {"phases": index.phases(), "current": index.current_phase()}
+        state = index.state()
+    else:
+        roadmap = parse_roadmap(planning_dir)
+        state = parse_state(planning_dir)
     
     # Show phases progress
     if roadmap["phases"]:
@@ -149,22 +168,26 @@ def show_status(project_dir: str) -> None:
     # Show current phase details
     if roadmap["current"]:
         current = roadmap["current"]
-        plans = find_plan_files(planning_dir, current)
-        summaries = find_summary_files(planning_dir, current)
+        if index is not None:
+            plans = [(p["file"], p["done"]) for p in index.plans(current)]
+        else:
+            summaries = {s.name.replace("SUMMARY", "PLAN") for s in find_summary_files(planning_dir, current)}
+            plans = [(p.name, p.name in summaries) for p in find_plan_files(planning_dir, current)]
+        completed = sum(1 for _, done in plans if done)
         
         print(f"📁 PHASE {current} DETAILS")
         print("-" * 40)
-        print(f"   Plans: {len(plans)} total, {len(summaries)} complete")
+        print(f"   Plans: {len(plans)} total, {completed} complete")
         
-        if plans:
-            for plan in plans:
-                done = any(s.name.replace("SUMMARY", "PLAN") == plan.name for s in summaries)
-                icon = "✅" if done else "⏳"
-                print(f"   {icon} {plan.name}")
+        for name, done in plans:
+            icon = "✅" if done else "⏳"
+            print(f"   {icon} {name}")
         print()
     
     # Show todos
-    todo_count = count_todos(planning_dir)
+    todo_count = index.todo_count() if index is not None else count_todos(planning_dir)
+    if index is not None:
+        index.close()
     if todo_count > 0:
         print(f"📝 Captured Todos: {todo_count}")
         print()
@@ -208,9 +231,13 @@ def show_status(project_dir: str) -> None:
 def main():
     parser = argparse.ArgumentParser(description="Show GSD project status")
     parser.add_argument("--dir", default=".", help="Project directory (default: current)")
+    parser.add_argument("--index", action="store_true",
+                        help="Read from the SQLite planning index (.planning/.cache)")
+    add_instrumentation_args(parser)
     
     args = parser.parse_args()
-    show_status(args.dir)
+    with instrument("status", args):
+        show_status(args.dir, use_index=args.index)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Telemetry: Opt-in profiling and timing spans shared by the GSD scripts.
+
+Every script accepts --profile (cProfile dump) and --timings (structured spans
+appended as JSON lines to .telemetry/gsd-timings.jsonl). Library code marks its
+phases with span("load"), span("parse"), span("analyze") and span("render");
+spans are no-ops unless a run was started with --timings.
+"""
+
+import argparse
+import cProfile
+import json
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+TELEMETRY_DIR = ".telemetry"
+TIMINGS_FILE = "gsd-timings.jsonl"
+PROFILES_DIR = "profiles"
+
+# Phases every script reports, in pipeline order
+STANDARD_SPANS = ["load", "parse", "analyze", "render"]
+
+
+class SpanRecorder:
+    """Collect timing spans for a single script run."""
+
+    def __init__(self, command: str):
+        self.command = command
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started_at = datetime.now()
+        self.spans: Dict[Tuple[str, Optional[int]], Dict] = {}
+        self._stack: List[Dict] = []
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a span nested under the current one.
+
+        Repeated spans with the same name under the same parent span (e.g.
+        one "load" per plan file) are merged into a single record with a
+        call count. Each record has an ``id``; children point to it with
+        ``parent_id``, since two parents can share a name.
+        """
+        parent = self._stack[-1] if self._stack else None
+        parent_id = parent["id"] if parent else None
+        entry = self.spans.get((name, parent_id))
+        if entry is None:
+            entry = self.spans[(name, parent_id)] = {
+                "id": len(self.spans) + 1,
+                "span": name,
+                "parent": parent["span"] if parent else None,
+                "parent_id": parent_id,
+                "calls": 0,
+                "duration_ms": 0.0,
+            }
+        self._stack.append(entry)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._stack.pop()
+            entry["calls"] += 1
+            entry["duration_ms"] += elapsed_ms
+
+    def records(self) -> List[Dict]:
+        """Return spans as flat JSON-serialisable records."""
+        base = {
+            "run_id": self.run_id,
+            "command": self.command,
+            "timestamp": self.started_at.isoformat(timespec="seconds"),
+        }
+        return [
+            {**base, **entry, "duration_ms": round(entry["duration_ms"], 3)}
+            for entry in self.spans.values()
+        ]
+
+    def write(self, telemetry_dir: Path) -> Path:
+        """Append this run's spans to the timings file."""
+        telemetry_dir.mkdir(parents=True, exist_ok=True)
+        timings_path = telemetry_dir / TIMINGS_FILE
+        with timings_path.open("a", encoding="utf-8") as handle:
+            for record in self.records():
+                handle.write(json.dumps(record) + "\n")
+        return timings_path
+
+
+# Recorder for the run in progress (None when --timings is off)
+_active: Optional[SpanRecorder] = None
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a phase of the current run; does nothing when timings are off."""
+    if _active is None:
+        yield
+        return
+    with _active.span(name):
+        yield
+
+
+def add_instrumentation_args(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --profile and --timings flags to a script's parser."""
+    group = parser.add_argument_group("instrumentation")
+    group.add_argument("--profile", action="store_true",
+                       help=f"Write a cProfile dump to {TELEMETRY_DIR}/{PROFILES_DIR}/")
+    group.add_argument("--timings", action="store_true",
+                       help=f"Append phase timings to {TELEMETRY_DIR}/{TIMINGS_FILE}")
+
+
+def _profile_path(telemetry_dir: Path, command: str) -> Path:
+    """Build a unique path for a cProfile dump."""
+    profiles_dir = telemetry_dir / PROFILES_DIR
+    profiles_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return profiles_dir / f"{command}-{stamp}-{uuid.uuid4().hex[:6]}.prof"
+
+
+@contextmanager
+def instrument(command: str, args: argparse.Namespace,
+               project_dir: Optional[str] = None) -> Iterator[Optional[SpanRecorder]]:
+    """Run a script body with the instrumentation requested on the command line.
+
+    Telemetry is written under <project_dir>/.telemetry, where project_dir
+    defaults to the script's --dir argument (or the current directory).
+    """
+    global _active
+
+    profile = getattr(args, "profile", False)
+    timings = getattr(args, "timings", False)
+    if not profile and not timings:
+        yield None
+        return
+
+    root = project_dir if project_dir is not None else getattr(args, "dir", ".")
+    telemetry_dir = Path(root).resolve() / TELEMETRY_DIR
+
+    recorder = SpanRecorder(command) if timings else None
+    profiler = cProfile.Profile() if profile else None
+    previous = _active
+    _active = recorder
+
+    if profiler:
+        profiler.enable()
+    try:
+        if recorder:
+            with recorder.span("total"):
+                yield recorder
+        else:
+            yield None
+    finally:
+        if profiler:
+            profiler.disable()
+            profile_path = _profile_path(telemetry_dir, command)
+            profiler.dump_stats(str(profile_path))
+            print(f"📈 Profile saved to: {profile_path}", file=sys.stderr)
+        _active = previous
+        if recorder:
+            try:
+                recorder.write(telemetry_dir)
+            except OSError as e:
+                print(f"⚠️  Could not write timings: {e}", file=sys.stderr)
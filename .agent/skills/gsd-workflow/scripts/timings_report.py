@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Timings Report: Aggregate --timings spans across runs of the GSD scripts.
+Shows which phase (load, parse, analyze, render) dominates each command.
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from telemetry import (
+    STANDARD_SPANS,
+    TELEMETRY_DIR,
+    TIMINGS_FILE,
+    add_instrumentation_args,
+    instrument,
+    span,
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class TimingsReport:
+    """Aggregate timing spans written by telemetry.instrument()."""
+
+    def __init__(self, telemetry_dir: Path):
+        self.telemetry_dir = telemetry_dir
+        self.timings_file = telemetry_dir / TIMINGS_FILE
+
+    def load_records(self, command: Optional[str] = None) -> List[Dict]:
+        """Read span records, skipping malformed lines."""
+        if not self.timings_file.exists():
+            return []
+
+        records = []
+        with self.timings_file.open(encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(record, dict) or "span" not in record:
+                    continue
+                if command and record.get("command") != command:
+                    continue
+                records.append(record)
+
+        return records
+
+    def aggregate(self, command: Optional[str] = None) -> Dict[str, Dict]:
+        """Aggregate spans per command, slowest phase first.
+
+        Self time excludes child spans, so a "render" span that triggers
+        lazy loading is not charged for the nested "load" work.
+        """
+        records = self.load_records(command)
+
+        # Sum child durations per (run, parent span) to derive self time.
+        # Spans are identified by id; files written before spans had ids
+        # fall back to the parent's name
+        child_ms: Dict[tuple, float] = defaultdict(float)
+        for record in records:
+            parent = record.get("parent_id", record.get("parent"))
+            if parent:
+                child_ms[(record["run_id"], parent)] += record.get("duration_ms", 0.0)
+
+        # command -> span -> run_id -> self ms
+        per_run: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(lambda: defaultdict(dict))
+        calls: Dict[tuple, int] = defaultdict(int)
+        totals: Dict[str, Dict[str, float]] = defaultdict(dict)
+
+        for record in records:
+            cmd = record.get("command", "unknown")
+            name = record["span"]
+            run_id = record.get("run_id", "")
+            duration = record.get("duration_ms", 0.0)
+
+            if name == "total":
+                totals[cmd][run_id] = duration
+                continue
+
+            self_ms = max(0.0, duration - child_ms.get((run_id, record.get("id", name)), 0.0))
+            per_run[cmd][name][run_id] = per_run[cmd][name].get(run_id, 0.0) + self_ms
+            calls[(cmd, name)] += record.get("calls", 1)
+
+        result = {}
+        for cmd in sorted(set(per_run) | set(totals)):
+            run_count = len(totals[cmd]) or max((len(r) for r in per_run[cmd].values()), default=0)
+            total_ms = sum(totals[cmd].values())
+            phases = []
+            for name, runs in per_run[cmd].items():
+                values = list(runs.values())
+                phase_total = sum(values)
+                phases.append({
+                    "span": name,
+                    "runs": len(values),
+                    "calls": calls[(cmd, name)],
+                    "total_ms": round(phase_total, 3),
+                    "mean_ms": round(phase_total / len(values), 3),
+                    "p95_ms": round(percentile(values, 95), 3),
+                    "max_ms": round(max(values), 3),
+                    "share_pct": round(phase_total / total_ms * 100, 1) if total_ms else 0.0,
+                })
+            phases.sort(key=lambda p: p["total_ms"], reverse=True)
+            result[cmd] = {
+                "runs": run_count,
+                "total_ms": round(total_ms, 3),
+                "mean_run_ms": round(total_ms / run_count, 3) if run_count else 0.0,
+                "phases": phases,
+            }
+
+        return result
+
+    def generate_report(self, format: str = "markdown", command: Optional[str] = None,
+                        top: int = 5) -> str:
+        """Generate timings report."""
+        with span("analyze"):
+            data = self.aggregate(command)
+
+        with span("render"):
+            if format == "json":
+                return json.dumps(data, indent=2)
+            return self._generate_markdown_report(data, top)
+
+    def _generate_markdown_report(self, data: Dict, top: int) -> str:
+        """Generate markdown timings report."""
+        lines = []
+        lines.append("# GSD Timings Report")
+        lines.append("")
+
+        if not data:
+            lines.append("No timings recorded yet. Run any GSD script with --timings.")
+            lines.append("")
+            return "\n".join(lines)
+
+        # Slowest commands first
+        commands = sorted(data.items(), key=lambda item: item[1]["mean_run_ms"], reverse=True)
+
+        lines.append("## Commands")
+        lines.append("")
+        lines.append("| Command | Runs | Mean run (ms) | Slowest phase |")
+        lines.append("|---------|------|---------------|---------------|")
+        for cmd, stats in commands:
+            slowest = stats["phases"][0]["span"] if stats["phases"] else "-"
+            lines.append(f"| {cmd} | {stats['runs']} | {stats['mean_run_ms']:.1f} | {slowest} |")
+        lines.append("")
+
+        for cmd, stats in commands:
+            lines.append(f"## {cmd}")
+            lines.append("")
+            lines.append("| Phase | Runs | Calls | Mean (ms) | p95 (ms) | Max (ms) | Share |")
+            lines.append("|-------|------|-------|-----------|----------|----------|-------|")
+            for phase in stats["phases"][:top]:
+                marker = "" if phase["span"] in STANDARD_SPANS else " *"
+                lines.append(
+                    f"| {phase['span']}{marker} | {phase['runs']} | {phase['calls']} | "
+                    f"{phase['mean_ms']:.1f} | {phase['p95_ms']:.1f} | "
+                    f"{phase['max_ms']:.1f} | {phase['share_pct']:.0f}% |"
+                )
+            lines.append("")
+
+        lines.append(f"*Data source: {self.timings_file}* (* = custom span)")
+        lines.append("")
+
+        return "\n".join(lines)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Print the aggregated timings report."""
+    project_path = Path(args.dir).resolve()
+    report = TimingsReport(project_path / TELEMETRY_DIR)
+
+    output = report.generate_report(args.format, command=args.command, top=args.top)
+
+    if args.output:
+        args.output.write_text(output)
+        print(f"✅ Report saved to: {args.output}")
+    else:
+        print(output)
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Timings Report: Show the slowest phases per GSD command",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                           # Markdown summary of all commands
+  %(prog)s --command validate_plan   # Only one command
+  %(prog)s --format json             # Machine-readable output
+        """
+    )
+
+    parser.add_argument("--dir", default=".", help="Project directory")
+    parser.add_argument("--command", help="Only include this command")
+    parser.add_argument("--format", choices=["markdown", "json"], default="markdown",
+                        help="Output format")
+    parser.add_argument("--top", type=int, default=5, help="Phases to show per command")
+    parser.add_argument("--output", type=Path, help="Output file")
+    add_instrumentation_args(parser)
+
+    args = parser.parse_args()
+
+    with instrument("timings_report", args):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,33 +4,66 @@ Validate GSD plan files for correct XML structure and content.
 """
 
 import argparse
-import re
+import json
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional
+
+from plan_rules import ERROR, RULES, WARNING, RuleContext, RuleEngine
+from telemetry import add_instrumentation_args, instrument, span
+
+
+class _PlanTooLarge(Exception):
+    """Raised while streaming a plan that exceeds the size limit."""
+    
+    def __init__(self, size: int):
+        super().__init__(size)
+        self.size = size
 
 
 class PlanValidator:
-    """Validator for GSD plan XML structure."""
+    """Validator for GSD plan XML structure.
     
-    REQUIRED_TASK_FIELDS = ["name", "action"]
-    OPTIONAL_TASK_FIELDS = ["files", "verify", "done"]
-    VALID_TASK_TYPES = ["auto", "manual"]
-    VALID_PRIORITIES = ["1", "2", "3"]
+    Checks are rules in plan_rules.py, run together in a single pass over
+    the plan by a RuleEngine (configurable via .planning/config.json).
+    """
     
-    def __init__(self, plan_path: Path):
+    STRUCTURE_RULES = ("plan-root", "balanced-tags")
+    CHUNK_SIZE = 1024 * 1024  # characters per read when streaming a plan
+    MAX_FILE_MB = 64  # plans above this are rejected without being parsed
+    
+    def __init__(self, plan_path: Path, engine: Optional[RuleEngine] = None,
+                 max_file_mb: Optional[float] = None):
         self.plan_path = plan_path
+        self.engine = engine or RuleEngine.from_config()
+        max_file_mb = max_file_mb or self.engine.max_file_mb or self.MAX_FILE_MB
+        self.max_bytes = int(max_file_mb * 1024 * 1024)
         self.errors: List[str] = []
         self.warnings: List[str] = []
     
     def validate(self) -> bool:
-        """Run all validations. Returns True if valid."""
+        """Run all validations. Returns True if valid.
+        
+        The plan is streamed in chunks, so memory stays bounded no matter
+        how large the file is.
+        """
         if not self.plan_path.exists():
             self.errors.append(f"File not found: {self.plan_path}")
             return False
         
         try:
-            content = self.plan_path.read_text(encoding='utf-8', errors='replace')
+            with span("load"):
+                size = self.plan_path.stat().st_size
+            if size > self.max_bytes:
+                self._too_large(size)
+                return False
+            
+            # Single tokenizing pass; every enabled rule sees the same events
+            with span("parse"):
+                ctx = self.engine.run_stream(self._read_chunks())
+        except _PlanTooLarge as e:
+            self._too_large(e.size)
+            return False
         except PermissionError:
             self.errors.append(f"Permission denied: {self.plan_path}")
             return False
@@ -38,124 +71,57 @@ class PlanValidator:
             self.errors.append(f"Error reading file: {e}")
             return False
         
-        # Basic structure checks
-        self._check_xml_structure(content)
-        self._check_required_elements(content)
-        self._check_tasks(content)
-        self._check_size_limits(content)
-        self._check_best_practices(content)
+        with span("analyze"):
+            self._collect(ctx)
         
         return len(self.errors) == 0
     
-    def _check_xml_structure(self, content: str) -> None:
-        """Check basic XML structure."""
-        # Check for plan root element
-        if not re.search(r'<plan\s+phase="\d+"\s+plan="\d+">', content):
-            self.errors.append("Missing or malformed <plan phase=\"N\" plan=\"M\"> root element")
-        
-        # Check closing tag
-        if "</plan>" not in content:
-            self.errors.append("Missing closing </plan> tag")
-        
-        # Check for unclosed tags (simple check)
-        open_tags = re.findall(r'<(\w+)[^>]*(?<!/)>', content)
-        close_tags = re.findall(r'</(\w+)>', content)
-        
-        # Self-closing tags
-        self_closing = re.findall(r'<(\w+)[^>]*/>', content)
-        
-        # Count mismatches (very basic)
-        for tag in set(open_tags):
-            if tag in ['task', 'br', 'hr']:  # Self-closing allowed
-                continue
-            open_count = open_tags.count(tag)
-            close_count = close_tags.count(tag)
-            if open_count != close_count:
-                self.errors.append(f"Unbalanced tags: <{tag}> opened {open_count} times, closed {close_count} times")
-    
-    def _check_required_elements(self, content: str) -> None:
-        """Check for required plan elements."""
-        if "<overview>" not in content:
-            self.errors.append("Missing <overview> section")
-        
-        if "<tasks>" not in content:
-            self.errors.append("Missing <tasks> section")
-        
-        # Check overview sub-elements
-        if "<phase_name>" not in content:
-            self.warnings.append("Missing <phase_name> in overview")
-        
-        if "<goal>" not in content:
-            self.warnings.append("Missing <goal> in overview")
-    
-    def _check_tasks(self, content: str) -> None:
-        """Validate task definitions."""
-        # Find all task elements
-        task_pattern = r'<task\s+type="(\w+)"\s+priority="(\d+)"[^>]*>'
-        tasks = re.findall(task_pattern, content)
-        
-        if not tasks:
-            self.errors.append("No tasks found in plan")
-            return
-        
-        for i, (task_type, priority) in enumerate(tasks, 1):
-            if task_type not in self.VALID_TASK_TYPES:
-                self.errors.append(f"Task {i}: Invalid type '{task_type}'. Use 'auto' or 'manual'")
-            
-            if priority not in self.VALID_PRIORITIES:
-                self.warnings.append(f"Task {i}: Unusual priority '{priority}'. Use 1 (blocking), 2 (important), or 3 (nice-to-have)")
-        
-        # Check for task content
-        task_content_pattern = r'<task[^>]*>(.*?)</task>'
-        task_contents = re.findall(task_content_pattern, content, re.DOTALL)
-        
-        for i, task_content in enumerate(task_contents, 1):
-            for field in self.REQUIRED_TASK_FIELDS:
-                if f"<{field}>" not in task_content:
-                    self.errors.append(f"Task {i}: Missing <{field}>")
-            
-            # Check for empty action
-            action_match = re.search(r'<action>(.*?)</action>', task_content, re.DOTALL)
-            if action_match:
-                action_content = action_match.group(1).strip()
-                if action_content in ['', 'TODO', 'TODO:']:
-                    self.warnings.append(f"Task {i}: Action is empty or placeholder")
-    
-    def _check_size_limits(self, content: str) -> None:
-        """Check plan size limits."""
-        lines = content.split('\n')
-        line_count = len(lines)
-        
-        if line_count > 150:
-            self.warnings.append(f"Plan is {line_count} lines (recommended: < 150). Consider splitting into multiple plans.")
-        
-        # Check individual task sizes
-        task_pattern = r'<task[^>]*>(.*?)</task>'
-        task_contents = re.findall(task_pattern, content, re.DOTALL)
-        
-        for i, task_content in enumerate(task_contents, 1):
-            task_lines = task_content.count('\n')
-            if task_lines > 50:
-                self.warnings.append(f"Task {i} is {task_lines} lines (recommended: < 50). Consider breaking into smaller tasks.")
-    
-    def _check_best_practices(self, content: str) -> None:
-        """Check for best practices."""
-        # Check for verify steps
-        if "<verify>" not in content:
-            self.warnings.append("No verification steps found. Add <verify> to tasks.")
-        
-        # Check for dependencies section
-        if "<dependencies>" not in content:
-            self.warnings.append("No <dependencies> section. Add if this plan depends on others.")
+    def _read_chunks(self) -> Iterator[str]:
+        """Yield the plan in chunks, aborting if it grows past the size limit."""
+        read = 0
+        with open(self.plan_path, encoding='utf-8', errors='replace') as handle:
+            while True:
+                with span("load"):
+                    chunk = handle.read(self.CHUNK_SIZE)
+                if not chunk:
+                    return
+                read += len(chunk)
+                if read > self.max_bytes:
+                    raise _PlanTooLarge(read)
+                yield chunk
+    
+    def _too_large(self, size: int) -> None:
+        self.errors.append(
+            f"Plan is {size / (1024 * 1024):.1f} MB (limit: {self.max_bytes / (1024 * 1024):.0f} MB); "
+            "not validated. Split it into smaller plans."
+        )
+    
+    def validate_content(self, content: str) -> bool:
+        """Validate already-loaded plan content. Returns True if valid."""
+        with span("parse"):
+            ctx = self.engine.run(content)
+        with span("analyze"):
+            self._collect(ctx)
         
-        # Check for done criteria in auto tasks
-        auto_tasks = re.findall(r'<task\s+type="auto"[^>]*>(.*?)</task>', content, re.DOTALL)
-        for i, task in enumerate(auto_tasks, 1):
-            if "<done>" not in task:
-                self.warnings.append(f"Auto task {i}: Missing <done> criteria (completion definition)")
+        return len(self.errors) == 0
+    
+    def _check_xml_structure(self, content: str) -> None:
+        """Check basic XML structure (root element and tag balance) only."""
+        structural = [r for r in self.engine.rules if r.id in self.STRUCTURE_RULES]
+        self._collect(RuleEngine(structural).run(content))
+    
+    def _collect(self, ctx: RuleContext) -> None:
+        """Add a rule run's diagnostics to this validator."""
+        self.errors.extend(ctx.messages(ERROR))
+        self.warnings.extend(ctx.messages(WARNING))
     
     def report(self) -> None:
         """Print validation report."""
+        with span("render"):
+            self._print_report()
+    
+    def _print_report(self) -> None:
+        """Write the validation report to stdout."""
         print(f"\n{'='*60}")
         print(f"📋 Plan Validation: {self.plan_path.name}")
         print(f"{'='*60}")
@@ -180,7 +146,30 @@ class PlanValidator:
         print(f"{'='*60}\n")
 
 
-def validate_all_plans(planning_dir: Path) -> None:
+def load_rule_engine(planning_dir: Path, timed: bool = False) -> RuleEngine:
+    """Build the rule engine from .planning/config.json (defaults if absent)."""
+    config_path = planning_dir / "config.json"
+    config: Dict = {}
+    if config_path.exists():
+        try:
+            config = json.loads(config_path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  Ignoring unreadable {config_path.name}: {e}")
+    return RuleEngine.from_config(config, base_dir=planning_dir, timed=timed)
+
+
+def print_rule_timings(engine: RuleEngine) -> None:
+    """Print per-rule time, slowest first."""
+    print(f"\n{'='*60}")
+    print("⏱️  RULE TIMINGS")
+    print(f"{'='*60}")
+    for row in engine.timing_report():
+        print(f"   {row['rule']:<24} {row['ms']:>10.3f} ms  ({row['calls']} calls)")
+    print()
+
+
+def validate_all_plans(planning_dir: Path, engine: Optional[RuleEngine] = None,
+                       max_file_mb: Optional[float] = None) -> None:
     """Validate all plan files in the planning directory."""
     plan_files = sorted(planning_dir.glob("*-*-PLAN.md"))
     quick_plans = sorted((planning_dir / "quick").glob("*-PLAN.md")) if (planning_dir / "quick").exists() else []
@@ -195,9 +184,10 @@ def validate_all_plans(planning_dir: Path) -> None:
     
     total_errors = 0
     total_warnings = 0
+    engine = engine or load_rule_engine(planning_dir)
     
     for plan_file in all_plans:
-        validator = PlanValidator(plan_file)
+        validator = PlanValidator(plan_file, engine, max_file_mb)
         validator.validate()
         validator.report()
         total_errors += len(validator.errors)
@@ -208,14 +198,8 @@ def validate_all_plans(planning_dir: Path) -> None:
     print(f"{'='*60}\n")
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Validate GSD plan files")
-    parser.add_argument("plan", nargs="?", help="Specific plan file to validate")
-    parser.add_argument("--dir", default=".", help="Project directory (default: current)")
-    parser.add_argument("--all", action="store_true", help="Validate all plans in .planning/")
-    
-    args = parser.parse_args()
-    
+def run(args: argparse.Namespace) -> int:
+    """Validate the plans selected on the command line."""
     project_path = Path(args.dir).resolve()
     planning_dir = project_path / ".planning"
     
@@ -223,21 +207,55 @@ def main():
         print(f"❌ GSD not initialized in {project_path}")
         return 1
     
-    if args.all or not args.plan:
-        validate_all_plans(planning_dir)
+    try:
+        engine = load_rule_engine(planning_dir, timed=args.rule_timings)
+    except (ValueError, OSError) as e:
+        print(f"❌ Invalid validation config: {e}")
+        return 1
+    
+    if args.list_rules:
+        print("\n📏 Validation rules:")
+        for rule in engine.rules:
+            print(f"   • {rule.id:<24} {rule.description}")
+        disabled = sorted(set(RULES) - {rule.id for rule in engine.rules})
+        if disabled:
+            print(f"   (disabled: {', '.join(disabled)})")
         return 0
+    
+    if args.all or not args.plan:
+        validate_all_plans(planning_dir, engine, args.max_size)
+        is_valid = True
     else:
         plan_path = planning_dir / args.plan
         if not plan_path.exists():
             # Try quick directory
             plan_path = planning_dir / "quick" / args.plan
         
-        validator = PlanValidator(plan_path)
+        validator = PlanValidator(plan_path, engine, args.max_size)
         is_valid = validator.validate()
         validator.report()
-        return 0 if is_valid else 1
     
-    return 0
+    if args.rule_timings:
+        print_rule_timings(engine)
+    
+    return 0 if is_valid else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate GSD plan files")
+    parser.add_argument("plan", nargs="?", help="Specific plan file to validate")
+    parser.add_argument("--dir", default=".", help="Project directory (default: current)")
+    parser.add_argument("--all", action="store_true", help="Validate all plans in .planning/")
+    parser.add_argument("--list-rules", action="store_true", help="List enabled validation rules")
+    parser.add_argument("--rule-timings", action="store_true", help="Report time spent in each rule")
+    parser.add_argument("--max-size", type=float, metavar="MB",
+                        help=f"Skip plans larger than this (default: {PlanValidator.MAX_FILE_MB} MB)")
+    add_instrumentation_args(parser)
+    
+    args = parser.parse_args()
+    
+    with instrument("validate_plan", args):
+        return run(args)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,8 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
+from telemetry import add_instrumentation_args, instrument, span
+
 
 class PlanAnalyzer:
     """Analyze plan files for dependencies and execution order."""
@@ -28,21 +30,41 @@ class PlanAnalyzer:
         
         for plan_file in plan_files:
             plan_id = self._extract_plan_id(plan_file.name)
-            content = plan_file.read_text()
+            with span("load"):
+                content = plan_file.read_text()
             
-            self.plans[plan_id] = {
-                "file": plan_file.name,
-                "path": plan_file,
-                "content": content,
-                "tasks": self._count_tasks(content),
-                "dependencies": self._extract_dependencies(content),
-            }
+            with span("parse"):
+                self.plans[plan_id] = {
+                    "file": plan_file.name,
+                    "path": plan_file,
+                    "content": content,
+                    "tasks": self._count_tasks(content),
+                    "dependencies": self._extract_dependencies(content),
+                }
             
             # Build dependency graph
             for dep in self.plans[plan_id]["dependencies"]:
                 self.dependencies[plan_id].add(dep)
                 self.dependents[dep].add(plan_id)
     
+    def load_from_index(self, index, phase: int) -> None:
+        """Load a phase's plans from a PlanningIndex instead of re-parsing files."""
+        with span("load"):
+            plans = index.plans(phase)
+        
+        for plan in plans:
+            plan_id = plan["plan_id"]
+            self.plans[plan_id] = {
+                "file": plan["file"],
+                "path": plan["path"],
+                "tasks": plan["tasks"],
+                "dependencies": plan["dependencies"],
+            }
+            
+            for dep in plan["dependencies"]:
+                self.dependencies[plan_id].add(dep)
+                self.dependents[dep].add(plan_id)
+    
     def _extract_plan_id(self, filename: str) -> str:
         """Extract plan ID from filename (e.g., '1-1-PLAN.md' -> '1-1')."""
         match = re.match(r'(\d+-\d+)', filename)
@@ -156,6 +178,10 @@ class PlanAnalyzer:
         """Generate execution schedule report."""
         lines = []
         
+        with span("analyze"):
+            cycles = self.detect_cycles()
+            waves = self.calculate_waves()
+        
         lines.append(f"\n{'='*60}")
         lines.append(f"🌊 WAVE EXECUTION PLAN - Phase {phase}")
         lines.append(f"{'='*60}\n")
@@ -172,16 +198,12 @@ class PlanAnalyzer:
         lines.append("")
         
         # Check for cycles
-        cycles = self.detect_cycles()
         if cycles:
             lines.append("⚠️  CIRCULAR DEPENDENCIES DETECTED!")
             for cycle in cycles:
                 lines.append(f"   {' → '.join(cycle)}")
             lines.append("")
         
-        # Calculate waves
-        waves = self.calculate_waves()
-        
         lines.append(f"🌊 EXECUTION WAVES ({len(waves)} total)")
         lines.append("-" * 40)
         
@@ -232,22 +254,8 @@ class PlanAnalyzer:
         return "\n".join(lines)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Wave Planner: Analyze plan dependencies and create execution schedule",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s 1                    # Analyze phase 1 plans
-  %(prog)s 2 --dir ./my-project # Analyze phase 2 in specific directory
-        """
-    )
-    
-    parser.add_argument("phase", type=int, help="Phase number to analyze")
-    parser.add_argument("--dir", default=".", help="Project directory (default: current)")
-    
-    args = parser.parse_args()
-    
+def run(args: argparse.Namespace) -> int:
+    """Analyze a phase and print its wave schedule."""
     project_path = Path(args.dir).resolve()
     planning_dir = project_path / ".planning"
     
@@ -257,7 +265,12 @@ Examples:
     
     # Load and analyze plans
     analyzer = PlanAnalyzer(planning_dir)
-    analyzer.load_plans(args.phase)
+    if args.index:
+        from planning_index import open_index
+        with open_index(planning_dir) as index:
+            analyzer.load_from_index(index, args.phase)
+    else:
+        analyzer.load_plans(args.phase)
     
     if not analyzer.plans:
         print(f"❌ No plans found for phase {args.phase}")
@@ -265,13 +278,37 @@ Examples:
         return 1
     
     # Generate and print report
-    report = analyzer.generate_report(args.phase)
-    print(report)
+    with span("render"):
+        report = analyzer.generate_report(args.phase)
+        print(report)
     
     # Exit with error if cycles detected
     cycles = analyzer.detect_cycles()
     return 1 if cycles else 0
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Wave Planner: Analyze plan dependencies and create execution schedule",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s 1                    # Analyze phase 1 plans
+  %(prog)s 2 --dir ./my-project # Analyze phase 2 in specific directory
+        """
+    )
+    
+    parser.add_argument("phase", type=int, help="Phase number to analyze")
+    parser.add_argument("--dir", default=".", help="Project directory (default: current)")
+    parser.add_argument("--index", action="store_true",
+                        help="Read plans from the SQLite planning index (.planning/.cache)")
+    add_instrumentation_args(parser)
+    
+    args = parser.parse_args()
+    
+    with instrument("wave_planner", args):
+        return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
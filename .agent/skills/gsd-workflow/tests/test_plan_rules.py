@@ -0,0 +1,163 @@
+"""Tests for plan_rules.py - event-driven validation rule engine."""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import plan_rules
+from plan_rules import Rule, RuleEngine
+from validate_plan import PlanValidator, load_rule_engine, main
+
+
+class RecordingRule(Rule):
+    """Collects every event it receives."""
+
+    id = "recording"
+
+    def reset(self) -> None:
+        self.events = []
+
+    def on_start(self, el, ctx):
+        self.events.append(("start", el.tag, el.line))
+
+    def on_end(self, el, ctx):
+        self.events.append(("end", el.tag, el.line))
+
+    def on_attribute(self, el, name, value, ctx):
+        self.events.append(("attr", name, value))
+
+    def on_text(self, text, line, ctx):
+        if text.strip():
+            self.events.append(("text", text.strip(), line))
+
+
+class TestEngine:
+    """Test tokenizing and event dispatch."""
+
+    def test_events_from_single_pass(self):
+        """Test that open/close, attribute and text events are emitted in order."""
+        rule = RecordingRule()
+        RuleEngine([rule]).run('<task type="auto">\n  <name>Do it</name>\n</task>')
+
+        assert rule.events == [
+            ("start", "task", 1),
+            ("attr", "type", "auto"),
+            ("start", "name", 2),
+            ("text", "Do it", 2),
+            ("end", "name", 2),
+            ("end", "task", 3),
+        ]
+
+    def test_tag_subscription_filters_events(self):
+        """Test that a rule with tags only sees those elements."""
+        rule = RecordingRule()
+        rule.tags = {"name"}
+        RuleEngine([rule]).run('<task type="auto"><name>x</name></task>')
+
+        assert [e for e in rule.events if e[0] != "text"] == [("start", "name", 1), ("end", "name", 1)]
+
+    def test_rule_timings(self):
+        """Test that timed engines record calls per rule."""
+        engine = RuleEngine([RecordingRule()], timed=True)
+        engine.run("<plan><overview></overview></plan>")
+
+        report = engine.timing_report()
+        assert report[0]["rule"] == "recording"
+        assert report[0]["calls"] > 0
+
+
+class TestConfiguration:
+    """Test rule configuration from config.json."""
+
+    PLAN = """<plan phase="1" plan="1">
+  <overview><phase_name>X</phase_name><goal>Y</goal></overview>
+  <tasks>
+    <task type="robot" priority="1">
+      <name>Task</name>
+      <action>Do</action>
+      <verify>Check</verify>
+      <done>Done</done>
+    </task>
+  </tasks>
+</plan>"""
+
+    def write_config(self, planning_dir: Path, validation: dict) -> None:
+        planning_dir.mkdir(exist_ok=True)
+        (planning_dir / "config.json").write_text(json.dumps({"validation": validation}))
+
+    def validate(self, temp_project_dir: Path, validation: dict) -> PlanValidator:
+        planning_dir = temp_project_dir / ".planning"
+        self.write_config(planning_dir, validation)
+        plan_path = planning_dir / "1-1-PLAN.md"
+        plan_path.write_text(self.PLAN)
+        validator = PlanValidator(plan_path, load_rule_engine(planning_dir))
+        validator.validate()
+        return validator
+
+    def test_disable_rule(self, temp_project_dir):
+        """Test that a rule set to false is skipped."""
+        validator = self.validate(temp_project_dir, {"rules": {"dependencies-section": False}})
+        assert not any("<dependencies>" in w for w in validator.warnings)
+
+    def test_severity_and_options(self, temp_project_dir):
+        """Test severity overrides and rule options."""
+        validator = self.validate(temp_project_dir, {"rules": {
+            "task-attributes": {"severity": "warning", "types": ["auto", "manual"]},
+        }})
+        assert validator.errors == []
+        assert any("Invalid type 'robot'" in w for w in validator.warnings)
+
+        validator = self.validate(temp_project_dir, {"rules": {
+            "task-attributes": {"types": ["robot"]},
+        }})
+        assert validator.errors == []
+
+    def test_unknown_rule_rejected(self, temp_project_dir):
+        """Test that typos in rule names are reported."""
+        with pytest.raises(ValueError, match="Unknown validation rule"):
+            self.validate(temp_project_dir, {"rules": {"no-such-rule": False}})
+
+    def test_plugin_rule(self, temp_project_dir):
+        """Test that plugin files can register extra rules."""
+        rules_dir = temp_project_dir / ".planning" / "rules"
+        rules_dir.mkdir(parents=True)
+        (rules_dir / "team.py").write_text(
+            "from plan_rules import Rule, register_rule\n"
+            "\n"
+            "@register_rule\n"
+            "class NoRobots(Rule):\n"
+            "    id = 'no-robots'\n"
+            "    tags = {'task'}\n"
+            "    def on_attribute(self, el, name, value, ctx):\n"
+            "        if value == 'robot':\n"
+            "            self.error(ctx, 'Robots are not allowed')\n"
+        )
+        try:
+            validator = self.validate(temp_project_dir, {"plugins": ["rules/team.py"]})
+            assert "Robots are not allowed" in validator.errors
+        finally:
+            plan_rules.RULES.pop("no-robots", None)
+
+
+class TestCLI:
+    """Test the rule-related CLI flags."""
+
+    def test_list_rules(self, initialized_gsd_project, capsys):
+        """Test that --list-rules prints the built-in rules."""
+        argv = ["validate_plan.py", "--list-rules", "--dir", str(initialized_gsd_project)]
+        with patch.object(sys, "argv", argv):
+            assert main() == 0
+        assert "balanced-tags" in capsys.readouterr().out
+
+    def test_rule_timings(self, initialized_gsd_project, sample_plan_file, capsys):
+        """Test that --rule-timings reports per-rule time."""
+        (initialized_gsd_project / ".planning" / "1-1-PLAN.md").write_text(sample_plan_file)
+        argv = ["validate_plan.py", "--all", "--rule-timings", "--dir", str(initialized_gsd_project)]
+        with patch.object(sys, "argv", argv):
+            assert main() == 0
+        out = capsys.readouterr().out
+        assert "RULE TIMINGS" in out
+        assert "task-fields" in out
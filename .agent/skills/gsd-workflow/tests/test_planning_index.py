@@ -0,0 +1,127 @@
+"""Tests for planning_index.py - SQLite mirror of planning state."""
+
+import os
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from planning_index import PlanningIndex, INDEX_PATH
+from progress_reporter import ProgressReporter
+from wave_planner import PlanAnalyzer
+
+
+@pytest.fixture
+def planning_dir(initialized_gsd_project, sample_plan_file):
+    """Planning directory with one completed and one pending plan."""
+    planning_dir = initialized_gsd_project / ".planning"
+    (planning_dir / "1-1-PLAN.md").write_text(sample_plan_file)
+    (planning_dir / "1-1-SUMMARY.md").write_text("# Plan 1-1 Summary\n")
+    (planning_dir / "1-2-PLAN.md").write_text(sample_plan_file.replace(
+        "<complete>Phase 0: Setup</complete>", "<complete>Plan 1</complete>"
+    ))
+    return planning_dir
+
+
+class TestSync:
+    """Test incremental synchronisation."""
+
+    def test_initial_sync_creates_cache(self, planning_dir):
+        """Test that the first sync indexes everything and ignores the cache in git."""
+        with PlanningIndex(planning_dir) as index:
+            stats = index.sync()
+
+        assert stats["added"] == 5  # ROADMAP, STATE, two plans, one summary
+        assert (planning_dir / INDEX_PATH).exists()
+        assert (planning_dir / ".cache" / ".gitignore").read_text() == "*\n"
+
+    def test_unchanged_files_are_skipped(self, planning_dir):
+        """Test that a second sync re-parses nothing."""
+        with PlanningIndex(planning_dir) as index:
+            index.sync()
+            stats = index.sync()
+
+        assert stats["unchanged"] == 5
+        assert stats["added"] == stats["updated"] == stats["removed"] == 0
+
+    def test_changed_and_removed_files(self, planning_dir):
+        """Test that edits replace rows and deletions drop them."""
+        with PlanningIndex(planning_dir) as index:
+            index.sync()
+
+            state_file = planning_dir / "STATE.md"
+            state_file.write_text(state_file.read_text().replace("- [ ] None", "- [ ] Waiting on API keys"))
+            stat = state_file.stat()
+            os.utime(state_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            (planning_dir / "1-1-SUMMARY.md").unlink()
+
+            stats = index.sync()
+
+            assert stats["updated"] == 1
+            assert stats["removed"] == 1
+            assert index.blockers() == ["Waiting on API keys"]
+            assert index.query("SELECT COUNT(*) AS n FROM summaries")[0]["n"] == 0
+
+
+class TestQueries:
+    """Test that queries match the file-based readers."""
+
+    def test_phases_match_progress_reporter(self, planning_dir):
+        """Test that indexed phase data equals ProgressReporter output."""
+        with PlanningIndex(planning_dir) as index:
+            index.sync()
+            indexed = ProgressReporter(planning_dir, index=index).get_phase_data()
+            upcoming = ProgressReporter(planning_dir, index=index).get_upcoming_work()
+
+        # The index keeps hyphenated statuses whole ("not-started"), like status.py
+        from_files = ProgressReporter(planning_dir).get_phase_data()
+        assert [p["status"] for p in indexed] == ["not-started", "not-started"]
+        assert [{**p, "status": None} for p in indexed] == [{**p, "status": None} for p in from_files]
+        assert upcoming == ProgressReporter(planning_dir).get_upcoming_work()
+
+    def test_wave_planner_from_index(self, planning_dir):
+        """Test that waves computed from the index match the file-based ones."""
+        from_files = PlanAnalyzer(planning_dir)
+        from_files.load_plans(1)
+
+        with PlanningIndex(planning_dir) as index:
+            index.sync()
+            from_index = PlanAnalyzer(planning_dir)
+            from_index.load_from_index(index, 1)
+
+        assert from_index.calculate_waves() == from_files.calculate_waves()
+        assert dict(from_index.dependencies) == dict(from_files.dependencies)
+
+    def test_milestone_history(self, planning_dir):
+        """Test that archived milestones are indexed separately."""
+        archive = planning_dir / "milestones" / "v1.0-phases"
+        archive.mkdir(parents=True)
+        (archive / "1-1-SUMMARY.md").write_text("# Shipped auth\n")
+        (planning_dir / "milestones" / "v1.0-ROADMAP.md").write_text(
+            "# ROADMAP\n\n## Phase 1: Auth\n**Goal**: Login\n**Status**: complete\n"
+        )
+
+        with PlanningIndex(planning_dir) as index:
+            index.sync()
+            milestones = {m["milestone"]: m for m in index.milestones()}
+            history = index.history("v1.0")
+
+        assert milestones["v1.0"]["phases_complete"] == 1
+        assert milestones["current"]["plans"] == 2
+        assert [h["title"] for h in history] == ["Shipped auth"]
+
+    def test_query_rejects_writes(self, planning_dir):
+        """Test that ad-hoc queries are read-only."""
+        with PlanningIndex(planning_dir) as index:
+            index.sync()
+            with pytest.raises(ValueError):
+                index.query("DELETE FROM plans")
+            plans = index.query("SELECT COUNT(*) AS n FROM plans")[0]["n"]
+            with pytest.raises(ValueError):
+                index.query("WITH doomed AS (SELECT 1) DELETE FROM plans")
+            assert index.query("SELECT COUNT(*) AS n FROM plans")[0]["n"] == plans > 0
+
+            # Writes still work once the query is done
+            state_file = planning_dir / "STATE.md"
+            state_file.write_text(state_file.read_text() + "\n")
+            assert index.sync()["updated"] == 1
@@ -0,0 +1,104 @@
+"""Tests for portfolio.py - cross-project discovery and aggregation."""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from planning_index import PlanningIndex
+from portfolio import PortfolioReporter, discover_projects, summarize_project
+
+
+def make_project(path: Path, roadmap: str, blockers: str = "") -> Path:
+    """Create a minimal GSD project."""
+    planning_dir = path / ".planning"
+    planning_dir.mkdir(parents=True)
+    (planning_dir / "ROADMAP.md").write_text(roadmap)
+    (planning_dir / "STATE.md").write_text(f"# Project State\n\n## Blockers\n\n{blockers}\n")
+    (planning_dir / "PROJECT.md").write_text(f"# {path.name.title()}\n")
+    return path
+
+
+ROADMAP = """# ROADMAP
+
+## Phase 1: Setup
+**Goal**: Setup
+**Status**: complete
+
+## Phase 2: Build
+**Goal**: Build
+**Status**: planning
+"""
+
+
+@pytest.fixture
+def portfolio_root(temp_project_dir):
+    """Root with two projects, one nested deep and one blocked."""
+    make_project(temp_project_dir / "alpha", ROADMAP)
+    make_project(temp_project_dir / "team" / "beta", ROADMAP, "- [ ] Waiting on design")
+    # Ignored: inside node_modules and nested within a project
+    make_project(temp_project_dir / "node_modules" / "pkg", ROADMAP)
+    make_project(temp_project_dir / "alpha" / "sub", ROADMAP)
+    return temp_project_dir
+
+
+class TestDiscovery:
+    """Test the pruned project walk."""
+
+    def test_finds_projects_and_prunes(self, portfolio_root):
+        """Test that skipped and nested directories are not reported."""
+        projects = discover_projects(portfolio_root)
+        assert [p.name for p in projects] == ["alpha", "beta"]
+
+    def test_respects_max_depth(self, portfolio_root):
+        """Test that projects below max_depth are not found."""
+        projects = discover_projects(portfolio_root, max_depth=1)
+        assert [p.name for p in projects] == ["alpha"]
+
+    def test_root_is_project(self, portfolio_root):
+        """Test that a project root reports only itself."""
+        assert discover_projects(portfolio_root / "alpha") == [(portfolio_root / "alpha").resolve()]
+
+
+class TestAggregation:
+    """Test per-project summaries and the combined report."""
+
+    def test_summary_uses_existing_index(self, portfolio_root):
+        """Test that a project's planning index is reused when present."""
+        project = portfolio_root / "alpha"
+        assert summarize_project(project)["source"] == "files"
+
+        with PlanningIndex(project / ".planning") as index:
+            index.sync()
+
+        summary = summarize_project(project)
+        assert summary["source"] == "index"
+        assert summary["current_phase"] == 2
+        assert summary["phases_complete"] == 1
+
+    def test_unreadable_project_is_reported(self, portfolio_root):
+        """Test that a broken project is reported instead of aborting."""
+        broken = portfolio_root / "broken" / ".planning"
+        broken.mkdir(parents=True)
+        (broken / "ROADMAP.md").mkdir()
+
+        summary = summarize_project(portfolio_root / "broken")
+        assert "error" in summary
+
+    def test_report_in_process_pool(self, portfolio_root):
+        """Test the aggregated JSON report across worker processes."""
+        data = json.loads(PortfolioReporter(portfolio_root, workers=2).generate_report("json"))
+
+        assert data["totals"]["projects"] == 2
+        assert data["totals"]["blocked"] == 1
+        assert data["projects"][0]["name"] == "Beta"
+        assert data["projects"][0]["blockers"] == ["Waiting on design"]
+
+    def test_markdown_report(self, portfolio_root):
+        """Test the markdown report lists projects and blockers."""
+        report = PortfolioReporter(portfolio_root, workers=1).generate_report()
+
+        assert "# Portfolio Report" in report
+        assert "| Alpha |" in report
+        assert "- [ ] Waiting on design" in report
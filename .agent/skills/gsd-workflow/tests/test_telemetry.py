@@ -0,0 +1,178 @@
+"""Tests for telemetry.py and timings_report.py - profiling flags and span aggregation."""
+
+import argparse
+import json
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import telemetry
+from telemetry import SpanRecorder, add_instrumentation_args, instrument, span, TIMINGS_FILE
+from timings_report import TimingsReport, percentile
+import validate_plan
+
+
+def make_args(tmp_dir: Path, **overrides) -> argparse.Namespace:
+    """Build a namespace like the scripts' parsers produce."""
+    values = {"dir": str(tmp_dir), "profile": False, "timings": False}
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+class TestSpanRecorder:
+    """Test span recording and merging."""
+
+    def test_span_is_noop_without_active_run(self):
+        """Test that span() does nothing when timings are off."""
+        assert telemetry._active is None
+        with span("load"):
+            pass
+        assert telemetry._active is None
+
+    def test_repeated_spans_are_merged(self):
+        """Test that repeated spans under the same parent become one record."""
+        recorder = SpanRecorder("test")
+        with recorder.span("total"):
+            for _ in range(3):
+                with recorder.span("load"):
+                    pass
+
+        records = {r["span"]: r for r in recorder.records()}
+        assert records["load"]["calls"] == 3
+        assert records["load"]["parent"] == "total"
+        assert records["total"]["parent"] is None
+        assert records["load"]["parent_id"] == records["total"]["id"]
+        assert all(r["run_id"] == recorder.run_id for r in records.values())
+
+    def test_parser_accepts_instrumentation_flags(self):
+        """Test that the shared flags are added to a parser."""
+        parser = argparse.ArgumentParser()
+        add_instrumentation_args(parser)
+        args = parser.parse_args(["--profile", "--timings"])
+        assert args.profile is True
+        assert args.timings is True
+
+
+class TestInstrument:
+    """Test the instrument() context manager."""
+
+    def test_disabled_writes_nothing(self, temp_project_dir):
+        """Test that no telemetry is written without flags."""
+        with instrument("test", make_args(temp_project_dir)) as recorder:
+            assert recorder is None
+        assert not (temp_project_dir / ".telemetry").exists()
+
+    def test_timings_written_as_json_lines(self, temp_project_dir):
+        """Test that --timings appends one JSON record per span."""
+        with instrument("test", make_args(temp_project_dir, timings=True)):
+            with span("parse"):
+                pass
+
+        timings_file = temp_project_dir / ".telemetry" / TIMINGS_FILE
+        records = [json.loads(line) for line in timings_file.read_text().splitlines()]
+        spans = {r["span"] for r in records}
+        assert spans == {"parse", "total"}
+        assert all(r["command"] == "test" for r in records)
+        assert telemetry._active is None
+
+    def test_profile_dump_created(self, temp_project_dir):
+        """Test that --profile writes a cProfile dump."""
+        with instrument("test", make_args(temp_project_dir, profile=True)):
+            sum(range(100))
+
+        profiles = list((temp_project_dir / ".telemetry" / "profiles").glob("test-*.prof"))
+        assert len(profiles) == 1
+
+    def test_spans_recorded_when_body_raises(self, temp_project_dir):
+        """Test that timings are still written if the script fails."""
+        with pytest.raises(RuntimeError):
+            with instrument("test", make_args(temp_project_dir, timings=True)):
+                raise RuntimeError("boom")
+
+        assert (temp_project_dir / ".telemetry" / TIMINGS_FILE).exists()
+        assert telemetry._active is None
+
+    def test_script_main_records_standard_spans(self, initialized_gsd_project, sample_plan_file):
+        """Test that validate_plan.py --timings records its phases."""
+        (initialized_gsd_project / ".planning" / "1-1-PLAN.md").write_text(sample_plan_file)
+
+        argv = ["validate_plan.py", "--all", "--timings", "--dir", str(initialized_gsd_project)]
+        with patch.object(sys, "argv", argv):
+            assert validate_plan.main() == 0
+
+        timings_file = initialized_gsd_project / ".telemetry" / TIMINGS_FILE
+        spans = {json.loads(line)["span"] for line in timings_file.read_text().splitlines()}
+        assert {"load", "parse", "analyze", "render", "total"} <= spans
+
+
+class TestTimingsReport:
+    """Test aggregation of recorded spans."""
+
+    def write_records(self, telemetry_dir: Path, records: list) -> None:
+        telemetry_dir.mkdir(parents=True, exist_ok=True)
+        lines = [json.dumps(r) for r in records]
+        (telemetry_dir / TIMINGS_FILE).write_text("\n".join(lines) + "\n")
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentile."""
+        assert percentile([], 95) == 0.0
+        assert percentile([5.0], 95) == 5.0
+        assert percentile([float(i) for i in range(1, 101)], 95) == 95.0
+
+    def test_self_time_excludes_children(self, temp_project_dir):
+        """Test that nested spans are not double counted."""
+        telemetry_dir = temp_project_dir / ".telemetry"
+        self.write_records(telemetry_dir, [
+            {"run_id": "a", "command": "cmd", "span": "total", "parent": None, "calls": 1, "duration_ms": 10.0},
+            {"run_id": "a", "command": "cmd", "span": "render", "parent": "total", "calls": 1, "duration_ms": 8.0},
+            {"run_id": "a", "command": "cmd", "span": "load", "parent": "render", "calls": 2, "duration_ms": 6.0},
+        ])
+
+        data = TimingsReport(telemetry_dir).aggregate()
+        phases = {p["span"]: p for p in data["cmd"]["phases"]}
+        assert phases["load"]["total_ms"] == 6.0
+        assert phases["render"]["total_ms"] == 2.0
+        assert data["cmd"]["phases"][0]["span"] == "load"
+
+    def test_self_time_keyed_by_parent_span(self, temp_project_dir):
+        """Test that same-named spans only subtract their own children."""
+        telemetry_dir = temp_project_dir / ".telemetry"
+        base = {"run_id": "a", "command": "cmd", "calls": 1}
+        self.write_records(telemetry_dir, [
+            {**base, "id": 1, "span": "total", "parent": None, "parent_id": None, "duration_ms": 10.0},
+            {**base, "id": 2, "span": "analyze", "parent": "total", "parent_id": 1, "duration_ms": 6.0},
+            {**base, "id": 3, "span": "render", "parent": "analyze", "parent_id": 2, "duration_ms": 5.0},
+            {**base, "id": 4, "span": "load", "parent": "render", "parent_id": 3, "duration_ms": 4.0},
+            {**base, "id": 5, "span": "render", "parent": "total", "parent_id": 1, "duration_ms": 3.0},
+        ])
+
+        phases = {p["span"]: p for p in TimingsReport(telemetry_dir).aggregate()["cmd"]["phases"]}
+        assert phases["render"]["total_ms"] == 4.0
+        assert phases["analyze"]["total_ms"] == 1.0
+
+    def test_aggregates_across_runs_and_skips_bad_lines(self, temp_project_dir):
+        """Test multi-run aggregation tolerates corrupt lines."""
+        telemetry_dir = temp_project_dir / ".telemetry"
+        self.write_records(telemetry_dir, [
+            {"run_id": "a", "command": "cmd", "span": "total", "parent": None, "calls": 1, "duration_ms": 4.0},
+            {"run_id": "a", "command": "cmd", "span": "parse", "parent": "total", "calls": 1, "duration_ms": 2.0},
+            {"run_id": "b", "command": "cmd", "span": "total", "parent": None, "calls": 1, "duration_ms": 6.0},
+            {"run_id": "b", "command": "cmd", "span": "parse", "parent": "total", "calls": 1, "duration_ms": 4.0},
+        ])
+        with (telemetry_dir / TIMINGS_FILE).open("a") as handle:
+            handle.write("{not json\n")
+
+        data = TimingsReport(telemetry_dir).aggregate()
+        assert data["cmd"]["runs"] == 2
+        parse = data["cmd"]["phases"][0]
+        assert parse["runs"] == 2
+        assert parse["mean_ms"] == 3.0
+        assert parse["max_ms"] == 4.0
+        assert parse["share_pct"] == 60.0
+
+    def test_markdown_report_without_data(self, temp_project_dir):
+        """Test the report handles a missing timings file."""
+        report = TimingsReport(temp_project_dir / ".telemetry").generate_report()
+        assert "No timings recorded yet" in report
@@ -444,3 +444,83 @@ class TestCLI:
         with patch('sys.argv', ['validate_plan', '--dir', str(initialized_gsd_project), '--all']):
             result = main()
             assert result == 0
+
+
+class TestStreamingValidation:
+    """Test chunked validation of large plans."""
+    
+    TASK = """    <task type="auto" priority="1">
+      <name>Task</name>
+      <action>Do something</action>
+      <verify>Check</verify>
+      <done>Done</done>
+    </task>
+"""
+    
+    def make_plan(self, tasks: int, task: str = TASK) -> str:
+        return (
+            '<plan phase="1" plan="1">\n'
+            '  <overview><phase_name>Big</phase_name><goal>Scale</goal></overview>\n'
+            '  <dependencies></dependencies>\n'
+            '  <tasks>\n' + task * tasks + '  </tasks>\n</plan>\n'
+        )
+    
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096])
+    def test_chunk_boundaries_do_not_change_diagnostics(self, temp_project_dir, malformed_plan_unclosed_tag, chunk_size):
+        """Test that streamed results match whole-file results for any chunk size."""
+        content = self.make_plan(3, self.TASK.replace("Do something", "TODO")) + malformed_plan_unclosed_tag
+        plan_path = temp_project_dir / "chunked.md"
+        plan_path.write_text(content)
+        
+        whole = PlanValidator(plan_path)
+        whole.validate_content(content)
+        
+        streamed = PlanValidator(plan_path)
+        with patch.object(PlanValidator, "CHUNK_SIZE", chunk_size):
+            streamed.validate()
+        
+        assert streamed.errors == whole.errors
+        assert streamed.warnings == whole.warnings
+        assert any("Action is empty" in w for w in streamed.warnings)
+    
+    def test_size_ceiling_aborts_early(self, temp_project_dir):
+        """Test that oversized plans are rejected without parsing."""
+        plan_path = temp_project_dir / "huge.md"
+        plan_path.write_text(self.make_plan(2000))
+        
+        validator = PlanValidator(plan_path, max_file_mb=0.1)
+        with patch.object(validator.engine, "run_stream") as run_stream:
+            assert validator.validate() is False
+        
+        run_stream.assert_not_called()
+        assert len(validator.errors) == 1
+        assert "not validated" in validator.errors[0]
+    
+    def test_memory_is_bounded(self, temp_project_dir):
+        """Test that peak memory does not grow with plan size."""
+        import tracemalloc
+        
+        plan_path = temp_project_dir / "large.md"
+        plan_path.write_text(self.make_plan(4000))  # ~570 KB
+        
+        validator = PlanValidator(plan_path)
+        with patch.object(PlanValidator, "CHUNK_SIZE", 16 * 1024):
+            tracemalloc.start()
+            validator.validate()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        
+        assert validator.errors == []
+        assert peak < 256 * 1024
+    
+    def test_repeated_diagnostics_are_capped(self, temp_project_dir):
+        """Test that one rule cannot flood the report."""
+        plan_path = temp_project_dir / "noisy.md"
+        plan_path.write_text(self.make_plan(500, self.TASK.replace("<name>Task</name>", "")))
+        
+        validator = PlanValidator(plan_path)
+        validator.validate()
+        
+        missing = [e for e in validator.errors if "Missing <name>" in e]
+        assert len(missing) == 200
+        assert validator.errors[-1] == "... 300 more similar errors suppressed"
@@ -0,0 +1,3 @@
+"""Pytest configuration for packages/db."""
+
+pytest_plugins = ["testing"]
@@ -0,0 +1,316 @@
+"""Bulk ingestion of projects.
+
+Rows stream in from a sync or async iterable and are written in batches,
+one transaction per batch, either as multi-row ``INSERT ... ON CONFLICT``
+statements or through asyncpg's binary ``COPY`` into a staging table that
+is then merged into ``projects``. A batch that fails is retried row by row
+so one bad record only costs itself.
+
+Usage:
+    result = await ingest_projects(rows, batch_size=5000, method="copy")
+    print(result.inserted, result.updated, len(result.failed))
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+
+try:
+    import asyncpg
+except ImportError:  # only needed for method="copy"
+    asyncpg = None
+
+from cache import invalidate_projects
+from connection import get_engine, get_session
+from models import Project
+
+METHOD_INSERT = "insert"
+METHOD_COPY = "copy"
+METHODS = (METHOD_INSERT, METHOD_COPY)
+
+ON_CONFLICT_IGNORE = "ignore"
+ON_CONFLICT_UPDATE = "update"
+ON_CONFLICT_ACTIONS = (ON_CONFLICT_IGNORE, ON_CONFLICT_UPDATE)
+
+# Columns a caller may supply; id and created_at are filled in when missing
+COLUMNS = ("id", "name", "description", "created_at")
+UPDATE_COLUMNS = ("name", "description")
+
+NAME_MAX_LENGTH = Project.__table__.c.name.type.length
+
+# Postgres caps bind parameters per statement at 32767
+MAX_PARAMETERS = 32767
+
+# COPY goes through the raw asyncpg connection, so its errors are not wrapped
+# in DBAPIError
+WRITE_ERRORS = (DBAPIError,) + ((asyncpg.PostgresError, asyncpg.InterfaceError) if asyncpg else ())
+
+Row = Dict[str, Any]
+Rows = Union[Iterable[Row], AsyncIterable[Row]]
+
+
+@dataclass
+class BatchStats:
+    """Outcome and throughput of one batch."""
+
+    number: int
+    rows: int
+    inserted: int
+    updated: int
+    skipped: int
+    failed: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class FailedRow:
+    """A row that was not written, with the reason."""
+
+    row: Row
+    error: str
+
+
+@dataclass
+class IngestResult:
+    """Totals for a bulk ingestion run."""
+
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    failed: List[FailedRow] = field(default_factory=list)
+    batches: List[BatchStats] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.skipped + len(self.failed)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total / self.seconds if self.seconds else 0.0
+
+
+def normalize_row(row: Row) -> Row:
+    """Validate a row and fill in client-side defaults.
+
+    Raises ValueError for rows the database would reject anyway, so they
+    are reported without costing a round trip.
+    """
+    unknown = set(row) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(sorted(unknown))}")
+
+    name = row.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("name is required")
+    if len(name) > NAME_MAX_LENGTH:
+        raise ValueError(f"name exceeds {NAME_MAX_LENGTH} characters")
+
+    description = row.get("description")
+    if description is not None and not isinstance(description, str):
+        raise ValueError("description must be a string")
+
+    created_at = row.get("created_at")
+    if created_at is not None and not isinstance(created_at, datetime):
+        raise ValueError("created_at must be a datetime")
+
+    project_id = row.get("id") or uuid.uuid4()
+    if not isinstance(project_id, uuid.UUID):
+        project_id = uuid.UUID(str(project_id))
+
+    return {
+        "id": project_id,
+        "name": name,
+        "description": description,
+        "created_at": created_at or datetime.now(timezone.utc),
+    }
+
+
+async def _iterate(rows: Rows) -> AsyncIterator[Row]:
+    if hasattr(rows, "__aiter__"):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+async def _batches(rows: Rows, batch_size: int) -> AsyncIterator[List[Row]]:
+    batch: List[Row] = []
+    async for row in _iterate(rows):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def build_upsert(values: List[Row], on_conflict: str = ON_CONFLICT_IGNORE) -> sa.Insert:
+    """Build a multi-row INSERT ... ON CONFLICT (id) for the given rows.
+
+    Each written row returns ``(id, inserted)``; ``inserted`` is false for
+    rows that updated an existing project (xmax is set on updated tuples).
+    Rows skipped by DO NOTHING return nothing.
+    """
+    stmt = insert(Project).values(values)
+    if on_conflict == ON_CONFLICT_UPDATE:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Project.id],
+            set_={
+                **{name: stmt.excluded[name] for name in UPDATE_COLUMNS},
+                "updated_at": sa.func.now(),
+            },
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[Project.id])
+    return stmt.returning(Project.id, sa.literal_column("xmax = 0").label("inserted"))
+
+
+def _merge_from_stage(stage: str, on_conflict: str) -> sa.TextClause:
+    columns = ", ".join(COLUMNS)
+    if on_conflict == ON_CONFLICT_UPDATE:
+        action = "DO UPDATE SET " + ", ".join(
+            [f"{name} = EXCLUDED.{name}" for name in UPDATE_COLUMNS] + ["updated_at = now()"]
+        )
+    else:
+        action = "DO NOTHING"
+    return sa.text(
+        f"INSERT INTO projects ({columns}) SELECT {columns} FROM {stage} "
+        f"ON CONFLICT (id) {action} RETURNING id, (xmax = 0) AS inserted"
+    )
+
+
+def _count(returned: List[Any], batch_rows: int, stats: Dict[str, int]) -> None:
+    inserted = sum(1 for row in returned if row.inserted)
+    if inserted < len(returned):
+        invalidate_projects(row.id for row in returned if not row.inserted)
+    stats["inserted"] += inserted
+    stats["updated"] += len(returned) - inserted
+    stats["skipped"] += batch_rows - len(returned)
+
+
+async def _write_insert(values: List[Row], on_conflict: str, url: Optional[str]) -> List[Any]:
+    step = MAX_PARAMETERS // len(COLUMNS)
+    returned: List[Any] = []
+    async with get_session(url) as session:
+        for start in range(0, len(values), step):
+            result = await session.execute(build_upsert(values[start:start + step], on_conflict))
+            returned.extend(result.all())
+    return returned
+
+
+async def _write_copy(values: List[Row], on_conflict: str, url: Optional[str]) -> List[Any]:
+    stage = "_projects_ingest"
+    async with get_session(url) as session:
+        conn = await session.connection()
+        await conn.execute(sa.text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} "
+            f"(LIKE projects INCLUDING DEFAULTS) ON COMMIT DROP"
+        ))
+        # Inside an outer transaction the table outlives each batch's commit
+        await conn.execute(sa.text(f"TRUNCATE {stage}"))
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            stage,
+            records=[tuple(row[name] for name in COLUMNS) for row in values],
+            columns=list(COLUMNS),
+        )
+        result = await conn.execute(_merge_from_stage(stage, on_conflict))
+        return result.all()
+
+
+async def ingest_projects(
+    rows: Rows,
+    *,
+    batch_size: int = 1000,
+    method: str = METHOD_INSERT,
+    on_conflict: str = ON_CONFLICT_IGNORE,
+    url: Optional[str] = None,
+    on_batch: Optional[Callable[[BatchStats], None]] = None,
+) -> IngestResult:
+    """Write project rows in batches and report what happened to each.
+
+    Args:
+        rows: Dicts with ``name`` and optionally ``id``, ``description``,
+            ``created_at``; a sync or async iterable, consumed lazily.
+        batch_size: Rows per statement/COPY and per transaction.
+        method: ``"insert"`` for multi-row upserts, ``"copy"`` for asyncpg
+            COPY into a temp table merged with ON CONFLICT (asyncpg only).
+        on_conflict: ``"ignore"`` keeps existing projects with the same id,
+            ``"update"`` overwrites name and description.
+        url: Database URL (defaults to DATABASE_URL).
+        on_batch: Called with each batch's BatchStats as it completes.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)}, got {method!r}")
+    if on_conflict not in ON_CONFLICT_ACTIONS:
+        raise ValueError(
+            f"on_conflict must be one of {', '.join(ON_CONFLICT_ACTIONS)}, got {on_conflict!r}"
+        )
+    if method == METHOD_COPY:
+        if get_engine(url).dialect.driver != "asyncpg":
+            raise ValueError("method='copy' requires the asyncpg driver")
+
+    write = _write_copy if method == METHOD_COPY else _write_insert
+    result = IngestResult()
+    started = time.perf_counter()
+
+    number = 0
+    async for batch in _batches(rows, batch_size):
+        number += 1
+        batch_started = time.perf_counter()
+        stats = {"inserted": 0, "updated": 0, "skipped": 0}
+        failed: List[FailedRow] = []
+
+        originals, values = [], []
+        for row in batch:
+            try:
+                values.append(normalize_row(row))
+                originals.append(row)
+            except (ValueError, TypeError) as e:
+                failed.append(FailedRow(row, str(e)))
+
+        if values:
+            try:
+                _count(await write(values, on_conflict, url), len(values), stats)
+            except WRITE_ERRORS:
+                # Isolate the offending rows; the rest of the batch still lands
+                for row, value in zip(originals, values):
+                    try:
+                        _count(await _write_insert([value], on_conflict, url), 1, stats)
+                    except DBAPIError as e:
+                        failed.append(FailedRow(row, str(e.orig or e)))
+
+        batch_stats = BatchStats(
+            number=number,
+            rows=len(batch),
+            failed=len(failed),
+            seconds=time.perf_counter() - batch_started,
+            **stats,
+        )
+        result.inserted += batch_stats.inserted
+        result.updated += batch_stats.updated
+        result.skipped += batch_stats.skipped
+        result.failed.extend(failed)
+        result.batches.append(batch_stats)
+        if on_batch:
+            on_batch(batch_stats)
+
+    result.seconds = time.perf_counter() - started
+    return result
+
@@ -0,0 +1,294 @@
+"""Opt-in read cache for Project lookups.
+
+Projects are cached by id, and names map to ids, in a pluggable backend
+(in-process LRU with TTL by default, or anything Redis-like). Entries are
+invalidated automatically when a session commits an insert, update or
+delete of a Project, and by bulk ingestion when it overwrites rows.
+Name lookups re-check the cached project's name, so renames never serve
+stale results even though only ids are invalidated.
+
+Writes made outside the ORM and bulk ingestion (raw SQL, other services)
+are only picked up when the TTL expires, as is a read that races a
+concurrent commit and stores the pre-commit row.
+
+Usage:
+    from cache import enable_project_cache
+
+    cache = enable_project_cache(max_size=10_000, ttl=60)
+    project = await cache.get(session, project_id)
+    project = await cache.get_by_name(session, "Apollo")
+    print(cache.stats()["hit_rate"])
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from models import Project
+
+DEFAULT_MAX_SIZE = 10_000
+DEFAULT_TTL = 300.0
+
+_PENDING_KEY = "project_cache_pending"
+_COLUMNS = [column.key for column in Project.__table__.columns]
+
+
+class CacheBackend:
+    """Storage interface for the cache. Values are JSON-compatible."""
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class LRUBackend(CacheBackend):
+    """In-process LRU with per-entry TTL."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self._clock = clock
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.expirations += 1
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (value, self._clock() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"size": len(self._data), "evictions": self.evictions, "expirations": self.expirations}
+
+
+class RedisBackend(CacheBackend):
+    """Backend for a redis-py compatible client (``get``/``set(ex=)``/``delete``/``scan_iter``).
+
+    Expiry and eviction are Redis' job (configure ``maxmemory-policy``).
+    """
+
+    def __init__(self, client: Any, prefix: str = "viflo:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.client.set(self.prefix + key, json.dumps(value), ex=max(1, int(ttl)))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.prefix + "project:*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+def _id_key(project_id: Any) -> str:
+    return f"project:id:{project_id}"
+
+
+def _name_key(name: str) -> str:
+    return f"project:name:{name}"
+
+
+def _dump(project: Project) -> Dict[str, Any]:
+    data = {}
+    for key in _COLUMNS:
+        value = getattr(project, key)
+        if isinstance(value, uuid.UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        data[key] = value
+    return data
+
+
+def _load(data: Dict[str, Any]) -> Project:
+    values = dict(data)
+    values["id"] = uuid.UUID(values["id"])
+    for key in ("created_at", "updated_at"):
+        if values.get(key):
+            values[key] = datetime.fromisoformat(values[key])
+    return Project(**values)
+
+
+class ProjectCache:
+    """Cache-aside Project lookups with commit-driven invalidation."""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = DEFAULT_TTL):
+        self.backend = backend or LRUBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def get(self, session: AsyncSession, project_id: Any) -> Optional[Project]:
+        """Get a project by id, from the cache when possible."""
+        project_id = project_id if isinstance(project_id, uuid.UUID) else uuid.UUID(str(project_id))
+        data = self.backend.get(_id_key(project_id))
+        if data is not None:
+            self.hits += 1
+            return await self._attach(session, data)
+
+        self.misses += 1
+        project = await session.get(Project, project_id)
+        if project is not None:
+            self._store(project)
+        return project
+
+    async def get_by_name(self, session: AsyncSession, name: str) -> Optional[Project]:
+        """Get the oldest project with this name, from the cache when possible."""
+        project_id = self.backend.get(_name_key(name))
+        if project_id is not None:
+            data = self.backend.get(_id_key(project_id))
+            if data is not None and data["name"] == name:
+                self.hits += 1
+                return await self._attach(session, data)
+
+        self.misses += 1
+        result = await session.execute(
+            sa.select(Project).where(Project.name == name)
+            .order_by(Project.created_at, Project.id).limit(1)
+        )
+        project = result.scalars().first()
+        if project is not None:
+            self._store(project)
+            self.backend.set(_name_key(name), str(project.id), self.ttl)
+        return project
+
+    def invalidate(self, project_ids: Iterable[Any]) -> None:
+        """Drop cached projects; their name entries fail validation afterwards."""
+        keys = [_id_key(project_id) for project_id in project_ids]
+        if keys:
+            self.backend.delete(*keys)
+            self.invalidations += len(keys)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/invalidation counters plus backend metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            **self.backend.stats(),
+        }
+
+    def _store(self, project: Project) -> None:
+        self.backend.set(_id_key(project.id), _dump(project), self.ttl)
+
+    async def _attach(self, session: AsyncSession, data: Dict[str, Any]) -> Project:
+        # Attach as persistent without a round trip (returns the session's
+        # own instance if it already has this project loaded). merge() with
+        # load=False only accepts detached objects, never transient ones.
+        project = _load(data)
+        make_transient_to_detached(project)
+        return await session.merge(project, load=False)
+
+
+_cache: Optional[ProjectCache] = None
+
+
+def get_project_cache() -> Optional[ProjectCache]:
+    """The active cache, or None when caching is disabled."""
+    return _cache
+
+
+def enable_project_cache(backend: Optional[CacheBackend] = None, *,
+                         max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL) -> ProjectCache:
+    """Create the process-wide cache and start invalidating it on commit."""
+    global _cache
+    _cache = ProjectCache(backend or LRUBackend(max_size), ttl=ttl)
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "after_commit", _after_commit)
+        event.listen(Session, "after_soft_rollback", _after_soft_rollback)
+    return _cache
+
+
+def disable_project_cache() -> None:
+    global _cache
+    _cache = None
+    if event.contains(Session, "after_flush", _after_flush):
+        event.remove(Session, "after_flush", _after_flush)
+        event.remove(Session, "after_commit", _after_commit)
+        event.remove(Session, "after_soft_rollback", _after_soft_rollback)
+
+
+def invalidate_projects(project_ids: Iterable[Any]) -> None:
+    """Invalidate ids changed outside the ORM (no-op when caching is disabled)."""
+    if _cache is not None:
+        _cache.invalidate(project_ids)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    changed: Set[Any] = session.info.setdefault(_PENDING_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Project) and obj.id is not None:
+            changed.add(obj.id)
+
+
+def _after_commit(session: Session) -> None:
+    changed = session.info.pop(_PENDING_KEY, None)
+    if changed:
+        invalidate_projects(changed)
+
+
+def _after_soft_rollback(session: Session, previous_transaction) -> None:
+    # A savepoint rollback keeps the outer transaction's flushed changes;
+    # over-invalidating what the savepoint itself flushed is harmless
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
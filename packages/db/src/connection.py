@@ -1,13 +1,35 @@
-"""Database connection and session management."""
+"""Database connection and session management.
 
+Engines are created lazily on first use and cached per (event loop, URL),
+so importing this module (or the models) does not load a database driver,
+and code that runs several event loops in one process (tests, workers)
+never shares pooled connections across loops.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
 import os
+import threading
+import time
+import uuid
+import weakref
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import asyncio
 
-import sqlalchemy as sa
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Pool modes (DB_POOL_MODE)
+POOL_MODE_NULL = "null"          # New connection per checkout (serverless/lambda)
+POOL_MODE_QUEUE = "queue"        # In-process pool for long-running servers
+POOL_MODE_EXTERNAL = "external"  # Behind PgBouncer/RDS Proxy in transaction mode
+POOL_MODES = (POOL_MODE_NULL, POOL_MODE_QUEUE, POOL_MODE_EXTERNAL)
 
 # Database URL from environment
 def get_database_url() -> str:
@@ -18,6 +40,11 @@ def get_database_url() -> str:
     )
 
 
+def get_replica_urls() -> List[str]:
+    """Get read replica URLs from DATABASE_REPLICA_URLS (comma-separated)."""
+    return [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+
+
 def get_sync_database_url() -> str:
     """Get synchronous database URL for Alembic/migrations."""
     url = get_database_url()
@@ -25,53 +52,413 @@ def get_sync_database_url() -> str:
     return url.replace("postgresql+asyncpg://", "postgresql://")
 
 
-# Create async engine
-engine = create_async_engine(
-    get_database_url(),
-    poolclass=NullPool,  # Use NullPool for serverless/lambda compatibility
-    echo=os.getenv("SQL_ECHO", "false").lower() == "true",
-)
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def get_pool_mode() -> str:
+    """Get the connection pool mode from DB_POOL_MODE (default: null)."""
+    mode = os.getenv("DB_POOL_MODE", POOL_MODE_NULL).lower()
+    if mode not in POOL_MODES:
+        raise ValueError(f"DB_POOL_MODE must be one of {', '.join(POOL_MODES)}, got {mode!r}")
+    return mode
+
+
+def get_engine_options(mode: str | None = None, url: str | None = None) -> dict:
+    """Build create_async_engine() keyword arguments for a pool mode.
+    
+    - null: NullPool, a fresh connection per session. Safe for serverless
+      functions that freeze between invocations.
+    - queue: AsyncAdaptedQueuePool sized by DB_POOL_SIZE, DB_MAX_OVERFLOW,
+      DB_POOL_TIMEOUT, DB_POOL_RECYCLE and DB_POOL_PRE_PING.
+    - external: NullPool with prepared statements disabled, for an external
+      pooler in transaction mode that may route each statement to a
+      different server connection.
+    
+    In every mode the compiled-SQL cache holds DB_COMPILED_CACHE_SIZE
+    statements; outside external mode each asyncpg connection keeps
+    DB_PREPARED_STATEMENT_CACHE_SIZE prepared statements.
+    """
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+    
+    mode = mode or get_pool_mode()
+    options: dict = {
+        "echo": os.getenv("SQL_ECHO", "false").lower() == "true",
+    }
+    
+    if mode == POOL_MODE_QUEUE:
+        options.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=_env_int("DB_POOL_SIZE", 5),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", 10),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT", 30),
+            pool_recycle=_env_int("DB_POOL_RECYCLE", 1800),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", True),
+        )
+    else:
+        options["poolclass"] = NullPool
+    
+    # SQLAlchemy's compiled-SQL cache, per engine
+    options["query_cache_size"] = _env_int("DB_COMPILED_CACHE_SIZE", 500)
+    
+    driver = make_url(url or get_database_url()).get_driver_name()
+    if driver == "asyncpg" and mode == POOL_MODE_EXTERNAL:
+        options["connect_args"] = {
+            # asyncpg's own statement cache and SQLAlchemy's prepared
+            # statement cache both assume a sticky server connection
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            # Unique names so statements never collide on a shared backend
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    elif driver == "asyncpg" and os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE"):
+        # Server-side prepared statements kept per connection (LRU, asyncpg
+        # dialect default 100)
+        options["connect_args"] = {
+            "prepared_statement_cache_size": _env_int("DB_PREPARED_STATEMENT_CACHE_SIZE", 100),
+        }
+    
+    return options
+
+
+# Engine registry: event loop -> {url: (engine, sessionmaker)}. Loops are
+# held weakly so a closed, collected loop drops its entries; engines created
+# outside a running loop are keyed under None.
+_registry: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, tuple]] = weakref.WeakKeyDictionary()
+_no_loop: Dict[str, tuple] = {}
+_registry_lock = threading.Lock()
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    import asyncio
+    
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _engines_for(loop: Optional[asyncio.AbstractEventLoop]) -> Dict[str, tuple]:
+    if loop is None:
+        return _no_loop
+    return _registry.setdefault(loop, {})
+
+
+def _get_entry(url: Optional[str]) -> tuple:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    
+    url = url or get_database_url()
+    with _registry_lock:
+        engines = _engines_for(_current_loop())
+        entry = engines.get(url)
+        if entry is None:
+            engine = create_async_engine(url, **get_engine_options(url=url))
+            if _env_bool("DB_INSTRUMENTATION", True):
+                from instrumentation import instrument_engine
+                instrument_engine(engine)
+            factory = async_sessionmaker(
+                engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autocommit=False,
+                autoflush=False,
+            )
+            entry = engines[url] = (engine, factory)
+        return entry
+
+
+def get_engine(url: Optional[str] = None) -> AsyncEngine:
+    """Get the engine for the running event loop, creating it on first use."""
+    return _get_entry(url)[0]
+
+
+def get_sessionmaker(url: Optional[str] = None) -> async_sessionmaker[AsyncSession]:
+    """Get the session factory bound to get_engine(url)."""
+    return _get_entry(url)[1]
+
+
+async def dispose_all() -> None:
+    """Dispose every engine in the registry (call on shutdown).
+    
+    Engines owned by the running loop close their connections; engines
+    from other loops cannot be awaited here, so their pools are discarded
+    without closing connections that belong to those loops.
+    """
+    loop = _current_loop()
+    with _registry_lock:
+        owned = list(_engines_for(loop).values()) + (list(_no_loop.values()) if loop else [])
+        foreign = [
+            entry
+            for other, engines in list(_registry.items()) if other is not loop
+            for entry in engines.values()
+        ]
+        _registry.clear()
+        _no_loop.clear()
+    
+    for engine, _ in owned:
+        await engine.dispose()
+    for engine, _ in foreign:
+        await engine.dispose(close=False)
+
+
+class ReplicaSet:
+    """Round-robin selection over read replicas, skipping ones recently down.
+    
+    A replica that fails to connect is skipped for ``cooldown`` seconds
+    (DB_REPLICA_COOLDOWN, default 30) and then tried again.
+    """
+    
+    def __init__(self, urls: List[str], cooldown: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.urls = list(urls)
+        self.cooldown = cooldown
+        self._clock = clock
+        self._next = itertools.count()
+        self._down_until: Dict[str, float] = {}
+    
+    def candidates(self) -> List[str]:
+        """Healthy replicas in the order to try them for the next session."""
+        if not self.urls:
+            return []
+        start = next(self._next) % len(self.urls)
+        now = self._clock()
+        rotated = self.urls[start:] + self.urls[:start]
+        return [url for url in rotated if self._down_until.get(url, 0) <= now]
+    
+    def mark_down(self, url: str) -> None:
+        self._down_until[url] = self._clock() + self.cooldown
+    
+    def mark_up(self, url: str) -> None:
+        self._down_until.pop(url, None)
+
+
+_replica_set: Optional[ReplicaSet] = None
+
 
-# Session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+def get_replica_set() -> ReplicaSet:
+    """Get the process-wide replica set, built from the environment on first use."""
+    global _replica_set
+    if _replica_set is None:
+        cooldown = float(os.getenv("DB_REPLICA_COOLDOWN", "30"))
+        _replica_set = ReplicaSet(get_replica_urls(), cooldown=cooldown)
+    return _replica_set
+
+
+async def _begin_read_only(url: Optional[str]) -> AsyncSession:
+    import sqlalchemy as sa
+    
+    session = get_sessionmaker(url)()
+    try:
+        # Also the first round trip, so an unreachable server fails here
+        await session.execute(sa.text("SET TRANSACTION READ ONLY"))
+    except BaseException:
+        await session.close()
+        raise
+    return session
+
+
+async def _open_read_only_session() -> AsyncSession:
+    from sqlalchemy.exc import DBAPIError
+    
+    replicas = get_replica_set()
+    for url in replicas.candidates():
+        try:
+            session = await _begin_read_only(url)
+        except (DBAPIError, OSError):
+            replicas.mark_down(url)
+            continue
+        replicas.mark_up(url)
+        return session
+    # No replica configured or reachable: read from the primary
+    return await _begin_read_only(None)
 
 
 @asynccontextmanager
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_session(url: Optional[str] = None, readonly: bool = False) -> AsyncGenerator[AsyncSession, None]:
     """Get a database session as an async context manager.
     
+    With ``readonly=True`` the session runs a READ ONLY transaction on a
+    replica from DATABASE_REPLICA_URLS (round-robin, skipping replicas that
+    recently failed to connect), falling back to the primary when none is
+    available. Read-only sessions are rolled back rather than committed.
+    
+    Statements are counted per session; one statement repeated
+    DB_N_PLUS_ONE_THRESHOLD times or more is logged as a possible N+1.
+    
     Usage:
         async with get_session() as session:
             result = await session.execute(query)
+        
+        async with get_session(readonly=True) as session:
+            result = await session.execute(query)
     """
-    session = AsyncSessionLocal()
+    from instrumentation import track_queries
+    
+    with track_queries():
+        if readonly:
+            session = await (_begin_read_only(url) if url else _open_read_only_session())
+        else:
+            session = get_sessionmaker(url)()
+        try:
+            yield session
+            if readonly:
+                await session.rollback()
+            else:
+                await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def _with_retries(attempt: Callable, retries: int, base_delay: float, max_delay: float):
+    """Await ``attempt()``, retrying connection failures with exponential backoff."""
+    import asyncio
+    
+    from sqlalchemy.exc import DBAPIError
+    
+    for n in range(retries + 1):
+        try:
+            return await attempt()
+        except (DBAPIError, OSError):
+            if n == retries:
+                raise
+            await asyncio.sleep(min(max_delay, base_delay * 2 ** n))
+
+
+def _warmup_statements() -> list:
+    """Statements every API worker runs early: prepare them on each connection."""
+    import sqlalchemy as sa
+    
+    from models import Project
+    from queries.projects import list_projects_query
+    
+    return [
+        sa.select(Project).where(Project.id == uuid.uuid4()),
+        list_projects_query(),
+    ]
+
+
+async def _warm_connection(engine: AsyncEngine, barrier: "asyncio.Barrier") -> None:
+    import sqlalchemy as sa
+    
+    from sqlalchemy.exc import DBAPIError
+    
     try:
-        yield session
-        await session.commit()
-    except Exception:
-        await session.rollback()
+        async with engine.connect() as conn:
+            # First use of a connection loads asyncpg's type codecs; executing
+            # the hot statements fills the per-connection statement cache
+            await conn.execute(sa.text("SELECT 1"))
+            try:
+                for stmt in _warmup_statements():
+                    await conn.execute(stmt)
+            except DBAPIError as e:
+                # Best effort: before `alembic upgrade` the tables do not exist
+                logger.warning("Skipping statement warmup: %s", e.orig or e)
+            await conn.rollback()
+            # Hold it until every connection is open, so the pool grows to
+            # size instead of reusing the first one
+            await barrier.wait()
+    except BaseException:
+        await barrier.abort()
         raise
-    finally:
-        await session.close()
 
 
-async def init_db() -> None:
-    """Initialize database (create tables if they don't exist).
+async def init_db(
+    url: Optional[str] = None,
+    warm_connections: Optional[int] = None,
+    retries: Optional[int] = None,
+    base_delay: float = 0.5,
+    max_delay: float = 10.0,
+) -> None:
+    """Wait for the database and pre-warm the connection pool.
     
-    Note: In production, use Alembic migrations instead.
+    Retries the first connection with exponential backoff (DB_CONNECT_RETRIES,
+    default 5), then opens ``warm_connections`` connections at once
+    (DB_POOL_WARM, default DB_POOL_SIZE in queue mode, otherwise 1), running
+    the common Project queries on each so the first requests after a deploy
+    do not pay for connection setup and type introspection. Only the
+    connection itself must succeed: if those queries fail (for example on a
+    database that has not been migrated yet) a warning is logged instead.
+    
+    Note: In production, use Alembic migrations to create tables.
     """
-    from sqlalchemy import inspect
+    import asyncio
+    
+    import sqlalchemy as sa
+    
+    engine = get_engine(url)
+    retries = _env_int("DB_CONNECT_RETRIES", 5) if retries is None else retries
+    if warm_connections is None:
+        pooled = get_pool_mode() == POOL_MODE_QUEUE
+        warm_connections = _env_int("DB_POOL_WARM", _env_int("DB_POOL_SIZE", 5) if pooled else 1)
     
-    async with engine.begin() as conn:
-        # Check if we can connect
-        await conn.execute(sa.text("SELECT 1"))
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(sa.text("SELECT 1"))
+    
+    await _with_retries(ping, retries, base_delay, max_delay)
+    
+    if hasattr(engine.pool, "size"):
+        # Overflow connections are closed on return, so warming them is wasted
+        warm_connections = min(warm_connections, engine.pool.size())
+    if warm_connections > 0:
+        barrier = asyncio.Barrier(warm_connections)
+        await asyncio.gather(*(_warm_connection(engine, barrier) for _ in range(warm_connections)))
+
+
+def pool_status(url: Optional[str] = None) -> Dict[str, object]:
+    """Pool counters for the engine serving ``url`` in this event loop."""
+    pool = get_engine(url).pool
+    status: Dict[str, object] = {"class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, name):
+            status[name] = getattr(pool, name)()
+    return status
+
+
+async def check_ready(url: Optional[str] = None, timeout: float = 2.0) -> Dict[str, object]:
+    """Readiness probe: round-trip latency and pool state, never raising.
+    
+    Usage (e.g. behind GET /ready):
+        report = await check_ready()
+        status = 200 if report["ready"] else 503
+    """
+    import asyncio
+    
+    import sqlalchemy as sa
+    
+    report: Dict[str, object] = {"ready": False}
+    started = time.perf_counter()
+    try:
+        async def ping() -> None:
+            async with get_engine(url).connect() as conn:
+                await conn.execute(sa.text("SELECT 1"))
+        
+        await asyncio.wait_for(ping(), timeout)
+        report["ready"] = True
+    except Exception as e:  # a probe reports failures, it does not raise them
+        report["error"] = f"{type(e).__name__}: {e}"
+    report["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    report["pool"] = pool_status(url)
+    return report
 
 
-# Backwards compatibility
-SessionLocal = AsyncSessionLocal
+def __getattr__(name: str):
+    # Backwards compatibility: `engine`, `AsyncSessionLocal` and `SessionLocal`
+    # used to be module globals created at import time
+    if name == "engine":
+        return get_engine()
+    if name in ("AsyncSessionLocal", "SessionLocal"):
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,288 @@
+"""Query instrumentation: per-statement timings, slow-query log, N+1 detection.
+
+Engines from ``connection.get_engine()`` are instrumented automatically
+(set DB_INSTRUMENTATION=false to opt out). Every statement is timed and
+aggregated under a normalized form with literals and bind placeholders
+collapsed, so ``WHERE id = $1`` and ``IN ($1, $2, $3)`` variants share
+one entry.
+
+Hits and misses of SQLAlchemy's compiled-SQL cache and of asyncpg's
+per-connection prepared statement cache are counted as well.
+
+Usage:
+    from instrumentation import get_cache_stats, get_query_stats
+
+    for row in get_query_stats():
+        print(row["statement"], row["count"], row["p95_ms"])
+    print(get_cache_stats()["compiled_hit_rate"])
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Durations kept per statement for percentiles (most recent window)
+SAMPLE_SIZE = 1024
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_RE = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):[A-Za-z_]\w*|\?")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_ROWS_RE = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def slow_query_threshold_ms() -> float:
+    """Statements slower than this are logged (DB_SLOW_QUERY_MS, default 500)."""
+    return float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+
+
+def n_plus_one_threshold() -> int:
+    """Repeats of one statement in a session that count as N+1 (DB_N_PLUS_ONE_THRESHOLD, default 10)."""
+    return int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "10"))
+
+
+@lru_cache(maxsize=4096)
+def normalize_statement(statement: str) -> str:
+    """Collapse literals, placeholders and value lists to a stable key."""
+    normalized = _STRING_RE.sub("?", statement)
+    normalized = _PLACEHOLDER_RE.sub("?", normalized)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    normalized = _LIST_RE.sub("(...)", normalized)
+    normalized = _ROWS_RE.sub("(...), ...", normalized)
+    return _SPACE_RE.sub(" ", normalized).strip()
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace bind values with their type (and length for sized values)."""
+    if isinstance(parameters, dict):
+        return {key: redact_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) for value in parameters]
+    if parameters is None:
+        return None
+    if isinstance(parameters, (str, bytes)):
+        return f"<{type(parameters).__name__} len={len(parameters)}>"
+    return f"<{type(parameters).__name__}>"
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class _StatementStats:
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+
+class QueryStats:
+    """Thread-safe aggregate of statement timings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _StatementStats] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.get(statement)
+            if stats is None:
+                stats = self._stats[statement] = _StatementStats()
+            stats.count += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+            stats.samples.append(seconds)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-statement stats in milliseconds, most total time first."""
+        with self._lock:
+            items = [(statement, s.count, s.total, s.max, sorted(s.samples))
+                     for statement, s in self._stats.items()]
+
+        rows = []
+        for statement, count, total, longest, ordered in items:
+            rows.append({
+                "statement": statement,
+                "count": count,
+                "total_ms": total * 1000,
+                "mean_ms": total / count * 1000,
+                "p50_ms": _percentile(ordered, 50) * 1000,
+                "p95_ms": _percentile(ordered, 95) * 1000,
+                "p99_ms": _percentile(ordered, 99) * 1000,
+                "max_ms": longest * 1000,
+            })
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class QueryScope:
+    """Statement counts for one unit of work (normally one session)."""
+
+    def __init__(self, label: str = "session"):
+        self.label = label
+        self.counts: Dict[str, int] = {}
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def repeated(self, threshold: Optional[int] = None) -> Dict[str, int]:
+        """Statements executed at least ``threshold`` times."""
+        threshold = n_plus_one_threshold() if threshold is None else threshold
+        return {s: n for s, n in self.counts.items() if n >= threshold}
+
+
+class StatementCacheStats:
+    """Thread-safe hit/miss counters for the compiled and prepared statement caches."""
+
+    _FIELDS = ("compiled_hits", "compiled_misses", "prepared_hits", "prepared_misses")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, compiled: Optional[bool], prepared: Optional[bool]) -> None:
+        """Count one execution; None means that cache did not apply."""
+        with self._lock:
+            if compiled is not None:
+                self._counts["compiled_hits" if compiled else "compiled_misses"] += 1
+            if prepared is not None:
+                self._counts["prepared_hits" if prepared else "prepared_misses"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        for cache in ("compiled", "prepared"):
+            lookups = counts[f"{cache}_hits"] + counts[f"{cache}_misses"]
+            counts[f"{cache}_hit_rate"] = counts[f"{cache}_hits"] / lookups if lookups else 0.0
+        return counts
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = dict.fromkeys(self._FIELDS, 0)
+
+
+_stats = QueryStats()
+_cache_stats = StatementCacheStats()
+_scope: ContextVar[Optional[QueryScope]] = ContextVar("query_scope", default=None)
+
+
+def get_query_stats() -> List[Dict[str, Any]]:
+    """Snapshot of per-statement stats, for metrics exporters."""
+    return _stats.snapshot()
+
+
+def reset_query_stats() -> None:
+    _stats.reset()
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Compiled/prepared statement cache hits, misses and hit rates."""
+    return _cache_stats.snapshot()
+
+
+def reset_cache_stats() -> None:
+    _cache_stats.reset()
+
+
+@contextmanager
+def track_queries(label: str = "session") -> Iterator[QueryScope]:
+    """Count statements run in this context and warn about likely N+1 patterns.
+
+    Works in sync and async code; ``get_session()`` opens one per session.
+    """
+    scope = QueryScope(label)
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+        for statement, count in scope.repeated().items():
+            logger.warning(
+                "Possible N+1 in %s: statement executed %d times: %s",
+                scope.label, count, statement,
+            )
+
+
+def _compiled_cache_hit(context) -> Optional[bool]:
+    # ExecutionContext.cache_hit is a CacheStats enum; only HIT and MISS
+    # mean the statement went through the compiled cache
+    status = getattr(getattr(context, "cache_hit", None), "name", None)
+    if status == "CACHE_HIT":
+        return True
+    if status == "CACHE_MISS":
+        return False
+    return None
+
+
+def _prepared_cache_hit(conn, statement: str, executemany: bool) -> Optional[bool]:
+    # SQLAlchemy's asyncpg adapter keeps prepared statements in a private
+    # per-connection LRU keyed by SQL text (None when the cache is disabled);
+    # other drivers have no such cache, and executemany bypasses it
+    if executemany:
+        return None
+    dbapi_connection = getattr(conn.connection, "dbapi_connection", None)
+    if not hasattr(dbapi_connection, "_prepared_statement_cache"):
+        return None
+    cache = dbapi_connection._prepared_statement_cache
+    return cache is not None and statement in cache
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _cache_stats.record(_compiled_cache_hit(context), _prepared_cache_hit(conn, statement, executemany))
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    normalized = normalize_statement(statement)
+    _stats.record(normalized, elapsed)
+
+    scope = _scope.get()
+    if scope is not None:
+        scope.counts[normalized] = scope.counts.get(normalized, 0) + 1
+
+    if elapsed * 1000 >= slow_query_threshold_ms():
+        logger.warning(
+            "Slow query (%.1f ms): %s params=%s",
+            elapsed * 1000, _SPACE_RE.sub(" ", statement).strip(), redact_parameters(parameters),
+        )
+
+
+def _handle_error(exception_context):
+    starts = exception_context.connection.info.get("query_start") if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine) -> None:
+    """Attach timing hooks to an Engine or AsyncEngine (idempotent)."""
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
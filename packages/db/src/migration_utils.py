@@ -0,0 +1,188 @@
+"""Helpers for migrations that must run against a live, busy database.
+
+- Every migration runs with ``lock_timeout``/``statement_timeout`` set
+  (MIGRATION_LOCK_TIMEOUT, MIGRATION_STATEMENT_TIMEOUT), so a DDL statement
+  stuck behind a long transaction fails fast instead of queueing every
+  other query on the table behind it.
+- ``create_index_concurrently()``/``drop_index_concurrently()`` step out of
+  the migration transaction, as Postgres requires.
+- ``backfill()`` updates rows in keyed batches, each committed separately,
+  with throttling and progress output.
+
+Usage in a migration:
+    from migration_utils import backfill, create_index_concurrently
+
+    def upgrade() -> None:
+        op.add_column("projects", sa.Column("slug", sa.String(255)))
+        backfill("projects", "slug = lower(name)", where="slug IS NULL")
+        create_index_concurrently("ix_projects_slug", "projects", ["slug"])
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.engine import Connection
+
+DEFAULT_LOCK_TIMEOUT = "5s"
+DEFAULT_STATEMENT_TIMEOUT = "0"  # disabled
+
+
+def get_lock_timeout() -> str:
+    return os.getenv("MIGRATION_LOCK_TIMEOUT", DEFAULT_LOCK_TIMEOUT)
+
+
+def get_statement_timeout() -> str:
+    return os.getenv("MIGRATION_STATEMENT_TIMEOUT", DEFAULT_STATEMENT_TIMEOUT)
+
+
+def apply_timeouts(connection: Connection, lock_timeout: Optional[str] = None,
+                   statement_timeout: Optional[str] = None) -> None:
+    """Set session-level timeouts on the migration connection (called by env.py)."""
+    for name, value in (
+        ("lock_timeout", lock_timeout or get_lock_timeout()),
+        ("statement_timeout", statement_timeout or get_statement_timeout()),
+    ):
+        connection.execute(sa.text("SELECT set_config(:name, :value, false)"),
+                           {"name": name, "value": value})
+
+
+def run_migrations(connection: Connection, **configure_options) -> None:
+    """Run migrations on ``connection`` with timeouts applied (env.py online mode).
+
+    The timeouts are session settings, committed before alembic starts:
+    the statements that set them autobegin a transaction, and alembic
+    treats an already-open transaction as the caller's, so it would never
+    commit it and every migration would roll back when the connection
+    closes.
+    """
+    # Fail fast on lock contention rather than blocking writers
+    apply_timeouts(connection)
+    connection.commit()
+    context.configure(connection=connection, **configure_options)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+@contextmanager
+def timeouts(lock_timeout: Optional[str] = None, statement_timeout: Optional[str] = None) -> Iterator[None]:
+    """Override timeouts for part of a migration, restoring them afterwards.
+
+    Usage:
+        with timeouts(lock_timeout="1s"):
+            op.add_column(...)
+    """
+    settings = [(name, value) for name, value in
+                (("lock_timeout", lock_timeout), ("statement_timeout", statement_timeout)) if value]
+    previous = {}
+    if not op.get_context().as_sql:
+        bind = op.get_bind()
+        previous = {name: bind.execute(sa.text(f"SHOW {name}")).scalar() for name, _ in settings}
+    for name, value in settings:
+        op.execute(f"SET {name} = '{value}'")
+    try:
+        yield
+    finally:
+        for name, _ in settings:
+            if name in previous:
+                op.execute(f"SET {name} = '{previous[name]}'")
+            else:
+                op.execute(f"RESET {name}")
+
+
+def _drop_invalid_index(name: str) -> None:
+    # A failed CONCURRENTLY build leaves an INVALID index behind that
+    # IF NOT EXISTS would happily skip; remove it so the build is retried
+    if op.get_context().as_sql:
+        return
+    invalid = op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE c.relname = :name AND NOT i.indisvalid"
+    ), {"name": name}).scalar()
+    if invalid:
+        op.drop_index(name, postgresql_concurrently=True, if_exists=True)
+
+
+def create_index_concurrently(name: str, table: str, columns: List[str], **kw) -> None:
+    """CREATE INDEX CONCURRENTLY outside the migration transaction.
+
+    Builds without blocking writes. Idempotent, so a migration that failed
+    part-way can simply be re-run. Extra keyword arguments go to
+    ``op.create_index`` (e.g. ``unique=True``, ``postgresql_using="gin"``).
+    """
+    with op.get_context().autocommit_block():
+        with timeouts(statement_timeout="0"):
+            _drop_invalid_index(name)
+            op.create_index(name, table, columns, postgresql_concurrently=True,
+                            if_not_exists=True, **kw)
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    """DROP INDEX CONCURRENTLY outside the migration transaction."""
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def backfill(
+    table: str,
+    set_clause: str,
+    *,
+    where: Optional[str] = None,
+    key: str = "id",
+    batch_size: int = 1000,
+    pause: float = 0.1,
+    progress: Optional[Callable[[str], None]] = print,
+) -> int:
+    """Update rows in keyed batches, committing each batch.
+
+    Walks ``key`` in ascending order so every batch is an index range scan
+    and locks at most ``batch_size`` rows for one short transaction;
+    ``pause`` seconds between batches leave room for replication and
+    vacuum. ``where`` should exclude rows already done so an interrupted
+    backfill can be resumed. Returns the number of rows updated.
+
+    In offline (--sql) mode a single UPDATE is emitted instead.
+    """
+    condition = f"({where})" if where else "TRUE"
+    if op.get_context().as_sql:
+        op.execute(f"UPDATE {table} SET {set_clause} WHERE {condition}")
+        return 0
+
+    def batch(after: str) -> sa.TextClause:
+        return sa.text(
+            f"WITH batch AS ("
+            f"SELECT {key} FROM {table} WHERE {after}{condition} "
+            f"ORDER BY {key} LIMIT :limit"
+            f") "
+            f"UPDATE {table} AS t SET {set_clause} FROM batch "
+            f"WHERE t.{key} = batch.{key} RETURNING t.{key}"
+        )
+
+    first, rest = batch(""), batch(f"{key} > :last AND ")
+
+    total, batches, last = 0, 0, None
+    started = time.perf_counter()
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            if last is None:
+                keys = bind.execute(first, {"limit": batch_size}).scalars().all()
+            else:
+                keys = bind.execute(rest, {"last": last, "limit": batch_size}).scalars().all()
+            if not keys:
+                break
+            total += len(keys)
+            batches += 1
+            last = max(keys)
+            if progress:
+                elapsed = time.perf_counter() - started
+                progress(f"  backfill {table}: {total} rows in {batches} batches "
+                         f"({total / elapsed if elapsed else 0:.0f} rows/s)")
+            if len(keys) < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+    return total
@@ -0,0 +1,37 @@
+"""Add indexes for project pagination and name search
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from migration_utils import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add keyset pagination and trigram search indexes without blocking writes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    create_index_concurrently("ix_projects_created_at_id", "projects", ["created_at", "id"])
+    create_index_concurrently(
+        "ix_projects_name_trgm",
+        "projects",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop the indexes (the pg_trgm extension is left installed)."""
+    drop_index_concurrently("ix_projects_name_trgm", "projects")
+    drop_index_concurrently("ix_projects_created_at_id", "projects")
@@ -0,0 +1,266 @@
+"""Monthly range partitioning by ``created_at``.
+
+Declare a partitioned model by adding ``time_partitioned()`` to its
+``__table_args__``; the primary key must include the partition column:
+
+    class Event(Base):
+        __tablename__ = "events"
+        __table_args__ = (time_partitioned(premake=3, retention_months=12),)
+
+        id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+        created_at: Mapped[datetime] = mapped_column(
+            DateTime(timezone=True), primary_key=True, server_default=func.now()
+        )
+
+In migrations, ``op.create_table(...)`` with the same table args creates
+the parent, and the operations registered here manage its partitions:
+
+    import partitioning  # registers the operations
+
+    op.create_time_partitions("events", start=date(2026, 1, 1), months=6)
+    op.detach_partition("events", "events_p2025_01", concurrently=True)
+
+Partitions are named ``<table>_pYYYY_MM``. Run the maintenance command
+from cron to keep ``premake`` future months created and to drop months
+older than ``retention_months``:
+
+    python src/partitioning.py roll [--dry-run]
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import sqlalchemy as sa
+from alembic.operations import MigrateOperation, Operations
+
+PARTITION_INFO_KEY = "time_partition"
+DEFAULT_PREMAKE = 3
+
+_PARTITION_RE = re.compile(r"^(?P<table>.+)_p(?P<year>\d{4})_(?P<month>\d{2})$")
+
+
+def time_partitioned(column: str = "created_at", premake: int = DEFAULT_PREMAKE,
+                     retention_months: Optional[int] = None) -> Dict:
+    """Table arguments for a table range-partitioned by month on ``column``."""
+    return {
+        "postgresql_partition_by": f"RANGE ({column})",
+        "info": {PARTITION_INFO_KEY: {
+            "column": column,
+            "premake": premake,
+            "retention_months": retention_months,
+        }},
+    }
+
+
+def month_start(day: date) -> date:
+    return date(day.year, day.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def parse_partition_name(name: str) -> Optional[Tuple[str, date]]:
+    """Inverse of partition_name(); None for names that do not match."""
+    match = _PARTITION_RE.match(name)
+    if not match:
+        return None
+    return match["table"], date(int(match["year"]), int(match["month"]), 1)
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    month = month_start(month)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def detach_partition_sql(table: str, partition: str, concurrently: bool = False) -> str:
+    return f"ALTER TABLE {table} DETACH PARTITION {partition}{' CONCURRENTLY' if concurrently else ''}"
+
+
+def partitioned_tables(metadata: sa.MetaData) -> Dict[str, Dict]:
+    """Partition settings for every table declared with time_partitioned().
+
+    Raises ValueError for tables whose primary key lacks the partition
+    column, which Postgres would reject.
+    """
+    tables = {}
+    for table in metadata.sorted_tables:
+        settings = table.info.get(PARTITION_INFO_KEY)
+        if not settings:
+            continue
+        if settings["column"] not in table.primary_key.columns:
+            raise ValueError(
+                f"Partitioned table {table.name!r} must include {settings['column']!r} in its primary key"
+            )
+        tables[table.name] = settings
+    return tables
+
+
+@dataclass
+class PartitionPlan:
+    """Partitions to create and drop for one table."""
+
+    table: str
+    create: List[date]
+    drop: List[str]
+
+
+def plan_partitions(table: str, existing: Iterable[str], today: date, premake: int = DEFAULT_PREMAKE,
+                    retention_months: Optional[int] = None) -> PartitionPlan:
+    """Work out which months to create and which partitions to drop."""
+    current = month_start(today)
+    have = {}
+    for name in existing:
+        parsed = parse_partition_name(name)
+        if parsed and parsed[0] == table:
+            have[parsed[1]] = name
+
+    wanted = [add_months(current, n) for n in range(premake + 1)]
+    create = [month for month in wanted if month not in have]
+
+    drop = []
+    if retention_months is not None:
+        oldest_kept = add_months(current, -retention_months)
+        drop = [name for month, name in sorted(have.items()) if month < oldest_kept]
+
+    return PartitionPlan(table, create, drop)
+
+
+# -- Alembic operations -----------------------------------------------------
+
+
+@Operations.register_operation("create_time_partitions")
+class CreateTimePartitionsOp(MigrateOperation):
+    """Create monthly partitions of ``table`` starting at ``start``."""
+
+    def __init__(self, table: str, start: date, months: int = 1):
+        self.table = table
+        self.start = month_start(start)
+        self.months = months
+
+    @classmethod
+    def create_time_partitions(cls, operations: Operations, table: str, start: date, months: int = 1):
+        return operations.invoke(cls(table, start, months))
+
+
+@Operations.register_operation("detach_partition")
+class DetachPartitionOp(MigrateOperation):
+    """Detach (and optionally drop) a partition."""
+
+    def __init__(self, table: str, partition: str, concurrently: bool = False, drop: bool = False):
+        self.table = table
+        self.partition = partition
+        self.concurrently = concurrently
+        self.drop = drop
+
+    @classmethod
+    def detach_partition(cls, operations: Operations, table: str, partition: str,
+                         concurrently: bool = False, drop: bool = False):
+        return operations.invoke(cls(table, partition, concurrently, drop))
+
+
+@Operations.implementation_for(CreateTimePartitionsOp)
+def _create_time_partitions(operations: Operations, operation: CreateTimePartitionsOp) -> None:
+    for n in range(operation.months):
+        operations.execute(create_partition_sql(operation.table, add_months(operation.start, n)))
+
+
+@Operations.implementation_for(DetachPartitionOp)
+def _detach_partition(operations: Operations, operation: DetachPartitionOp) -> None:
+    sql = detach_partition_sql(operation.table, operation.partition, operation.concurrently)
+    if operation.concurrently:
+        # DETACH ... CONCURRENTLY cannot run inside a transaction block
+        with operations.get_context().autocommit_block():
+            operations.execute(sql)
+    else:
+        operations.execute(sql)
+    if operation.drop:
+        operations.execute(f"DROP TABLE IF EXISTS {operation.partition}")
+
+
+# -- Maintenance --------------------------------------------------------------
+
+
+_EXISTING_SQL = sa.text(
+    "SELECT child.relname FROM pg_inherits "
+    "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+    "WHERE parent.relname = :table"
+)
+
+
+async def roll_table(conn, table: str, settings: Dict, today: date, dry_run: bool = False) -> List[str]:
+    """Apply one table's partition plan on ``conn``; returns the statements."""
+    existing = (await conn.execute(_EXISTING_SQL, {"table": table})).scalars().all()
+    plan = plan_partitions(table, existing, today, settings["premake"], settings["retention_months"])
+
+    statements = [create_partition_sql(table, month) for month in plan.create]
+    for partition in plan.drop:
+        # Detaching first turns the drop into a metadata-only change on the parent
+        statements.append(detach_partition_sql(table, partition))
+        statements.append(f"DROP TABLE {partition}")
+
+    if not dry_run:
+        for sql in statements:
+            await conn.execute(sa.text(sql))
+    return statements
+
+
+async def roll_partitions(metadata: sa.MetaData, url: Optional[str] = None, today: Optional[date] = None,
+                          dry_run: bool = False) -> List[str]:
+    """Create upcoming partitions and drop expired ones for every partitioned table.
+
+    Each table is handled in its own transaction. Returns the statements
+    run (or that would run, with ``dry_run``).
+    """
+    from connection import get_engine
+
+    today = today or datetime.now(timezone.utc).date()
+    statements: List[str] = []
+    engine = get_engine(url)
+
+    for table, settings in partitioned_tables(metadata).items():
+        async with engine.begin() as conn:
+            statements.extend(await roll_table(conn, table, settings, today, dry_run))
+
+    return statements
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Maintain monthly partitions of time-partitioned tables")
+    parser.add_argument("action", choices=["roll"], help="roll: create upcoming and drop expired partitions")
+    parser.add_argument("--dry-run", action="store_true", help="Print statements without running them")
+    args = parser.parse_args()
+
+    from connection import dispose_all
+    from models.project import Base
+
+    async def run() -> List[str]:
+        try:
+            return await roll_partitions(Base.metadata, dry_run=args.dry_run)
+        finally:
+            await dispose_all()
+
+    statements = asyncio.run(run())
+    for sql in statements:
+        print(f"{sql};")
+    if not statements:
+        print("Partitions are up to date.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
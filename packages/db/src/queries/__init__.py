@@ -0,0 +1,15 @@
+"""Query helpers for database models."""
+
+from .loader import BatchLoader, ProjectLoader
+from .projects import InvalidCursor, Page, decode_cursor, encode_cursor, list_projects, search_projects
+
+__all__ = [
+    "BatchLoader",
+    "InvalidCursor",
+    "Page",
+    "ProjectLoader",
+    "decode_cursor",
+    "encode_cursor",
+    "list_projects",
+    "search_projects",
+]
@@ -0,0 +1,121 @@
+"""Request-scoped batching loaders.
+
+A loader collects every key requested during one event-loop tick and
+resolves them with a single query, caching results for its lifetime.
+Create one per request (or unit of work) so the cache never outlives the
+session it reads from.
+
+Usage:
+    loader = ProjectLoader(session)
+    projects = await asyncio.gather(*(loader.load(pid) for pid in ids))
+"""
+
+import asyncio
+import uuid
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Project
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MAX_BATCH_SIZE = 500
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesce per-key loads into batched calls to ``batch_load()``."""
+
+    def __init__(self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE):
+        self.max_batch_size = max_batch_size
+        self._cache: Dict[K, asyncio.Future] = {}
+        self._queue: List[Tuple[K, asyncio.Future]] = []
+        self._dispatch_scheduled = False
+        # The loop only keeps weak references to tasks; hold running batches
+        self._tasks: Set[asyncio.Task] = set()
+        # Batches run one at a time; a session cannot run concurrent queries
+        self._lock = asyncio.Lock()
+
+    async def batch_load(self, keys: List[K]) -> Dict[K, V]:
+        """Fetch values for keys; keys missing from the result resolve to None."""
+        raise NotImplementedError
+
+    def load(self, key: K) -> "asyncio.Future[Optional[V]]":
+        """Return a future for one key, batched with others from this tick."""
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = self._cache[key] = loop.create_future()
+        self._queue.append((key, future))
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """Load several keys, in order, with one batch."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed the cache (e.g. with rows fetched by another query)."""
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: Optional[K] = None) -> None:
+        """Forget one cached key, or all of them."""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch_size):
+            task = asyncio.ensure_future(self._run_batch(queue[start:start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[K, asyncio.Future]]) -> None:
+        # Futures travel with their keys: clear() may have dropped them from
+        # the cache since load(), and a key loaded again is queued twice
+        keys = list(dict.fromkeys(key for key, _ in batch))
+        try:
+            async with self._lock:
+                values = await self.batch_load(keys)
+        except Exception as e:
+            for key, future in batch:
+                # Failed keys are retried by the next load()
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch:
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+class ProjectLoader(BatchLoader[uuid.UUID, Project]):
+    """Batch ``Project`` lookups by id into ``WHERE id = ANY(:ids)``."""
+
+    def __init__(self, session: AsyncSession, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE):
+        super().__init__(max_batch_size)
+        self.session = session
+
+    def load(self, key: Any) -> "asyncio.Future[Optional[Project]]":
+        """Return a future for the project with this id (UUID or string)."""
+        return super().load(key if isinstance(key, uuid.UUID) else uuid.UUID(str(key)))
+
+    async def batch_load(self, keys: List[uuid.UUID]) -> Dict[uuid.UUID, Project]:
+        ids = sa.bindparam("ids", list(keys), type_=ARRAY(UUID(as_uuid=True)))
+        result = await self.session.execute(sa.select(Project).where(Project.id == sa.any_(ids)))
+        return {project.id: project for project in result.scalars()}
@@ -0,0 +1,158 @@
+"""Project listing and search.
+
+Listing uses keyset pagination over ``(created_at, id)`` so every page is
+an index range scan on ``ix_projects_created_at_id`` no matter how deep
+the client pages. Cursors are opaque strings that encode the last row's
+sort key; they stay valid while rows are inserted or deleted.
+
+Name search uses ``pg_trgm`` and the ``ix_projects_name_trgm`` GIN index,
+for both substring matches and similarity-ranked fuzzy matches.
+"""
+
+import base64
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Project
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+CURSOR_VERSION = 1
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor was not produced by encode_cursor()."""
+
+
+@dataclass
+class Page:
+    """One page of results and the cursor for the next one."""
+
+    items: List[Project]
+    next_cursor: Optional[str]
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(created_at: datetime, project_id: uuid.UUID) -> str:
+    """Encode a sort key as an opaque, URL-safe cursor."""
+    payload = json.dumps([CURSOR_VERSION, created_at.isoformat(), str(project_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor back into ``(created_at, id)``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        version, created_at, project_id = json.loads(base64.urlsafe_b64decode(padded))
+        if version != CURSOR_VERSION:
+            raise ValueError(f"unsupported cursor version {version}")
+        return datetime.fromisoformat(created_at), uuid.UUID(project_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _clamp(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def list_projects_query(
+    *,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[str] = None,
+    newest_first: bool = True,
+    name_contains: Optional[str] = None,
+) -> sa.Select:
+    """Build the keyset query behind list_projects() (one extra row to detect more)."""
+    key = sa.tuple_(Project.created_at, Project.id)
+    stmt = sa.select(Project)
+
+    if after:
+        created_at, project_id = decode_cursor(after)
+        bound = sa.tuple_(sa.literal(created_at, Project.created_at.type), sa.literal(project_id, Project.id.type))
+        stmt = stmt.where(key < bound if newest_first else key > bound)
+
+    if name_contains:
+        # Substring matches are served by the trigram GIN index
+        stmt = stmt.where(Project.name.ilike(f"%{_escape_like(name_contains)}%", escape="\\"))
+
+    if newest_first:
+        stmt = stmt.order_by(Project.created_at.desc(), Project.id.desc())
+    else:
+        stmt = stmt.order_by(Project.created_at.asc(), Project.id.asc())
+
+    return stmt.limit(_clamp(limit) + 1)
+
+
+async def list_projects(
+    session: AsyncSession,
+    *,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[str] = None,
+    newest_first: bool = True,
+    name_contains: Optional[str] = None,
+) -> Page:
+    """List projects one page at a time.
+
+    Usage:
+        page = await list_projects(session, limit=50)
+        while page.has_more:
+            page = await list_projects(session, limit=50, after=page.next_cursor)
+
+    A cursor must be reused with the same ``newest_first`` and filter.
+    """
+    limit = _clamp(limit)
+    stmt = list_projects_query(
+        limit=limit, after=after, newest_first=newest_first, name_contains=name_contains
+    )
+    rows = list((await session.execute(stmt)).scalars())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    return Page(items=rows, next_cursor=next_cursor)
+
+
+async def search_projects(
+    session: AsyncSession,
+    text: str,
+    *,
+    limit: int = 20,
+    min_similarity: float = 0.3,
+) -> List[Tuple[Project, float]]:
+    """Fuzzy-search project names, best matches first.
+
+    Returns ``(project, similarity)`` pairs with similarity in ``[0, 1]``.
+    The ``%`` operator uses the GIN index; ``min_similarity`` is applied as
+    ``pg_trgm.similarity_threshold`` for this transaction only.
+    """
+    text = text.strip()
+    if not text:
+        return []
+
+    await session.execute(
+        sa.select(sa.func.set_config("pg_trgm.similarity_threshold", str(min_similarity), True))
+    )
+    similarity = sa.func.similarity(Project.name, text).label("similarity")
+    stmt = (
+        sa.select(Project, similarity)
+        .where(Project.name.op("%")(text))
+        .order_by(similarity.desc(), Project.id)
+        .limit(_clamp(limit))
+    )
+    return [(project, score) for project, score in (await session.execute(stmt)).all()]
@@ -0,0 +1,128 @@
+"""Pytest fixtures for fast, isolated database tests.
+
+Each test runs inside an outer transaction that is rolled back at
+teardown; sessions opened by the code under test (``get_session()``)
+join that transaction through savepoints, so ``commit()`` works as usual
+but nothing outlives the test and no tables need truncating.
+
+For parallel runs (pytest-xdist) every worker gets its own database,
+cloned from the migrated database with ``CREATE DATABASE ... TEMPLATE``.
+Set DB_TEST_CLONE=true to clone without xdist.
+
+Enable with ``pytest_plugins = ["testing"]`` in a top-level conftest.py.
+"""
+
+import os
+from typing import AsyncIterator, Iterator
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+import connection
+
+
+def _clone_requested() -> bool:
+    return bool(os.getenv("PYTEST_XDIST_WORKER")) or \
+        os.getenv("DB_TEST_CLONE", "false").lower() in ("1", "true", "yes", "on")
+
+
+def _admin_engine(url: sa.URL) -> sa.Engine:
+    # CREATE/DROP DATABASE cannot run in a transaction or while connected to the target
+    admin_url = url.set(drivername="postgresql+psycopg2", database="postgres")
+    return sa.create_engine(admin_url, isolation_level="AUTOCOMMIT", poolclass=NullPool)
+
+
+def clone_database(url: str, name: str) -> str:
+    """Create ``name`` as a copy of the database in ``url``; return its URL.
+
+    The template must have no other open connections while it is copied.
+    """
+    source = make_url(url)
+    engine = _admin_engine(source)
+    try:
+        with engine.connect() as conn:
+            conn.execute(sa.text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+            conn.execute(sa.text(f'CREATE DATABASE "{name}" TEMPLATE "{source.database}"'))
+    finally:
+        engine.dispose()
+    return source.set(database=name).render_as_string(hide_password=False)
+
+
+def drop_database(url: str) -> None:
+    """Drop the database in ``url``, disconnecting any remaining sessions."""
+    target = make_url(url)
+    engine = _admin_engine(target)
+    try:
+        with engine.connect() as conn:
+            conn.execute(sa.text(f'DROP DATABASE IF EXISTS "{target.database}" WITH (FORCE)'))
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def database_url() -> Iterator[str]:
+    """URL of the database tests run against (a per-worker clone if requested)."""
+    url = connection.get_database_url()
+    if not _clone_requested():
+        yield url
+        return
+
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    clone = clone_database(url, f"{make_url(url).database}_test_{worker}")
+    previous = os.environ.get("DATABASE_URL")
+    os.environ["DATABASE_URL"] = clone
+    try:
+        yield clone
+    finally:
+        if previous is None:
+            os.environ.pop("DATABASE_URL", None)
+        else:
+            os.environ["DATABASE_URL"] = previous
+        drop_database(clone)
+
+
+@pytest.fixture(scope="session")
+def db_engine(database_url) -> AsyncEngine:
+    """Engine for test connections (NullPool: connections never cross event loops)."""
+    return create_async_engine(database_url, poolclass=NullPool)
+
+
+@pytest.fixture
+async def db_connection(db_engine) -> AsyncIterator[AsyncConnection]:
+    """Connection holding the test's outer transaction, rolled back at teardown."""
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            yield conn
+        finally:
+            if transaction.is_active:
+                await transaction.rollback()
+
+
+@pytest.fixture
+def db_sessionmaker(db_connection) -> async_sessionmaker[AsyncSession]:
+    """Session factory whose commits release savepoints in the test transaction."""
+    return async_sessionmaker(
+        bind=db_connection,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest.fixture
+async def db_session(db_sessionmaker) -> AsyncIterator[AsyncSession]:
+    """A session inside the test transaction."""
+    async with db_sessionmaker() as session:
+        yield session
+
+
+@pytest.fixture
+def db_transaction(db_sessionmaker, monkeypatch) -> async_sessionmaker[AsyncSession]:
+    """Route ``connection.get_session()`` into the test transaction."""
+    monkeypatch.setattr(connection, "get_sessionmaker", lambda url=None: db_sessionmaker)
+    return db_sessionmaker
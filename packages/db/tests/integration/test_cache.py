@@ -0,0 +1,206 @@
+"""Tests for the Project read cache."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from cache import (
+    LRUBackend,
+    ProjectCache,
+    RedisBackend,
+    disable_project_cache,
+    enable_project_cache,
+    get_project_cache,
+)
+from connection import get_session
+from models import Project
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the redis-py calls RedisBackend makes."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in self.data if key.startswith(match.rstrip("*"))]
+
+
+@pytest.fixture
+def project_cache():
+    """Enable caching for one test."""
+    cache = enable_project_cache(max_size=100, ttl=60)
+    yield cache
+    disable_project_cache()
+
+
+@pytest.fixture
+def sqlite_session():
+    """ORM session on SQLite, enough to drive flush/commit events."""
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(sa.text(
+            "CREATE TABLE projects (id CHAR(32) PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+            "description TEXT, created_at DATETIME NOT NULL, updated_at DATETIME)"
+        ))
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+class TestLRUBackend:
+    """Test capacity, TTL and metrics."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that reads refresh recency and overflow evicts the oldest."""
+        backend = LRUBackend(max_size=2)
+        backend.set("a", 1, ttl=60)
+        backend.set("b", 2, ttl=60)
+        backend.get("a")
+        backend.set("c", 3, ttl=60)
+
+        assert backend.get("b") is None
+        assert (backend.get("a"), backend.get("c")) == (1, 3)
+        assert backend.stats()["evictions"] == 1
+
+    def test_entries_expire(self):
+        """Test that entries past their TTL are misses."""
+        now = [0.0]
+        backend = LRUBackend(clock=lambda: now[0])
+        backend.set("a", 1, ttl=10)
+        now[0] = 10
+        assert backend.get("a") is None
+        assert backend.stats()["expirations"] == 1
+
+    def test_redis_backend_round_trip(self):
+        """Test JSON storage and prefixed clear in a Redis-like client."""
+        client = FakeRedis()
+        client.set("other", "keep")
+        backend = RedisBackend(client)
+        backend.set("project:id:1", {"name": "x"}, ttl=60)
+        assert backend.get("project:id:1") == {"name": "x"}
+
+        backend.clear()
+        assert client.data == {"other": "keep"}
+
+
+class TestInvalidation:
+    """Test that ORM commits invalidate cached projects."""
+
+    def seed(self, cache: ProjectCache, project: Project) -> None:
+        cache._store(project)
+        assert cache.backend.get(f"project:id:{project.id}") is not None
+
+    @pytest.mark.parametrize("change", ["update", "delete"])
+    def test_commit_invalidates(self, project_cache, sqlite_session, change):
+        """Test that committed updates and deletes drop the cached entry."""
+        project = Project(id=uuid.uuid4(), name="Apollo", created_at=datetime.now(timezone.utc))
+        sqlite_session.add(project)
+        sqlite_session.commit()
+        self.seed(project_cache, project)
+
+        if change == "update":
+            project.name = "Artemis"
+        else:
+            sqlite_session.delete(project)
+        sqlite_session.flush()
+        assert project_cache.backend.get(f"project:id:{project.id}") is not None
+        sqlite_session.commit()
+
+        assert project_cache.backend.get(f"project:id:{project.id}") is None
+        assert project_cache.stats()["invalidations"] >= 1
+
+    def test_rollback_keeps_cache(self, project_cache, sqlite_session):
+        """Test that rolled back changes do not invalidate."""
+        project = Project(id=uuid.uuid4(), name="Apollo", created_at=datetime.now(timezone.utc))
+        sqlite_session.add(project)
+        sqlite_session.commit()
+        self.seed(project_cache, project)
+
+        project.name = "Gemini"
+        sqlite_session.flush()
+        sqlite_session.rollback()
+        sqlite_session.commit()
+
+        assert project_cache.backend.get(f"project:id:{project.id}") is not None
+
+    def test_savepoint_rollback_keeps_pending(self, project_cache, sqlite_session):
+        """Test that rolling back a savepoint still invalidates earlier flushes."""
+        project = Project(id=uuid.uuid4(), name="Apollo", created_at=datetime.now(timezone.utc))
+        sqlite_session.add(project)
+        sqlite_session.commit()
+        self.seed(project_cache, project)
+
+        project.name = "Artemis"
+        sqlite_session.flush()
+        with sqlite_session.begin_nested() as savepoint:
+            sqlite_session.add(Project(id=uuid.uuid4(), name="Gemini", created_at=datetime.now(timezone.utc)))
+            sqlite_session.flush()
+            savepoint.rollback()
+        sqlite_session.commit()
+
+        assert project_cache.backend.get(f"project:id:{project.id}") is None
+
+    def test_disabled_by_default(self):
+        """Test that caching is opt-in."""
+        assert get_project_cache() is None
+
+
+class TestLookups:
+    """Test cached lookups against the database."""
+
+    async def test_hit_attaches_without_query(self, project_cache):
+        """Test that hits attach a persistent project without touching the database."""
+        project = Project(id=uuid.uuid4(), name="Apollo", created_at=datetime.now(timezone.utc))
+        project_cache._store(project)
+        project_cache.backend.set("project:name:Apollo", str(project.id), 60)
+
+        # No bind: any query would raise UnboundExecutionError
+        async with AsyncSession() as session:
+            by_id = await project_cache.get(session, project.id)
+            by_name = await project_cache.get_by_name(session, "Apollo")
+
+            assert by_id is by_name
+            assert object_session(by_id) is session.sync_session
+            assert by_id not in session.dirty
+            assert (by_id.id, by_id.name, by_id.created_at) == (project.id, "Apollo", project.created_at)
+
+        assert (project_cache.hits, project_cache.misses) == (2, 0)
+
+    async def test_hits_after_first_lookup(self, db_transaction, project_cache):
+        """Test id and name lookups hit the cache and follow renames."""
+        async with get_session() as session:
+            project = Project(name="Apollo")
+            session.add(project)
+        project_id = project.id
+
+        async with get_session() as session:
+            assert (await project_cache.get(session, project_id)).name == "Apollo"
+            assert (await project_cache.get(session, str(project_id))).name == "Apollo"
+            assert (await project_cache.get_by_name(session, "Apollo")).id == project_id
+            assert (await project_cache.get_by_name(session, "Apollo")).id == project_id
+
+        async with get_session() as session:
+            (await session.get(Project, project_id)).name = "Artemis"
+
+        async with get_session() as session:
+            assert await project_cache.get_by_name(session, "Apollo") is None
+            assert (await project_cache.get(session, project_id)).name == "Artemis"
+
+        stats = project_cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 4)
+        assert stats["hit_rate"] == pytest.approx(2 / 6)
@@ -0,0 +1,56 @@
+"""Tests for the transactional test fixtures."""
+
+import sqlalchemy as sa
+
+from connection import get_session
+from testing import _clone_requested
+
+PROBE = "fixture-probe"
+
+
+async def count_probes() -> int:
+    async with get_session() as session:
+        result = await session.execute(sa.text("SELECT count(*) FROM projects WHERE name = :n"), {"n": PROBE})
+        return result.scalar()
+
+
+class TestTransactionalFixtures:
+    """Test that each test's writes are rolled back."""
+
+    async def test_commits_are_visible_within_the_test(self, db_transaction):
+        """Test that get_session() commits land in the test transaction."""
+        async with get_session() as session:
+            await session.execute(sa.text("INSERT INTO projects (name) VALUES (:n)"), {"n": PROBE})
+        assert await count_probes() == 1
+
+    async def test_previous_test_was_rolled_back(self, db_transaction):
+        """Test that rows committed by the previous test are gone."""
+        assert await count_probes() == 0
+
+    async def test_failed_session_only_rolls_back_its_savepoint(self, db_transaction):
+        """Test that an error in one session keeps earlier work in the test."""
+        async with get_session() as session:
+            await session.execute(sa.text("INSERT INTO projects (name) VALUES (:n)"), {"n": PROBE})
+        try:
+            async with get_session() as session:
+                await session.execute(sa.text("INSERT INTO projects (name) VALUES (NULL)"))
+        except sa.exc.IntegrityError:
+            pass
+        assert await count_probes() == 1
+
+
+class TestCloneSelection:
+    """Test when per-worker databases are cloned."""
+
+    def test_clone_under_xdist_or_opt_in(self, monkeypatch):
+        """Test that cloning follows xdist workers or DB_TEST_CLONE."""
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        monkeypatch.delenv("DB_TEST_CLONE", raising=False)
+        assert not _clone_requested()
+
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+        assert _clone_requested()
+
+        monkeypatch.delenv("PYTEST_XDIST_WORKER")
+        monkeypatch.setenv("DB_TEST_CLONE", "true")
+        assert _clone_requested()
@@ -0,0 +1,140 @@
+"""Tests for query instrumentation."""
+
+import logging
+
+import pytest
+import sqlalchemy as sa
+
+from instrumentation import (
+    get_cache_stats,
+    get_query_stats,
+    instrument_engine,
+    normalize_statement,
+    redact_parameters,
+    reset_cache_stats,
+    reset_query_stats,
+    track_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with instrumentation attached."""
+    engine = sa.create_engine("sqlite://")
+    instrument_engine(engine)
+    instrument_engine(engine)  # idempotent
+    with engine.begin() as conn:
+        conn.execute(sa.text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    reset_query_stats()
+    yield engine
+    engine.dispose()
+
+
+class TestNormalization:
+    """Test statement normalization and redaction."""
+
+    @pytest.mark.parametrize("statement, expected", [
+        ("SELECT * FROM projects WHERE id = $1", "SELECT * FROM projects WHERE id = ?"),
+        ("SELECT *\n  FROM projects WHERE id IN ($1, $2, $3)", "SELECT * FROM projects WHERE id IN (...)"),
+        ("SELECT * FROM projects WHERE name = 'x''y' LIMIT 10", "SELECT * FROM projects WHERE name = ? LIMIT ?"),
+        ("INSERT INTO t (a, b) VALUES (%(a_m0)s, %(b_m0)s), (%(a_m1)s, %(b_m1)s)", "INSERT INTO t (...) VALUES (...), ..."),
+    ])
+    def test_normalize_statement(self, statement, expected):
+        """Test that variants of one query share a key."""
+        assert normalize_statement(statement) == expected.replace("t (...)", "t (a, b)")
+
+    def test_redact_parameters(self):
+        """Test that bind values never reach the log."""
+        assert redact_parameters({"name": "secret", "id": 7, "note": None}) == {
+            "name": "<str len=6>", "id": "<int>", "note": None,
+        }
+        assert redact_parameters(("secret",)) == ["<str len=6>"]
+
+
+class TestQueryStats:
+    """Test timing aggregation through engine events."""
+
+    def test_aggregates_per_statement(self, engine):
+        """Test counts and percentiles per normalized statement."""
+        with engine.connect() as conn:
+            for i in range(20):
+                conn.execute(sa.text("SELECT name FROM items WHERE id = :id"), {"id": i})
+            conn.execute(sa.text("SELECT count(*) FROM items"))
+
+        stats = {row["statement"]: row for row in get_query_stats()}
+        select = stats["SELECT name FROM items WHERE id = ?"]
+        assert select["count"] == 20
+        assert 0 <= select["p50_ms"] <= select["p95_ms"] <= select["p99_ms"] <= select["max_ms"]
+        assert stats["SELECT count(*) FROM items"]["count"] == 1
+
+    def test_slow_query_logged_with_redacted_params(self, engine, monkeypatch, caplog):
+        """Test that statements over the threshold are logged without values."""
+        monkeypatch.setenv("DB_SLOW_QUERY_MS", "0")
+        with caplog.at_level(logging.WARNING, logger="instrumentation"):
+            with engine.connect() as conn:
+                conn.execute(sa.text("SELECT * FROM items WHERE name = :name"), {"name": "hunter2"})
+
+        assert "Slow query" in caplog.text
+        assert "<str len=7>" in caplog.text
+        assert "hunter2" not in caplog.text
+
+    def test_failed_statement_does_not_leak_timer(self, engine):
+        """Test that errors leave the timing stack balanced."""
+        with engine.connect() as conn:
+            with pytest.raises(sa.exc.OperationalError):
+                conn.execute(sa.text("SELECT * FROM missing"))
+            conn.execute(sa.text("SELECT 1"))
+            assert conn.info["query_start"] == []
+
+
+class TestNPlusOne:
+    """Test per-scope query counting."""
+
+    def test_repeated_statement_flagged(self, engine, monkeypatch, caplog):
+        """Test that one statement repeated per row is reported."""
+        monkeypatch.setenv("DB_N_PLUS_ONE_THRESHOLD", "5")
+        with caplog.at_level(logging.WARNING, logger="instrumentation"):
+            with track_queries("request") as scope, engine.connect() as conn:
+                for i in range(6):
+                    conn.execute(sa.text("SELECT name FROM items WHERE id = :id"), {"id": i})
+                conn.execute(sa.text("SELECT count(*) FROM items"))
+
+        assert scope.total == 7
+        assert list(scope.repeated()) == ["SELECT name FROM items WHERE id = ?"]
+        assert "Possible N+1 in request: statement executed 6 times" in caplog.text
+
+    def test_queries_outside_scope_not_counted(self, engine):
+        """Test that scopes only see their own statements."""
+        with track_queries() as scope:
+            pass
+        with engine.connect() as conn:
+            conn.execute(sa.text("SELECT 1"))
+        assert scope.total == 0
+
+
+class TestCacheStats:
+    """Test statement cache hit/miss counters."""
+
+    def test_compiled_cache_hits_after_first_execution(self, engine):
+        """Test that only the first execution of a statement misses the compiled cache."""
+        items = sa.table("items", sa.column("id"), sa.column("name"))
+        reset_cache_stats()
+        with engine.connect() as conn:
+            for i in range(5):
+                conn.execute(sa.select(items.c.name).where(items.c.id == i))
+
+        stats = get_cache_stats()
+        assert (stats["compiled_misses"], stats["compiled_hits"]) == (1, 4)
+        assert stats["compiled_hit_rate"] == 0.8
+        # SQLite has no prepared statement cache to count
+        assert stats["prepared_hits"] == stats["prepared_misses"] == 0
+
+    def test_disabled_compiled_cache_is_not_counted(self):
+        """Test that engines without a compiled cache record neither hits nor misses."""
+        engine = sa.create_engine("sqlite://", query_cache_size=0)
+        instrument_engine(engine)
+        reset_cache_stats()
+        with engine.connect() as conn:
+            conn.execute(sa.select(sa.literal(1)))
+        assert get_cache_stats()["compiled_misses"] == 0
+        engine.dispose()
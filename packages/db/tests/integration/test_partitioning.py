@@ -0,0 +1,154 @@
+"""Tests for monthly range partitioning."""
+
+import io
+from datetime import date
+
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import CreateTable
+
+from partitioning import (
+    add_months,
+    parse_partition_name,
+    partition_name,
+    partitioned_tables,
+    plan_partitions,
+    roll_table,
+    time_partitioned,
+)
+
+
+def _events_table(metadata: sa.MetaData, created_at_in_pk: bool = True) -> sa.Table:
+    return sa.Table(
+        "events",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), primary_key=created_at_in_pk),
+        sa.Column("payload", sa.Text),
+        **time_partitioned(premake=2, retention_months=3),
+    )
+
+
+class TestPartitionHelpers:
+    """Test naming, month arithmetic and planning."""
+
+    def test_add_months_crosses_years(self):
+        """Test month arithmetic in both directions across year boundaries."""
+        assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+        assert add_months(date(2026, 1, 1), -13) == date(2024, 12, 1)
+
+    def test_partition_name_round_trip(self):
+        """Test that partition names parse back to their table and month."""
+        name = partition_name("audit_log", date(2026, 3, 1))
+        assert name == "audit_log_p2026_03"
+        assert parse_partition_name(name) == ("audit_log", date(2026, 3, 1))
+        assert parse_partition_name("audit_log_default") is None
+
+    def test_plan_creates_missing_months(self):
+        """Test that the current month and premade months are created if missing."""
+        plan = plan_partitions("events", ["events_p2026_10"], date(2026, 10, 19), premake=2)
+        assert plan.create == [date(2026, 11, 1), date(2026, 12, 1)]
+        assert plan.drop == []
+
+    def test_plan_drops_expired_months_only(self):
+        """Test that partitions older than the retention window are dropped."""
+        existing = ["events_p2026_06", "events_p2026_07", "events_p2026_08", "other_p2020_01"]
+        plan = plan_partitions("events", existing, date(2026, 10, 19), premake=0, retention_months=3)
+        assert plan.drop == ["events_p2026_06"]
+        assert plan.create == [date(2026, 10, 1)]
+
+    def test_table_ddl_is_partitioned(self):
+        """Test that time_partitioned() yields PARTITION BY RANGE DDL."""
+        table = _events_table(sa.MetaData())
+        ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+        assert "PARTITION BY RANGE (created_at)" in ddl
+
+    def test_declarative_model(self):
+        """Test that partitioned models are discovered from metadata."""
+        class Base(DeclarativeBase):
+            pass
+
+        class Event(Base):
+            __tablename__ = "events"
+            __table_args__ = (time_partitioned(retention_months=12),)
+            id = sa.Column(sa.Integer, primary_key=True)
+            created_at = sa.Column(sa.DateTime(timezone=True), primary_key=True)
+
+        settings = partitioned_tables(Base.metadata)
+        assert settings == {"events": {"column": "created_at", "premake": 3, "retention_months": 12}}
+
+    def test_partition_column_must_be_in_primary_key(self):
+        """Test that a primary key without the partition column is rejected."""
+        metadata = sa.MetaData()
+        _events_table(metadata, created_at_in_pk=False)
+        with pytest.raises(ValueError, match="primary key"):
+            partitioned_tables(metadata)
+
+
+class TestPartitionOperations:
+    """Test the SQL the alembic operations emit."""
+
+    @pytest.fixture
+    def offline_sql(self):
+        """Run operations in alembic's --sql mode and return the emitted SQL."""
+        buffer = io.StringIO()
+        context = MigrationContext.configure(
+            dialect_name="postgresql",
+            opts={"as_sql": True, "output_buffer": buffer, "transactional_ddl": True},
+        )
+        with context.begin_transaction():
+            yield Operations(context), buffer
+
+    def test_create_time_partitions(self, offline_sql):
+        """Test that consecutive monthly partitions are created with half-open bounds."""
+        op, buffer = offline_sql
+        op.create_time_partitions("events", start=date(2026, 12, 15), months=2)
+
+        sql = buffer.getvalue()
+        assert (
+            "CREATE TABLE IF NOT EXISTS events_p2026_12 PARTITION OF events "
+            "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')"
+        ) in sql
+        assert "events_p2027_01 PARTITION OF events FOR VALUES FROM ('2027-01-01') TO ('2027-02-01')" in sql
+
+    def test_detach_concurrently_leaves_transaction(self, offline_sql):
+        """Test that DETACH ... CONCURRENTLY runs outside the transaction before the drop."""
+        op, buffer = offline_sql
+        op.detach_partition("events", "events_p2025_01", concurrently=True, drop=True)
+
+        sql = buffer.getvalue()
+        detach = sql.index("ALTER TABLE events DETACH PARTITION events_p2025_01 CONCURRENTLY")
+        assert sql.index("COMMIT;") < detach < sql.index("DROP TABLE IF EXISTS events_p2025_01")
+
+
+class TestRollForward:
+    """Test partition maintenance against the database."""
+
+    async def test_roll_creates_and_drops(self, db_connection):
+        """Test that rolling creates upcoming months, drops expired ones and routes inserts."""
+        metadata = sa.MetaData()
+        table = _events_table(metadata)
+        await db_connection.run_sync(metadata.create_all)
+        await db_connection.execute(sa.text(
+            "CREATE TABLE events_p2026_01 PARTITION OF events FOR VALUES FROM ('2026-01-01') TO ('2026-02-01')"
+        ))
+
+        settings = partitioned_tables(metadata)["events"]
+        statements = await roll_table(db_connection, "events", settings, date(2026, 10, 19))
+        assert sum("DROP TABLE events_p2026_01" in sql for sql in statements) == 1
+
+        await db_connection.execute(sa.insert(table).values(id=1, created_at=sa.text("'2026-12-31 12:00+00'")))
+        partitions = (await db_connection.execute(sa.text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE inhparent = 'events'::regclass ORDER BY 1"
+        ))).scalars().all()
+        assert partitions == ["events_p2026_10", "events_p2026_11", "events_p2026_12"]
+
+        # Nothing left to do on a second run
+        assert await roll_table(db_connection, "events", settings, date(2026, 10, 19)) == []